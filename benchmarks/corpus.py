@@ -0,0 +1,53 @@
+import random
+from typing import Dict, Iterator, List
+
+# Title pieces mixing exact keywords, near misses, excluded seniority levels
+# and unrelated roles, roughly in the proportions seen on real career pages
+SENIORITY = ['', '', '', 'Junior', 'Associate', 'Senior', 'Lead', 'Principal', 'Staff', 'Vice President,']
+ROLES = [
+    'Data Scientist', 'Data Analyst', 'Machine Learning Engineer', 'Quantitative Researcher',
+    'Quant Developer', 'Research Scientist', 'Data Engineer', 'Software Engineer',
+    'Quantitative Analyst', 'AI Engineer', 'Analytics Engineer', 'Business Analyst',
+    'Risk Analyst', 'Portfolio Manager', 'Financial Analyst', 'Operations Associate',
+    'Product Manager', 'Client Service Associate', 'Compliance Officer', 'Recruiter',
+    'Statistician', 'Data Science Engineer', 'ML Ops Engineer', 'Decision Scientist'
+]
+QUALIFIERS = ['', '', '', 'II', 'III', '- Equities', '- Fixed Income', '- Risk', '- NLP',
+              '(Remote)', '- Asset Management', '- Credit', '- Platform', '- Trading']
+LOCATIONS = [
+    'New York, NY', 'San Francisco, CA', 'Chicago, IL', 'Boston, MA', 'Remote, US',
+    'Remote', 'Princeton, NJ', 'Austin, TX', 'London, United Kingdom', 'Hong Kong',
+    'Bangalore, India', 'Toronto, Canada', 'Wilmington, DE', 'United States'
+]
+COMPANIES = ['BlackRock', 'Vanguard', 'Goldman Sachs', 'Morgan Stanley', 'JPMorgan',
+             'Citadel', 'Two Sigma', 'Point72', 'Wellington Management']
+
+def synthetic_title(rng: random.Random) -> str:
+    """Build one plausible job title."""
+    parts = [rng.choice(SENIORITY), rng.choice(ROLES), rng.choice(QUALIFIERS)]
+    return ' '.join(part for part in parts if part)
+
+def iter_synthetic_jobs(count: int, seed: int = 0) -> Iterator[Dict]:
+    """
+    Generate a deterministic stream of synthetic job listings.
+
+    Args:
+        count (int): Number of jobs
+        seed (int): Random seed, the same seed always gives the same jobs
+
+    Yields:
+        Dict: Job listing with title, location, company and url
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        company = rng.choice(COMPANIES)
+        yield {
+            'title': synthetic_title(rng),
+            'location': rng.choice(LOCATIONS),
+            'company': company,
+            'url': f"https://careers.example.com/{company.lower().replace(' ', '-')}/jobs/{seed}-{i}"
+        }
+
+def synthetic_jobs(count: int, seed: int = 0) -> List[Dict]:
+    """Generate a list of synthetic job listings."""
+    return list(iter_synthetic_jobs(count, seed))
@@ -0,0 +1,300 @@
+import html
+import json
+import os
+import random
+import re
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from corpus import LOCATIONS, synthetic_title
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# One compound selector: optional tag, then .class, #id and [attr] parts
+_TAG = re.compile(r'^[a-zA-Z][\w-]*')
+_PART = re.compile(r"""\.(?P<cls>[\w-]+)|\#(?P<id>[\w-]+)|\[(?P<attr>[\w-]+)(?:[~|^$*]?=['"]?(?P<value>[^'"\]]*)['"]?)?\]""")
+
+def slugify(name: str) -> str:
+    """Turn a company name into a fixture directory name."""
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+def _open_tag(compound: str, extra_attrs: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
+    """Render the opening tag and tag name of an element matching one compound selector."""
+    tag_match = _TAG.match(compound)
+    tag = tag_match.group(0) if tag_match else 'div'
+    classes, attrs = [], {}
+    for part in _PART.finditer(compound):
+        if part.group('cls'):
+            classes.append(part.group('cls'))
+        elif part.group('id'):
+            attrs['id'] = part.group('id')
+        elif part.group('attr') == 'class':
+            classes.append(part.group('value') or 'x')
+        elif part.group('attr'):
+            attrs[part.group('attr')] = part.group('value') or ''
+    if classes:
+        attrs['class'] = ' '.join(classes)
+    attrs.update(extra_attrs or {})
+    rendered = ''.join(f' {name}="{html.escape(value)}"' for name, value in attrs.items())
+    return f"<{tag}{rendered}>", tag
+
+def element_for(selector: str, text: str, extra_attrs: Optional[Dict[str, str]] = None) -> str:
+    """
+    Render nested HTML matching a (descendant or child) selector.
+
+    Args:
+        selector (str): CSS selector such as 'div.jobTitle a'
+        text (str): Text of the innermost element
+        extra_attrs (Optional[Dict[str, str]]): Attributes of the innermost element
+
+    Returns:
+        str: HTML whose innermost element matches the selector
+    """
+    compounds = [part for part in selector.replace('>', ' ').split() if part]
+    opened, closing = [], []
+    for index, compound in enumerate(compounds):
+        tag_html, tag = _open_tag(compound, extra_attrs if index == len(compounds) - 1 else None)
+        opened.append(tag_html)
+        closing.append(f"</{tag}>")
+    return ''.join(opened) + html.escape(text) + ''.join(reversed(closing))
+
+def render_page(company_config: Dict, postings: List[Tuple[str, str, str]]) -> str:
+    """
+    Build a career page listing the given postings with the company's selectors.
+
+    Args:
+        company_config (Dict): Company configuration from companies.json
+        postings (List[Tuple[str, str, str]]): Title, location and link of
+            each listing
+
+    Returns:
+        str: HTML of the page
+    """
+    same_link = company_config['link_selector'] == company_config['title_selector']
+    listing_open, listing_tag = _open_tag(company_config['job_listing_selector'].split()[-1])
+
+    listings = []
+    for title, location, href in postings:
+        parts = [element_for(company_config['title_selector'], title,
+                             {'href': href} if same_link else None)]
+        parts.append(element_for(company_config['location_selector'], location))
+        if not same_link:
+            parts.append(element_for(company_config['link_selector'], 'Apply', {'href': href}))
+        listings.append(f"{listing_open}{''.join(parts)}</{listing_tag}>")
+
+    container = 'ul' if listing_tag == 'li' else 'div'
+    return (f"<!DOCTYPE html><html><head><title>{html.escape(company_config['name'])} careers</title>"
+            f"<script>window.analytics = {{}};</script></head><body>"
+            f"<header><nav><a href='/'>Home</a></nav></header>"
+            f"<main><{container} class='results'>{''.join(listings)}</{container}></main>"
+            f"<footer>&copy; {html.escape(company_config['name'])}</footer></body></html>")
+
+def synthesize_page(company_config: Dict, page: int, jobs_per_page: int = 25,
+                    seed: int = 0) -> str:
+    """
+    Build a career page that the company's selectors parse.
+
+    Args:
+        company_config (Dict): Company configuration from companies.json
+        page (int): Page number, used to vary the jobs
+        jobs_per_page (int): Job listings on the page, 0 for an empty page
+        seed (int): Random seed
+
+    Returns:
+        str: HTML of the page
+    """
+    rng = random.Random(f"{company_config['name']}:{page}:{seed}")
+    slug = slugify(company_config['name'])
+    postings = []
+    for index in range(jobs_per_page):
+        title = synthetic_title(rng)
+        postings.append((title, rng.choice(LOCATIONS), f"/{slug}/jobs/{page}-{index}?source=benchmark"))
+    return render_page(company_config, postings)
+
+def fixture_path(company_config: Dict, page: int) -> str:
+    """Path of a recorded page for a company."""
+    return os.path.join(FIXTURE_DIR, slugify(company_config['name']), f"page_{page}.html")
+
+def load_page(company_config: Dict, page: int, jobs_per_page: int = 25) -> str:
+    """
+    Get a page for a company, preferring a recorded fixture.
+
+    Companies without recordings get synthesized pages. Pages past the
+    last recorded page, or past max_pages, are empty, which ends pagination.
+
+    Args:
+        company_config (Dict): Company configuration
+        page (int): Page number
+        jobs_per_page (int): Listings on synthesized pages
+
+    Returns:
+        str: HTML of the page
+    """
+    path = fixture_path(company_config, page)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    if os.path.exists(fixture_path(company_config, 1)):
+        return synthesize_page(company_config, page, 0)
+    max_pages = company_config.get('pagination', {}).get('max_pages', 1)
+    return synthesize_page(company_config, page, jobs_per_page if page <= max_pages else 0)
+
+def api_postings(company_config: Dict, offset: int, limit: int, total: int,
+                 seed: int = 0) -> List[Tuple[int, str, str]]:
+    """
+    Get the synthesized search results from offset up to limit of them.
+
+    Args:
+        company_config (Dict): Company configuration
+        offset (int): Index of the first result
+        limit (int): Results requested
+        total (int): Total results on the board
+        seed (int): Random seed
+
+    Returns:
+        List[Tuple[int, str, str]]: Index, title and location of each result
+    """
+    postings = []
+    for index in range(offset, min(offset + limit, total)):
+        rng = random.Random(f"{company_config['name']}:api:{index}:{seed}")
+        postings.append((index, synthetic_title(rng), rng.choice(LOCATIONS)))
+    return postings
+
+def synthesize_api_page(company_config: Dict, offset: int, limit: int, total: int,
+                        seed: int = 0) -> Dict:
+    """
+    Build a search API response in the shape of the company's board.
+
+    Args:
+        company_config (Dict): Company configuration with workday or oracle pagination
+        offset (int): Index of the first result
+        limit (int): Results requested
+        total (int): Total results on the board
+        seed (int): Random seed
+
+    Returns:
+        Dict: Workday CXS or Oracle REST response
+    """
+    slug = slugify(company_config['name'])
+    postings = api_postings(company_config, offset, limit, total, seed)
+    if company_config.get('pagination', {}).get('type') == 'oracle':
+        return {'items': [{
+            'TotalJobsCount': total,
+            'requisitionList': [
+                {'Id': str(100000 + index), 'Title': title, 'PrimaryLocation': location,
+                 'PostedDate': '2024-01-01', 'ShortDescriptionStr': 'Benchmark posting'}
+                for index, title, location in postings
+            ]
+        }], 'count': 1, 'hasMore': False}
+    return {
+        # Workday only reports the total on the first page
+        'total': total if offset == 0 else 0,
+        'jobPostings': [
+            {'title': title, 'externalPath': f"/job/{slug}/{index}", 'locationsText': location,
+             'postedOn': 'Posted Today', 'bulletFields': [f"R{index}"]}
+            for index, title, location in postings
+        ]
+    }
+
+def api_fixture_path(company_config: Dict, offset: int) -> str:
+    """Path of a recorded search API response for a company."""
+    return os.path.join(FIXTURE_DIR, slugify(company_config['name']), f"api_{offset}.json")
+
+def load_api_page(company_config: Dict, offset: int, limit: int, jobs_per_page: int = 25) -> Dict:
+    """
+    Get a search API response, preferring a recorded fixture.
+
+    Companies without recordings get synthesized responses with as many
+    results as max_pages HTML pages would list.
+
+    Args:
+        company_config (Dict): Company configuration
+        offset (int): Index of the first result
+        limit (int): Results requested
+        jobs_per_page (int): Listings per HTML page, for the synthesized total
+
+    Returns:
+        Dict: Decoded JSON response
+    """
+    path = api_fixture_path(company_config, offset)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    if os.path.isdir(os.path.dirname(path)) and os.path.exists(api_fixture_path(company_config, 0)):
+        return synthesize_api_page(company_config, offset, limit, 0)
+    total = jobs_per_page * company_config.get('pagination', {}).get('max_pages', 1)
+    return synthesize_api_page(company_config, offset, limit, total)
+
+def record_pages(company_configs: List[Dict], pages: int = 1) -> List[str]:
+    """
+    Download live career pages to replay in benchmarks.
+
+    Only url_param pagination can be recorded page by page; other
+    companies get their first page only.
+
+    Args:
+        company_configs (List[Dict]): Company configurations
+        pages (int): Pages to record per company
+
+    Returns:
+        List[str]: Paths of the recorded files
+    """
+    recorded = []
+    for company in company_configs:
+        pagination = company.get('pagination', {})
+        for page in range(1, pages + 1):
+            if page == 1:
+                url = company['career_url']
+            elif pagination.get('type') == 'url_param':
+                url = f"{pagination['base_url']}?{pagination['param_name']}={page}"
+            else:
+                break
+            try:
+                response = requests.get(url, headers=company.get('headers'), timeout=30)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                print(f"Skipping {company['name']} page {page}: {e}")
+                break
+            path = fixture_path(company, page)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(response.text)
+            recorded.append(path)
+    return recorded
+
+def record_api_pages(company_configs: List[Dict], pages: int = 1) -> List[str]:
+    """
+    Download live search API responses for Workday and Oracle boards.
+
+    Args:
+        company_configs (List[Dict]): Company configurations
+        pages (int): Pages of results to record per company
+
+    Returns:
+        List[str]: Paths of the recorded files
+    """
+    from scraper import SCRAPER_ADAPTERS, create_scraper
+
+    recorded = []
+    for company in company_configs:
+        if company.get('pagination', {}).get('type') not in SCRAPER_ADAPTERS:
+            continue
+        scraper = create_scraper(company)
+        for page in range(pages):
+            offset = page * scraper.page_size
+            method, url, body = scraper._api_request(offset)
+            try:
+                response = requests.request(method, url, json=body, timeout=30,
+                                            headers={**company.get('headers', {}), 'Accept': 'application/json'})
+                response.raise_for_status()
+                payload = response.json()
+            except (requests.RequestException, ValueError) as e:
+                print(f"Skipping {company['name']} API offset {offset}: {e}")
+                break
+            path = api_fixture_path(company, offset)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, indent=1)
+            recorded.append(path)
+    return recorded
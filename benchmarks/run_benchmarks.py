@@ -0,0 +1,417 @@
+"""
+Benchmark the scraping, matching and email stages offline.
+
+Run from anywhere; paths are resolved against the repository root:
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --stages match --sizes 1000,1000000
+    python benchmarks/run_benchmarks.py --save-baseline
+    python benchmarks/run_benchmarks.py --record 2
+"""
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from corpus import iter_synthetic_jobs, synthetic_jobs
+from fixtures import load_page, record_api_pages, record_pages
+from server import FixtureServer
+from scraper import SCRAPER_ADAPTERS, JobScraper, create_scraper, load_company_configs
+from parsing import ListingParser
+from rate_limiter import RateLimiter
+from matcher import JobMatcher
+from emailer import JobEmailer
+
+DEFAULT_BASELINE_PATH = os.path.join(BENCH_DIR, 'baselines.json')
+STAGES = ('parse', 'scrape', 'api', 'match', 'email')
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Linearly interpolated percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+def measure(run: Callable[[], List[float]], items: int, unit: str,
+            track_memory: bool = True) -> Dict:
+    """
+    Time a stage and optionally measure its peak memory.
+
+    Peak memory comes from a second run under tracemalloc, so the timed
+    run is not slowed down by allocation tracing. Memory used by worker
+    processes is not included.
+
+    Args:
+        run (Callable[[], List[float]]): Runs the stage once and returns the
+            latency of each unit of work in seconds
+        items (int): Items processed per run, for throughput
+        unit (str): What an item is, e.g. 'jobs'
+        track_memory (bool): Whether to do the tracemalloc run
+
+    Returns:
+        Dict: Items, seconds, throughput, latency percentiles and peak memory
+    """
+    start = time.perf_counter()
+    latencies = run()
+    seconds = time.perf_counter() - start
+
+    peak_mb = None
+    if track_memory:
+        tracemalloc.start()
+        try:
+            run()
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        finally:
+            tracemalloc.stop()
+
+    return {
+        'items': items,
+        'unit': unit,
+        'seconds': round(seconds, 4),
+        'throughput': round(items / seconds, 2) if seconds else None,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'peak_mb': round(peak_mb, 2) if peak_mb is not None else None
+    }
+
+def bench_parse(companies: List[Dict], pages: int, track_memory: bool) -> Dict:
+    """Parse fixture pages for every company; latency per page."""
+    pages_by_company = [(ListingParser(company), [load_page(company, page) for page in range(1, pages + 1)])
+                        for company in companies]
+
+    def run():
+        latencies = []
+        for parser, htmls in pages_by_company:
+            for html_content in htmls:
+                start = time.perf_counter()
+                job_elements, _ = parser.parse_page(html_content)
+                for element in job_elements:
+                    parser.extract_fields(element)
+                latencies.append(time.perf_counter() - start)
+        return latencies
+
+    return measure(run, len(companies) * pages, 'pages', track_memory)
+
+def bench_scrape(companies: List[Dict], track_memory: bool) -> Dict:
+    """Scrape every company from the stand-in server; latency per page."""
+    with FixtureServer(companies) as server:
+        configs = [server.stand_in_config(company) for company in companies]
+
+        def run():
+            latencies = []
+            rate_limiter = RateLimiter({'requests_per_second': 100000, 'burst': 100000})
+            for config in configs:
+                scraper = JobScraper(config, rate_limiter=rate_limiter)
+                # Every request must reach the server to measure the full path
+                scraper.http_cache = None
+                scrape_page = scraper._scrape_page
+
+                def timed_scrape_page(url, page, scrape_page=scrape_page):
+                    start = time.perf_counter()
+                    try:
+                        return scrape_page(url, page)
+                    finally:
+                        latencies.append(time.perf_counter() - start)
+
+                scraper._scrape_page = timed_scrape_page
+                for _ in scraper.iter_jobs():
+                    pass
+            return latencies
+
+        requests_before = server.requests
+        result = measure(run, 0, 'pages', False)
+        pages = server.requests - requests_before
+        result['items'] = pages
+        result['throughput'] = round(pages / result['seconds'], 2) if result['seconds'] else None
+        if track_memory:
+            result['peak_mb'] = measure(run, pages, 'pages', True)['peak_mb']
+    return result
+
+def bench_api(companies: List[Dict], track_memory: bool) -> Dict[str, Dict]:
+    """
+    Scrape the Workday and Oracle boards from HTML pages and from their search APIs.
+
+    Both variants get the same jobs from the stand-in server, 20 per HTML
+    page as on Workday; recorded API responses are not used, as there are
+    no HTML pages listing the same postings. Each result adds the bytes
+    transferred and the CPU seconds of the timed run; latency is per company.
+    """
+    api_companies = [company for company in companies
+                     if company.get('pagination', {}).get('type') in SCRAPER_ADAPTERS]
+    if not api_companies:
+        return {}
+    jobs_per_page = 20
+    total_jobs = jobs_per_page * max(company['pagination'].get('max_pages', 1) for company in api_companies)
+    results = {}
+    with FixtureServer(api_companies, jobs_per_page=jobs_per_page, total_jobs=total_jobs) as server:
+        variants = {
+            'api_html': (JobScraper, [server.stand_in_config(company) for company in api_companies]),
+            'api_json': (create_scraper, [server.stand_in_api_config(company) for company in api_companies])
+        }
+        for name, (make_scraper, configs) in variants.items():
+            jobs = []
+
+            def run(make_scraper=make_scraper, configs=configs):
+                latencies = []
+                jobs.clear()
+                rate_limiter = RateLimiter({'requests_per_second': 100000, 'burst': 100000})
+                for config in configs:
+                    scraper = make_scraper(config, rate_limiter=rate_limiter)
+                    scraper.http_cache = None
+                    start = time.perf_counter()
+                    jobs.extend(scraper.iter_jobs())
+                    latencies.append(time.perf_counter() - start)
+                return latencies
+
+            bytes_before, cpu_before = server.bytes_sent, time.process_time()
+            result = measure(run, 0, 'jobs', False)
+            result['bytes'] = server.bytes_sent - bytes_before
+            result['cpu_seconds'] = round(time.process_time() - cpu_before, 4)
+            result['items'] = len(jobs)
+            result['throughput'] = round(len(jobs) / result['seconds'], 2) if result['seconds'] else None
+            if track_memory:
+                result['peak_mb'] = measure(run, len(jobs), 'jobs', True)['peak_mb']
+            results[name] = result
+    return results
+
+def check_api(companies: List[Dict]) -> List[str]:
+    """
+    Check that the search API adapters return the same jobs as the HTML path.
+
+    The stand-in server lists the same postings, at the same URLs, on each
+    board's HTML pages and in its search API. The board size leaves the
+    last HTML page and the last page of every API page size partly full,
+    so offset paging and end-of-results handling are covered.
+
+    Args:
+        companies (List[Dict]): Company configurations
+
+    Returns:
+        List[str]: One message per board whose two paths disagree
+    """
+    api_companies = [company for company in companies
+                     if company.get('pagination', {}).get('type') in SCRAPER_ADAPTERS]
+    if not api_companies:
+        return []
+    jobs_per_page = 20
+    max_pages = min(company['pagination'].get('max_pages', 1) for company in api_companies)
+    total_jobs = max(1, jobs_per_page * max_pages - 7)
+    rate_limiter = RateLimiter({'requests_per_second': 100000, 'burst': 100000})
+
+    mismatches = []
+    with FixtureServer(api_companies, jobs_per_page=jobs_per_page, total_jobs=total_jobs) as server:
+        for company in api_companies:
+            found = {}
+            for name, make_scraper, config in (
+                    ('html', JobScraper, server.stand_in_config(company)),
+                    ('api', create_scraper, server.stand_in_api_config(company))):
+                config['pagination']['max_pages'] = max_pages
+                scraper = make_scraper(config, rate_limiter=rate_limiter)
+                scraper.http_cache = None
+                found[name] = [(job['title'], job['location'], job['url']) for job in scraper.iter_jobs()]
+
+            html_jobs, api_jobs = set(found['html']), set(found['api'])
+            if len(found['html']) != total_jobs or len(found['api']) != total_jobs or html_jobs != api_jobs:
+                mismatches.append(
+                    f"{company['name']}: expected {total_jobs} jobs, html found {len(found['html'])}, "
+                    f"api found {len(found['api'])}, {len(html_jobs - api_jobs)} only in html, "
+                    f"{len(api_jobs - html_jobs)} only in api"
+                )
+    return mismatches
+
+def bench_match(size: int, chunk_size: int, track_memory: bool) -> Dict:
+    """Filter a synthetic corpus in chunks; latency per chunk."""
+    matcher = JobMatcher(cache_scores=False)
+
+    def run():
+        latencies = []
+        jobs = iter_synthetic_jobs(size)
+        while True:
+            chunk = list(islice(jobs, chunk_size))
+            if not chunk:
+                break
+            start = time.perf_counter()
+            matcher.filter_jobs(chunk)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    try:
+        return measure(run, size, 'jobs', track_memory)
+    finally:
+        matcher.close()
+
+def bench_email(batch_size: int, repeats: int, track_memory: bool) -> Dict[str, Dict]:
+    """Render email tables and bodies; latency per email."""
+    emailer = JobEmailer()
+    jobs = synthetic_jobs(batch_size)
+    for i, job in enumerate(jobs):
+        job['match_score'] = round(1 - i / (2 * batch_size), 2)
+
+    def render(func):
+        def run():
+            latencies = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                func()
+                latencies.append(time.perf_counter() - start)
+            return latencies
+        return run
+
+    return {
+        'email_table': measure(render(lambda: emailer._create_html_table(jobs)),
+                               repeats, 'emails', track_memory),
+        'email_content': measure(render(lambda: emailer._create_email_content(jobs, 'Benchmark')),
+                                 repeats, 'emails', track_memory)
+    }
+
+def current_commit() -> Optional[str]:
+    """Short hash of the checked out commit, if this is a git checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def load_baselines(path: str) -> Dict:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_baselines(path: str, results: Dict):
+    """Merge results into the baselines file, stamped with the commit."""
+    baselines = load_baselines(path)
+    stamp = {'commit': current_commit(), 'recorded': datetime.now().isoformat(timespec='seconds')}
+    for name, result in results.items():
+        baselines[name] = {**result, **stamp}
+    with open(path, 'w') as f:
+        f.write(json.dumps(baselines, indent=4, sort_keys=True) + "\n")
+
+def find_regressions(results: Dict, baselines: Dict, tolerance: float) -> List[str]:
+    """
+    Compare results with baselines.
+
+    Args:
+        results (Dict): Stage results from this run
+        baselines (Dict): Stored stage results
+        tolerance (float): Allowed relative slowdown or growth, e.g. 0.25
+
+    Returns:
+        List[str]: One message per regressed metric
+    """
+    regressions = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if not baseline or baseline.get('items') != result['items']:
+            continue
+        if baseline.get('throughput') and result['throughput'] is not None \
+                and result['throughput'] < baseline['throughput'] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {result['throughput']} < baseline {baseline['throughput']}")
+        for metric in ('p95_ms', 'peak_mb'):
+            if baseline.get(metric) and result.get(metric) is not None \
+                    and result[metric] > baseline[metric] * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {result[metric]} > baseline {baseline[metric]}")
+    return regressions
+
+def print_report(results: Dict, baselines: Dict):
+    header = f"{'stage':<16}{'items':>10}{'unit':>7}{'seconds':>10}{'per sec':>12}" \
+             f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak MB':>10}{'vs base':>9}"
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        baseline = baselines.get(name, {})
+        change = ''
+        if baseline.get('throughput') and r['throughput'] and baseline.get('items') == r['items']:
+            change = f"{(r['throughput'] / baseline['throughput'] - 1) * 100:+.0f}%"
+        peak = f"{r['peak_mb']:.2f}" if r['peak_mb'] is not None else '-'
+        print(f"{name:<16}{r['items']:>10}{r['unit']:>7}{r['seconds']:>10.3f}{r['throughput'] or 0:>12.1f}"
+              f"{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}{r['p99_ms']:>10.3f}{peak:>10}{change:>9}")
+    for name, r in results.items():
+        if 'bytes' in r:
+            print(f"{name}: {r['bytes']} bytes transferred, {r['cpu_seconds']:.3f} CPU seconds")
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark scraping, matching and email rendering offline")
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help=f"comma-separated stages to run (default: {','.join(STAGES)})")
+    parser.add_argument('--sizes', default='1000,10000,100000',
+                        help="comma-separated corpus sizes for matching, up to 1000000")
+    parser.add_argument('--chunk-size', type=int, default=10000,
+                        help="jobs per filter_jobs call when matching")
+    parser.add_argument('--pages', type=int, default=20, help="fixture pages per company to parse")
+    parser.add_argument('--email-batch', type=int, default=20, help="jobs per rendered email")
+    parser.add_argument('--repeats', type=int, default=200, help="renders per email stage")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc runs")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH, help="baselines file")
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="relative change reported as a regression")
+    parser.add_argument('--output', help="also write the results to this JSON file")
+    parser.add_argument('--record', type=int, metavar='PAGES',
+                        help="record PAGES live pages per company as fixtures, then exit")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    os.chdir(ROOT)
+    logging.getLogger().setLevel(logging.WARNING)
+    companies = load_company_configs()
+
+    if args.record:
+        for path in record_pages(companies, args.record) + record_api_pages(companies, args.record):
+            print(f"Recorded {path}")
+        return 0
+
+    stages = [stage.strip() for stage in args.stages.split(',') if stage.strip()]
+    track_memory = not args.no_memory
+    results = {}
+    if 'parse' in stages:
+        results['parse'] = bench_parse(companies, args.pages, track_memory)
+    if 'scrape' in stages:
+        results['scrape'] = bench_scrape(companies, track_memory)
+    mismatches = []
+    if 'api' in stages:
+        mismatches = check_api(companies)
+        results.update(bench_api(companies, track_memory))
+    if 'match' in stages:
+        for size in (int(size) for size in args.sizes.split(',')):
+            results[f"match_{size}"] = bench_match(size, args.chunk_size, track_memory)
+    if 'email' in stages:
+        results.update(bench_email(args.email_batch, args.repeats, track_memory))
+
+    baselines = load_baselines(args.baseline)
+    print_report(results, baselines)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(json.dumps(results, indent=4) + "\n")
+
+    for mismatch in mismatches:
+        print(f"MISMATCH {mismatch}")
+    regressions = find_regressions(results, baselines, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if args.save_baseline:
+        save_baselines(args.baseline, results)
+        print(f"Saved baselines to {args.baseline}")
+    if mismatches:
+        return 1
+    return 1 if regressions and not args.save_baseline else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from fixtures import api_postings, load_api_page, load_page, render_page, slugify, synthesize_api_page
+
+class FixtureServer:
+    def __init__(self, company_configs: List[Dict], jobs_per_page: int = 25,
+                 latency: float = 0.0, total_jobs: Optional[int] = None):
+        """
+        Serve career pages for every company from a local HTTP server.
+
+        Each company is served under /<slug>/ with url_param pagination,
+        whatever its live pagination type, so the scraper's fetch, parse
+        and paginate loop can be replayed without network access. Workday
+        and Oracle search API responses are served under the same prefix.
+
+        Args:
+            company_configs (List[Dict]): Company configurations
+            jobs_per_page (int): Listings on synthesized pages
+            latency (float): Seconds to wait before each response
+            total_jobs (Optional[int]): Synthesize boards of exactly this
+                many jobs whose HTML pages list the same postings, at the
+                same URLs, as their search API, so both paths can be
+                checked against each other; recordings are not used
+        """
+        self.companies = {slugify(company['name']): company for company in company_configs}
+        self.jobs_per_page = jobs_per_page
+        self.latency = latency
+        self.total_jobs = total_jobs
+        self.requests = 0
+        self.bytes_sent = 0
+        self._pages: Dict = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def page(self, slug: str, page: int) -> bytes:
+        """Get a page body, rendering each page once."""
+        key = (slug, page)
+        with self._lock:
+            if key not in self._pages:
+                if self.total_jobs is not None:
+                    body = self._mirror_page(slug, page)
+                else:
+                    body = load_page(self.companies[slug], page, self.jobs_per_page)
+                self._pages[key] = body.encode('utf-8')
+            return self._pages[key]
+
+    def api_page(self, slug: str, offset: int, limit: int) -> bytes:
+        """Get a search API response body."""
+        company = self.companies[slug]
+        if self.total_jobs is not None:
+            payload = synthesize_api_page(company, offset, limit, self.total_jobs)
+        else:
+            payload = load_api_page(company, offset, limit, self.jobs_per_page)
+        return json.dumps(payload).encode('utf-8')
+
+    def job_path(self, slug: str, index: int) -> str:
+        """Site-relative URL of a search result, as the API adapters build it."""
+        company = self.companies[slug]
+        if company.get('pagination', {}).get('type') == 'oracle':
+            return f"/{slug}/hcmUI/CandidateExperience/en/sites/CX_1/job/{100000 + index}"
+        return f"/{slug}/site/job/{slug}/{index}"
+
+    def _mirror_page(self, slug: str, page: int) -> str:
+        """HTML page listing the same postings as the search API."""
+        offset = (page - 1) * self.jobs_per_page
+        postings = api_postings(self.companies[slug], offset, self.jobs_per_page, self.total_jobs)
+        return render_page(self.companies[slug],
+                           [(title, location, self.job_path(slug, index))
+                            for index, title, location in postings])
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _company(self):
+                parts = urlsplit(self.path)
+                slug = parts.path.strip('/').split('/')[0]
+                if slug not in server.companies:
+                    self.send_error(404)
+                    return None, parts
+                return slug, parts
+
+            def _respond(self, body: bytes, content_type: str):
+                with server._lock:
+                    server.requests += 1
+                    server.bytes_sent += len(body)
+                if server.latency:
+                    time.sleep(server.latency)
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                slug, parts = self._company()
+                if slug is None:
+                    return
+                query = parse_qs(parts.query)
+                if '/hcmRestApi/' in parts.path:
+                    # Oracle: paging lives in the finder, e.g. findReqs;limit=25,offset=50
+                    finder = query.get('finder', [''])[0]
+                    limit = re.search(r'limit=(\d+)', finder)
+                    offset = re.search(r'offset=(\d+)', finder)
+                    self._respond(server.api_page(slug, int(offset.group(1)) if offset else 0,
+                                                  int(limit.group(1)) if limit else 25),
+                                  'application/json')
+                    return
+                try:
+                    page = int(next(iter(query.values()))[0]) if query else 1
+                except ValueError:
+                    page = 1
+                self._respond(server.page(slug, page), 'text/html; charset=utf-8')
+
+            def do_POST(self):
+                slug, parts = self._company()
+                if slug is None:
+                    return
+                if '/wday/cxs/' not in parts.path:
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get('Content-Length') or 0)
+                request = json.loads(self.rfile.read(length) or b'{}')
+                self._respond(server.api_page(slug, request.get('offset', 0), request.get('limit', 20)),
+                              'application/json')
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def stand_in_config(self, company_config: Dict) -> Dict:
+        """
+        Point a company configuration at this server.
+
+        Args:
+            company_config (Dict): Live company configuration
+
+        Returns:
+            Dict: Copy with the URLs and pagination rewritten, selectors kept
+        """
+        slug = slugify(company_config['name'])
+        url = f"{self.base_url}/{slug}/"
+        pagination = company_config.get('pagination', {})
+        config = {key: value for key, value in company_config.items() if key != 'rate_limit'}
+        config.update({
+            'career_url': url,
+            'base_url': self.base_url,
+            'pagination': {
+                'type': 'url_param',
+                'param_name': pagination.get('param_name', 'page'),
+                'base_url': url,
+                'max_pages': pagination.get('max_pages', 1)
+            }
+        })
+        return config
+
+    def stand_in_api_config(self, company_config: Dict) -> Dict:
+        """
+        Point a Workday or Oracle company at this server's search API.
+
+        Args:
+            company_config (Dict): Live company configuration
+
+        Returns:
+            Dict: Copy with the career, base and API URLs rewritten
+        """
+        slug = slugify(company_config['name'])
+        base_url = f"{self.base_url}/{slug}"
+        pagination = dict(company_config.get('pagination', {}))
+        config = {key: value for key, value in company_config.items() if key != 'rate_limit'}
+        if pagination.get('type') == 'oracle':
+            career_url = f"{base_url}/hcmUI/CandidateExperience/en/sites/CX_1/requisitions"
+        else:
+            career_url = f"{base_url}/site"
+            pagination['api_url'] = f"{base_url}/wday/cxs/{slug}/site/jobs"
+        config.update({'career_url': career_url, 'base_url': base_url, 'pagination': pagination})
+        return config
+
+    def start(self) -> 'FixtureServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'FixtureServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
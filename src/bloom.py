@@ -0,0 +1,143 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import Iterable
+
+MAGIC = b'CSBF'
+VERSION = 1
+# magic, version, number of hashes, number of bits, items added, capacity, false positive rate
+HEADER = struct.Struct('<4sIIQQQd')
+
+class BloomFilter:
+    def __init__(self, path: str, capacity: int = 100000, false_positive_rate: float = 0.01):
+        """
+        Open (or create) a Bloom filter persisted as a memory-mapped file.
+
+        A lookup that misses means the key was definitely never added; a hit
+        means it probably was, with the configured false positive rate as
+        long as no more than ``capacity`` keys are added.
+
+        Args:
+            path (str): Path of the filter file
+            capacity (int): Expected number of keys
+            false_positive_rate (float): Target false positive rate at capacity
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            self._open(path)
+        else:
+            self._create(path, capacity, false_positive_rate)
+
+    @staticmethod
+    def optimal_parameters(capacity: int, false_positive_rate: float):
+        """
+        Compute the bit count and hash count for a capacity and error rate.
+
+        Args:
+            capacity (int): Expected number of keys
+            false_positive_rate (float): Target false positive rate
+
+        Returns:
+            Tuple[int, int]: Number of bits and number of hash functions
+        """
+        capacity = max(1, capacity)
+        num_bits = math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return num_bits, num_hashes
+
+    def _create(self, path: str, capacity: int, false_positive_rate: float):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        num_bits, num_hashes = self.optimal_parameters(capacity, false_positive_rate)
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, num_hashes, num_bits, 0, capacity, false_positive_rate))
+            f.truncate(HEADER.size + (num_bits + 7) // 8)
+        self._open(path)
+
+    def _open(self, path: str):
+        self._file = open(path, 'r+b')
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        magic, version, num_hashes, num_bits, count, capacity, rate = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            self._file.close()
+            raise ValueError(f"{path} is not a Bloom filter file")
+        self.num_hashes = num_hashes
+        self.num_bits = num_bits
+        self.count = count
+        self.capacity = capacity
+        self.false_positive_rate = rate
+
+    def _positions(self, key: str):
+        # Double hashing: k positions from two independent 64-bit hashes
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        """
+        Add a key to the filter.
+
+        Args:
+            key (str): Key to add
+        """
+        with self._lock:
+            for position in self._positions(key):
+                offset = HEADER.size + (position >> 3)
+                self._mmap[offset] |= 1 << (position & 7)
+            self.count += 1
+
+    def update(self, keys: Iterable[str]):
+        """Add several keys to the filter."""
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        for position in self._positions(key):
+            if not self._mmap[HEADER.size + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+
+    def flush(self):
+        """Write the item count and dirty pages back to the file."""
+        with self._lock:
+            HEADER.pack_into(self._mmap, 0, MAGIC, VERSION, self.num_hashes, self.num_bits,
+                             self.count, self.capacity, self.false_positive_rate)
+            self._mmap.flush()
+
+    def close(self):
+        """Flush and release the memory map."""
+        if not self._mmap.closed:
+            self.flush()
+            self._mmap.close()
+        self._file.close()
+
+    @classmethod
+    def build(cls, path: str, keys: Iterable[str], capacity: int,
+              false_positive_rate: float = 0.01) -> 'BloomFilter':
+        """
+        Build a fresh filter from keys, replacing any existing file atomically.
+
+        Args:
+            path (str): Path of the filter file
+            keys (Iterable[str]): Keys to add
+            capacity (int): Expected number of keys
+            false_positive_rate (float): Target false positive rate at capacity
+
+        Returns:
+            BloomFilter: The new filter, opened at path
+        """
+        tmp_path = f"{path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        bloom = cls(tmp_path, capacity, false_positive_rate)
+        bloom.update(keys)
+        bloom.close()
+        os.replace(tmp_path, path)
+        return cls(path)
@@ -0,0 +1,265 @@
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+import logging
+from metrics import get_metrics
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+try:
+    from selenium import webdriver
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.chrome.service import Service
+    HAS_SELENIUM = True
+except ImportError:
+    HAS_SELENIUM = False
+
+# Requests a listing page never needs: images, fonts, media and trackers
+DEFAULT_BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*facebook.net*', '*hotjar.com*', '*linkedin.com/px*', '*bat.bing.com*',
+    '*onetrust.com*', '*cookielaw.org*', '*newrelic.com*', '*nr-data.net*'
+]
+
+DEFAULT_BROWSER_SETTINGS = {
+    'pool_size': 2,
+    'headless': True,
+    'page_load_timeout': 30.0,
+    'wait_timeout': 15.0,
+    # Seconds to wait for a browser when every one in the pool is busy
+    'acquire_timeout': 300.0,
+    'block_resources': True,
+    'blocked_urls': DEFAULT_BLOCKED_URLS,
+    # None installs a matching chromedriver with webdriver-manager
+    'driver_path': None
+}
+
+class BrowserUnavailableError(Exception):
+    """Raised when no browser can be launched or borrowed from the pool."""
+    pass
+
+class BrowserPool:
+    def __init__(self, size: int = 2, headless: bool = True, page_load_timeout: float = 30.0,
+                 blocked_urls: Optional[List[str]] = None, driver_path: Optional[str] = None,
+                 acquire_timeout: float = 300.0):
+        """
+        Initialize a pool of headless Chrome instances.
+
+        Browsers are launched on demand, up to size, and returned to the pool
+        after each company, so later pages and companies reuse a warm browser
+        instead of paying a cold start each time.
+
+        Args:
+            size (int): Maximum browsers running at once
+            headless (bool): Run without a window
+            page_load_timeout (float): Seconds to wait for a navigation
+            blocked_urls (Optional[List[str]]): URL patterns the browser does
+                not load, e.g. images, fonts and trackers
+            driver_path (Optional[str]): chromedriver to use, installed with
+                webdriver-manager if not given
+            acquire_timeout (float): Seconds to wait for a browser when the
+                pool is full before giving up
+        """
+        self.size = max(1, size)
+        self.headless = headless
+        self.page_load_timeout = page_load_timeout
+        self.blocked_urls = blocked_urls or []
+        self.driver_path = driver_path
+        self.acquire_timeout = acquire_timeout
+        self.metrics = get_metrics()
+        # Idle browsers, most recently used last; guarded by _available,
+        # which is notified whenever a browser or a launch slot frees up
+        self._idle: List = []
+        self._open = 0
+        self._available = threading.Condition()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _resolve_driver_path(self) -> Optional[str]:
+        """Install chromedriver once with webdriver-manager, if available."""
+        if self.driver_path is None:
+            try:
+                from webdriver_manager.chrome import ChromeDriverManager
+                self.driver_path = ChromeDriverManager().install()
+            except Exception as e:
+                # Selenium Manager can still find a driver on its own
+                logger.warning(f"Could not install chromedriver with webdriver-manager: {str(e)}")
+                self.driver_path = ''
+        return self.driver_path or None
+
+    def _launch(self):
+        start = time.perf_counter()
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument('--headless=new')
+        for argument in ('--disable-gpu', '--no-sandbox', '--disable-dev-shm-usage',
+                         '--disable-extensions', '--blink-settings=imagesEnabled=false'):
+            options.add_argument(argument)
+        # Listings are waited for explicitly, so there is no need to wait
+        # for subresources before navigation returns
+        options.page_load_strategy = 'eager'
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.fonts': 2
+        })
+
+        with self._lock:
+            driver_path = self._resolve_driver_path()
+        service = Service(executable_path=driver_path) if driver_path else Service()
+        driver = webdriver.Chrome(options=options, service=service)
+        try:
+            driver.set_page_load_timeout(self.page_load_timeout)
+            if self.blocked_urls:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_urls})
+        except Exception:
+            self._discard(driver)
+            raise
+        self.metrics.observe('browser_launch_seconds', time.perf_counter() - start)
+        logger.debug("Launched browser %d of %d", self._open, self.size)
+        return driver
+
+    @staticmethod
+    def _discard(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _acquire(self):
+        """
+        Take an idle browser, or launch one if the pool has room.
+
+        Waiters are woken whenever a browser is returned or a launch slot
+        is freed by a failed launch or a dropped browser, and launch
+        themselves if a slot is free.
+
+        Raises:
+            BrowserUnavailableError: If launching fails or no browser is
+                free within acquire_timeout
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._available:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._open < self.size:
+                    self._open += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise BrowserUnavailableError(
+                        f"No browser became available within {self.acquire_timeout:g}s"
+                    )
+                self._available.wait(remaining)
+
+        try:
+            return self._launch()
+        except Exception as e:
+            self._free_slot()
+            message = str(e).splitlines()[0] if str(e) else type(e).__name__
+            raise BrowserUnavailableError(f"Could not launch Chrome: {message}") from e
+
+    def _free_slot(self):
+        with self._available:
+            self._open -= 1
+            self._available.notify()
+
+    def _release(self, driver):
+        try:
+            # Leave nothing from this company for the next one
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+        except Exception:
+            self._drop(driver)
+            return
+        with self._available:
+            if not self._closed:
+                self._idle.append(driver)
+                self._available.notify()
+                return
+        self._drop(driver)
+
+    def _drop(self, driver):
+        self._discard(driver)
+        self._free_slot()
+
+    @contextmanager
+    def browser(self, user_agent: Optional[str] = None) -> Iterator:
+        """
+        Borrow a browser, launching one if none is idle and the pool has room.
+
+        A browser whose session has died is quit instead of being returned.
+
+        Args:
+            user_agent (Optional[str]): User-Agent to send while borrowed
+
+        Yields:
+            WebDriver: Running Chrome instance
+
+        Raises:
+            BrowserUnavailableError: If no browser could be launched or borrowed
+        """
+        driver = self._acquire()
+        try:
+            if user_agent:
+                driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': user_agent})
+            yield driver
+        except WebDriverException as e:
+            if 'invalid session id' in str(e).lower() or 'disconnected' in str(e).lower():
+                self._drop(driver)
+            else:
+                self._release(driver)
+            raise
+        except BaseException:
+            self._release(driver)
+            raise
+        self._release(driver)
+
+    def close(self):
+        """Quit every idle browser; browsers still in use are quit on release."""
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._drop(driver)
+
+_shared_pool: Optional[BrowserPool] = None
+_shared_pool_lock = threading.Lock()
+
+def get_browser_pool(settings: Optional[Dict] = None) -> Optional[BrowserPool]:
+    """
+    Get the process-wide browser pool shared by all scrapers.
+
+    Args:
+        settings (Optional[Dict]): ``browser`` settings, used on first call only
+
+    Returns:
+        Optional[BrowserPool]: Shared pool, None if selenium is not installed
+    """
+    global _shared_pool
+    if not HAS_SELENIUM:
+        return None
+    settings = {**DEFAULT_BROWSER_SETTINGS, **(settings or {})}
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = BrowserPool(
+                size=settings['pool_size'],
+                headless=settings['headless'],
+                page_load_timeout=settings['page_load_timeout'],
+                blocked_urls=settings['blocked_urls'] if settings['block_resources'] else None,
+                driver_path=settings['driver_path'],
+                acquire_timeout=settings['acquire_timeout']
+            )
+            atexit.register(_shared_pool.close)
+        return _shared_pool
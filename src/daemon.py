@@ -0,0 +1,182 @@
+import json
+import os
+import signal
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import logging
+import schedule
+from scraper import JobScraper, create_scraper, load_company_configs
+from metrics import export_metrics, get_metrics
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_DAEMON_SETTINGS = {
+    'default_interval_minutes': 60,
+    # Each interval is drawn from +/- this fraction, so crawls drift apart
+    'jitter': 0.1,
+    'state_path': 'data/daemon_state.json'
+}
+
+class CrawlDaemon:
+    def __init__(self, pipeline, companies: Optional[List[Dict]] = None,
+                 settings: Optional[Dict] = None):
+        """
+        Initialize a scheduler that crawls each company on its own interval.
+
+        Each company is crawled every ``crawl_interval_minutes`` from
+        companies.json (``daemon.default_interval_minutes`` otherwise), with
+        jitter. Scrapers are created once and reuse the shared kept-alive
+        connections, and every crawl's jobs go through the same warm
+        pipeline. The last crawl of each company is persisted, so a restart
+        resumes the schedule instead of crawling everything at once.
+
+        Args:
+            pipeline (JobPipeline): Pipeline that filters, matches and emails
+                each crawl's jobs
+            companies (Optional[List[Dict]]): Company configurations, loaded
+                from companies.json if not given
+            settings (Optional[Dict]): Runtime settings
+        """
+        settings = settings or {}
+        self.settings = {**DEFAULT_DAEMON_SETTINGS, **settings.get('daemon', {})}
+        self.metrics_settings = settings.get('metrics')
+        self.pipeline = pipeline
+        self.companies = companies if companies is not None else load_company_configs()
+        self.scheduler = schedule.Scheduler()
+        self.scrapers: Dict[str, JobScraper] = {}
+        self.state = self._load_state()
+        self.metrics = get_metrics()
+        self.success = True
+        self._stop = threading.Event()
+
+    def _load_state(self) -> Dict[str, Dict]:
+        """Load the last crawl of each company, empty if there is none yet."""
+        path = self.settings['state_path']
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'r') as f:
+                return json.load(f).get('companies', {})
+        except Exception as e:
+            logger.error(f"Error loading daemon state: {str(e)}")
+            return {}
+
+    def save_state(self):
+        """Atomically write the last crawl of each company."""
+        path = self.settings['state_path']
+        if not path:
+            return
+        directory = os.path.dirname(path)
+        tmp_path = f"{path}.tmp"
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({'companies': self.state}, f, indent=4)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Error saving daemon state: {str(e)}")
+
+    def interval_minutes(self, company_config: Dict) -> float:
+        """Crawl interval of a company in minutes."""
+        return company_config.get('crawl_interval_minutes', self.settings['default_interval_minutes'])
+
+    def _schedule(self, company_config: Dict):
+        """Schedule a company's crawls, resuming from its last persisted crawl."""
+        name = company_config['name']
+        interval = self.interval_minutes(company_config) * 60
+        jitter = self.settings['jitter']
+        shortest = max(1, int(interval * (1 - jitter)))
+        longest = max(shortest, int(interval * (1 + jitter)))
+        job = self.scheduler.every(shortest).to(longest).seconds.do(self.crawl, company_config).tag(name)
+
+        # Companies never crawled, or overdue, are crawled straight away
+        last_crawl = self.state.get(name, {}).get('last_crawl')
+        next_run = datetime.now()
+        if last_crawl:
+            try:
+                next_run = max(next_run, datetime.fromisoformat(last_crawl) + timedelta(seconds=shortest))
+            except ValueError:
+                pass
+        job.next_run = next_run
+        logger.info(f"Crawling {name} every {interval / 60:g} minutes, next at {next_run:%Y-%m-%d %H:%M:%S}")
+
+    def crawl(self, company_config: Dict):
+        """
+        Crawl one company and send its new matches through the pipeline.
+
+        Errors are logged rather than raised so one failing company does not
+        stop the daemon.
+
+        Args:
+            company_config (Dict): Configuration for the company to crawl
+        """
+        if self._stop.is_set():
+            return
+        name = company_config['name']
+        start = time.perf_counter()
+        success = False
+        try:
+            scraper = self.scrapers.get(name)
+            if scraper is None:
+                scraper = self.scrapers[name] = create_scraper(company_config, history=self.pipeline.history)
+            success = self.pipeline.process(scraper.iter_jobs())
+        except Exception as e:
+            logger.error(f"Error crawling {name}: {str(e)}")
+        duration = time.perf_counter() - start
+        self.success = self.success and success
+
+        self.state[name] = {
+            'last_crawl': datetime.now().isoformat(timespec='seconds'),
+            'duration_seconds': round(duration, 3),
+            'success': success
+        }
+        self.save_state()
+        self.metrics.set('run_duration_seconds', duration, company=name)
+        self.metrics.set('run_success', int(success), company=name)
+        export_metrics(self.metrics_settings)
+
+    def stop(self, signum: Optional[int] = None, frame=None):
+        """Stop after the crawl in progress, if any; usable as a signal handler."""
+        if signum is not None:
+            logger.info(f"Received signal {signum}, shutting down")
+        self._stop.set()
+
+    def run(self) -> bool:
+        """
+        Crawl companies on schedule until stopped by SIGTERM or SIGINT.
+
+        Returns:
+            bool: True if every crawl succeeded
+        """
+        for company_config in self.companies:
+            self._schedule(company_config)
+        if not self.scheduler.jobs:
+            logger.warning("No companies to crawl")
+            return True
+
+        previous_handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                previous_handlers[signum] = signal.signal(signum, self.stop)
+
+        logger.info(f"Daemon started with {len(self.scheduler.jobs)} companies")
+        try:
+            while not self._stop.is_set():
+                self.scheduler.run_pending()
+                idle = self.scheduler.idle_seconds
+                self._stop.wait(max(0.0, idle) if idle is not None else 60)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            self.save_state()
+            self.scheduler.clear()
+            logger.info("Daemon stopped")
+        return self.success
@@ -0,0 +1,277 @@
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+from rate_limiter import backoff_delay
+from metrics import get_metrics
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_DELIVERY_SETTINGS = {
+    'connections': 4,
+    'max_attempts': 3,
+    'backoff_base': 1.0,
+    'backoff_max': 30.0,
+    'timeout': 30.0,
+    # Idle connections older than this are checked with NOOP before reuse
+    'idle_check_seconds': 60.0,
+    # Seconds after a login failure before login is tried again
+    'auth_retry_seconds': 300.0
+}
+
+def is_connection_error(error: Exception) -> bool:
+    """
+    Check whether an error leaves the SMTP connection unusable.
+
+    Args:
+        error (Exception): Error raised while using the connection
+
+    Returns:
+        bool: True for dropped connections, socket errors and 421 replies
+    """
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code == 421
+    # SMTPException subclasses OSError; the remaining ones are protocol errors
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+def is_permanent_failure(error: Exception) -> bool:
+    """
+    Check whether retrying a send cannot help.
+
+    Refused recipients and 5xx replies are permanent; dropped connections,
+    timeouts and 4xx replies are worth retrying.
+
+    Args:
+        error (Exception): Error raised while sending
+
+    Returns:
+        bool: True if the message should not be retried
+    """
+    if isinstance(error, (smtplib.SMTPRecipientsRefused, smtplib.SMTPAuthenticationError)):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 500 <= error.smtp_code < 600
+    return False
+
+class SMTPConnectionPool:
+    def __init__(self, host: str, port: int, user: Optional[str], password: Optional[str],
+                 size: int = 4, timeout: float = 30.0, idle_check_seconds: float = 60.0,
+                 auth_retry_seconds: float = 300.0):
+        """
+        Initialize a pool of logged-in SMTP connections.
+
+        Connections are opened on demand, up to size, and returned to the
+        pool after each message so later messages and batches reuse them.
+
+        Args:
+            host (str): SMTP server
+            port (int): SMTP port
+            user (Optional[str]): Login user, None to skip login
+            password (Optional[str]): Login password
+            size (int): Maximum open connections
+            timeout (float): Socket timeout in seconds
+            idle_check_seconds (float): Idle time after which a connection
+                is checked with NOOP before reuse
+            auth_retry_seconds (float): Time after a login failure during
+                which sends fail without trying to log in again
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.idle_check_seconds = idle_check_seconds
+        self.auth_retry_seconds = auth_retry_seconds
+        # Idle connections with the time they were returned, most recent
+        # last; guarded by _available, which is notified whenever a
+        # connection or an open slot frees up
+        self._idle: List[Tuple[smtplib.SMTP, float]] = []
+        self._open = 0
+        self._available = threading.Condition()
+        # Set when login fails, so other senders stop trying the same
+        # credentials until auth_retry_seconds have passed
+        self._fatal_error: Optional[Exception] = None
+        self._fatal_until = 0.0
+
+    def _connect(self) -> smtplib.SMTP:
+        start = time.perf_counter()
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            server.starttls()
+            if self.user:
+                server.login(self.user, self.password)
+            get_metrics().observe('email_connect_seconds', time.perf_counter() - start)
+        except smtplib.SMTPAuthenticationError as e:
+            self._fatal_error = e
+            self._fatal_until = time.monotonic() + self.auth_retry_seconds
+            self._discard(server)
+            raise
+        except Exception:
+            self._discard(server)
+            raise
+        return server
+
+    @staticmethod
+    def _discard(server: smtplib.SMTP):
+        try:
+            server.close()
+        except Exception:
+            pass
+
+    def _is_alive(self, server: smtplib.SMTP) -> bool:
+        try:
+            return server.noop()[0] == 250
+        except Exception:
+            return False
+
+    def _acquire(self) -> smtplib.SMTP:
+        while True:
+            with self._available:
+                if self._fatal_error is not None:
+                    if time.monotonic() < self._fatal_until:
+                        raise self._fatal_error
+                    # Let the next connection try logging in again
+                    self._fatal_error = None
+                while not self._idle and self._open >= self.size:
+                    self._available.wait()
+                if self._idle:
+                    server, idle_since = self._idle.pop()
+                else:
+                    self._open += 1
+                    server = None
+
+            if server is None:
+                try:
+                    return self._connect()
+                except Exception:
+                    self._free_slot()
+                    raise
+            if time.monotonic() - idle_since < self.idle_check_seconds or self._is_alive(server):
+                return server
+            # Dropped while idle: replace it with a fresh connection
+            self._discard(server)
+            self._free_slot()
+
+    def _free_slot(self):
+        with self._available:
+            self._open -= 1
+            self._available.notify()
+
+    def _release(self, server: smtplib.SMTP):
+        with self._available:
+            self._idle.append((server, time.monotonic()))
+            self._available.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """
+        Borrow a connection, opening or reconnecting one as needed.
+
+        A connection that raises a connection error is closed instead of
+        being returned to the pool.
+
+        Yields:
+            smtplib.SMTP: Logged-in connection
+        """
+        server = self._acquire()
+        try:
+            yield server
+        except Exception as e:
+            if is_connection_error(e):
+                self._discard(server)
+                self._free_slot()
+            else:
+                self._release(server)
+            raise
+        self._release(server)
+
+    def close(self):
+        """Quit every idle connection and forget any login failure."""
+        with self._available:
+            idle, self._idle = self._idle, []
+            self._fatal_error = None
+        for server, _ in idle:
+            try:
+                server.quit()
+            except Exception:
+                self._discard(server)
+            self._free_slot()
+
+def send_with_retry(pool: SMTPConnectionPool, message, max_attempts: int = 3,
+                    backoff_base: float = 1.0, backoff_max: float = 30.0) -> Tuple[int, Optional[Exception]]:
+    """
+    Send one message through the pool, retrying transient failures.
+
+    A dropped connection is replaced and the message resent straight away;
+    other transient errors are retried after a jittered backoff.
+
+    Args:
+        pool (SMTPConnectionPool): Connection pool
+        message: Email message to send
+        max_attempts (int): Attempts before giving up
+        backoff_base (float): Base delay in seconds for the backoff
+        backoff_max (float): Maximum delay in seconds
+
+    Returns:
+        Tuple[int, Optional[Exception]]: Attempts made and the last error,
+            None if the message was sent
+    """
+    error = None
+    for attempt in range(max_attempts):
+        try:
+            with pool.connection() as server:
+                server.send_message(message)
+            return attempt + 1, None
+        except Exception as e:
+            error = e
+            logger.warning(f"Attempt {attempt + 1} to send to {message['To']} failed: {str(e)}")
+            if is_permanent_failure(e):
+                return attempt + 1, e
+            if attempt < max_attempts - 1 and not is_connection_error(e):
+                time.sleep(backoff_delay(attempt, backoff_base, backoff_max))
+    return max_attempts, error
+
+class DeliveryReport:
+    def __init__(self):
+        """Initialize an empty per-recipient record of a delivery."""
+        self.results: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, recipient: str, sent: bool, attempts: int, error: Optional[str] = None):
+        """
+        Record the outcome for one recipient.
+
+        Args:
+            recipient (str): Recipient email address
+            sent (bool): Whether the message was accepted
+            attempts (int): Send attempts made
+            error (Optional[str]): Last error, if the message was not sent
+        """
+        with self._lock:
+            self.results[recipient] = {'sent': sent, 'attempts': attempts, 'error': error}
+
+    @property
+    def sent(self) -> List[str]:
+        return [recipient for recipient, result in self.results.items() if result['sent']]
+
+    @property
+    def failed(self) -> List[str]:
+        return [recipient for recipient, result in self.results.items() if not result['sent']]
+
+    @property
+    def all_sent(self) -> bool:
+        return not self.failed
+
+    @property
+    def any_sent(self) -> bool:
+        return bool(self.sent)
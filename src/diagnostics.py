@@ -0,0 +1,116 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+from datetime import datetime
+from typing import Optional
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Structured per-job events go to their own logger, silent unless a trace
+# file is configured, and never reach the console handlers
+trace_logger = logging.getLogger('career_searcher.trace')
+trace_logger.propagate = False
+trace_logger.setLevel(logging.CRITICAL + 1)
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        """Render a trace record as one JSON object per line."""
+        event = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(),
+            'event': record.getMessage()
+        }
+        event.update(getattr(record, 'fields', {}))
+        return json.dumps(event, ensure_ascii=False, default=str)
+
+def trace_enabled() -> bool:
+    """Check whether trace events are being recorded."""
+    return trace_logger.isEnabledFor(logging.INFO)
+
+def trace(event: str, **fields):
+    """
+    Record a structured trace event if tracing is on.
+
+    Callers building expensive fields should check trace_enabled() first.
+
+    Args:
+        event (str): Event name, e.g. 'job_scored'
+        **fields: JSON-serializable event fields
+    """
+    if trace_logger.isEnabledFor(logging.INFO):
+        trace_logger.info(event, extra={'fields': fields})
+
+def set_verbosity(verbose: bool):
+    """
+    Set console verbosity.
+
+    Per-job and per-page details are logged at DEBUG, so the default INFO
+    level keeps the scraping and matching hot paths silent.
+
+    Args:
+        verbose (bool): Whether to show DEBUG details
+    """
+    logging.getLogger().setLevel(logging.DEBUG if verbose else logging.INFO)
+
+class TraceWriter:
+    def __init__(self, path: str, buffer_size: int = 1000):
+        """
+        Write trace events to a JSON lines file off the hot path.
+
+        Events are put on an in-memory queue by the calling thread; a
+        background listener formats them and writes them to the file in
+        batches of buffer_size records.
+
+        Args:
+            path (str): Trace file, appended to
+            buffer_size (int): Records buffered before writing to the file
+        """
+        self.path = path
+        self._file_handler = logging.FileHandler(path, mode='a', encoding='utf-8')
+        self._file_handler.setFormatter(JsonLinesFormatter())
+        self._buffer = logging.handlers.MemoryHandler(
+            buffer_size, flushLevel=logging.CRITICAL + 1, target=self._file_handler
+        )
+        self._queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+        self._listener = logging.handlers.QueueListener(self._queue_handler.queue, self._buffer)
+        self._listener.start()
+        trace_logger.addHandler(self._queue_handler)
+        trace_logger.setLevel(logging.INFO)
+        atexit.register(self.close)
+        logger.info(f"Writing job trace to {path}")
+
+    def close(self):
+        """Stop tracing and write out every queued event."""
+        if self._listener is None:
+            return
+        trace_logger.removeHandler(self._queue_handler)
+        if not trace_logger.handlers:
+            trace_logger.setLevel(logging.CRITICAL + 1)
+        self._listener.stop()
+        self._listener = None
+        self._buffer.close()
+        self._file_handler.close()
+
+def start_trace(path: Optional[str]) -> Optional[TraceWriter]:
+    """
+    Start writing trace events to a file.
+
+    Args:
+        path (Optional[str]): Trace file, None to leave tracing off
+
+    Returns:
+        Optional[TraceWriter]: The writer to close when done, None if off
+    """
+    if not path:
+        return None
+    try:
+        return TraceWriter(path)
+    except OSError as e:
+        logger.error(f"Error opening trace file {path}: {str(e)}")
+        return None
@@ -1,13 +1,18 @@
+import html
 import json
-import smtplib
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, List
+from typing import Dict, List, Optional
 import logging
 from datetime import datetime
+from string import Template
 from dotenv import load_dotenv
-import pandas as pd
+from metrics import get_metrics
+from settings import load_settings
+from delivery import DEFAULT_DELIVERY_SETTINGS, DeliveryReport, SMTPConnectionPool, send_with_retry
 
 # Load environment variables
 load_dotenv()
@@ -19,6 +24,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Templates are compiled once at import; the table is rendered once per batch
+# and substituted into the body for each recipient
+EMAIL_TEMPLATE = Template("""
+        <html>
+            <head>
+                <style>
+                    table {
+                        border-collapse: collapse;
+                        width: 100%;
+                        margin: 20px 0;
+                    }
+                    th, td {
+                        padding: 12px;
+                        text-align: left;
+                        border-bottom: 1px solid #ddd;
+                    }
+                    th {
+                        background-color: #f2f2f2;
+                    }
+                    tr:hover {
+                        background-color: #f5f5f5;
+                    }
+                    a {
+                        color: #0066cc;
+                        text-decoration: none;
+                    }
+                    a:hover {
+                        text-decoration: underline;
+                    }
+                </style>
+            </head>
+            <body>
+                <h2>Hello $recipient_name,</h2>
+                <p>We found $job_count new job matches for you:</p>
+                $job_table
+                <p>Best regards,<br>Your Job Alert System</p>
+            </body>
+        </html>
+        """)
+TABLE_TEMPLATE = Template("""<table border="1" class="dataframe">
+  <thead>
+    <tr style="text-align: right;">
+      <th>title</th>
+      <th>company</th>
+      <th>location</th>
+      <th>url</th>
+      <th>match_score</th>
+    </tr>
+  </thead>
+  <tbody>
+$rows
+  </tbody>
+</table>""")
+ROW_TEMPLATE = Template("""    <tr>
+      <td>$title</td>
+      <td>$company</td>
+      <td>$location</td>
+      <td><a href="$url">Apply</a></td>
+      <td>$match_score</td>
+    </tr>""")
+
 class JobEmailer:
     def __init__(self, email_config_path: str = 'config/email_list.json'):
         """
@@ -33,6 +99,9 @@ class JobEmailer:
         self.email_user = os.getenv('EMAIL_USER')
         self.email_password = os.getenv('EMAIL_PASSWORD')
         self.sender_email = os.getenv('SENDER_EMAIL')
+        self.metrics = get_metrics()
+        self.delivery_settings = {**DEFAULT_DELIVERY_SETTINGS, **load_settings().get('email', {})}
+        self._pool: Optional[SMTPConnectionPool] = None
 
     def _load_config(self, config_path: str) -> Dict:
         """
@@ -59,73 +128,144 @@ class JobEmailer:
             jobs (List[Dict]): List of job listings
         
         Returns:
-            str: HTML formatted table
+            str: HTML formatted table, best matches first
         """
-        df = pd.DataFrame(jobs)
-        df = df[['title', 'company', 'location', 'url', 'match_score']]
-        df = df.sort_values('match_score', ascending=False)
-        
-        # Convert DataFrame to HTML table with styling
-        html_table = df.to_html(
-            index=False,
-            escape=False,
-            formatters={
-                'url': lambda x: f'<a href="{x}">Apply</a>',
-                'match_score': lambda x: f'{x:.2f}'
-            }
-        )
-        
-        return html_table
+        rows = [
+            ROW_TEMPLATE.substitute(
+                title=html.escape(str(job.get('title', ''))),
+                company=html.escape(str(job.get('company', ''))),
+                location=html.escape(str(job.get('location', ''))),
+                url=html.escape(str(job.get('url', ''))),
+                match_score=f"{job.get('match_score', 0):.2f}"
+            )
+            for job in sorted(jobs, key=lambda job: job.get('match_score', 0), reverse=True)
+        ]
+        return TABLE_TEMPLATE.substitute(rows="\n".join(rows))
 
-    def _create_email_content(self, jobs: List[Dict], recipient_name: str) -> str:
+    def _create_email_content(self, jobs: List[Dict], recipient_name: str,
+                              table_html: Optional[str] = None) -> str:
         """
         Create HTML email content.
         
         Args:
             jobs (List[Dict]): List of job listings
             recipient_name (str): Name of the recipient
+            table_html (Optional[str]): Table already rendered for these
+                jobs, rendered here if not given
         
         Returns:
             str: HTML formatted email content
         """
-        html_content = f"""
-        <html>
-            <head>
-                <style>
-                    table {{
-                        border-collapse: collapse;
-                        width: 100%;
-                        margin: 20px 0;
-                    }}
-                    th, td {{
-                        padding: 12px;
-                        text-align: left;
-                        border-bottom: 1px solid #ddd;
-                    }}
-                    th {{
-                        background-color: #f2f2f2;
-                    }}
-                    tr:hover {{
-                        background-color: #f5f5f5;
-                    }}
-                    a {{
-                        color: #0066cc;
-                        text-decoration: none;
-                    }}
-                    a:hover {{
-                        text-decoration: underline;
-                    }}
-                </style>
-            </head>
-            <body>
-                <h2>Hello {recipient_name},</h2>
-                <p>We found {len(jobs)} new job matches for you:</p>
-                {self._create_html_table(jobs)}
-                <p>Best regards,<br>Your Job Alert System</p>
-            </body>
-        </html>
+        if table_html is None:
+            table_html = self._create_html_table(jobs)
+        return EMAIL_TEMPLATE.substitute(
+            recipient_name=html.escape(recipient_name),
+            job_count=len(jobs),
+            job_table=table_html
+        )
+
+    def _get_pool(self) -> SMTPConnectionPool:
+        """Get the SMTP connection pool, creating it on first use."""
+        if self._pool is None:
+            self._pool = SMTPConnectionPool(
+                self.smtp_server, self.smtp_port, self.email_user, self.email_password,
+                size=self.delivery_settings['connections'],
+                timeout=self.delivery_settings['timeout'],
+                idle_check_seconds=self.delivery_settings['idle_check_seconds'],
+                auth_retry_seconds=self.delivery_settings['auth_retry_seconds']
+            )
+        return self._pool
+
+    def _create_message(self, jobs: List[Dict], recipient: Dict,
+                        table_html: Optional[str] = None) -> MIMEMultipart:
+        """
+        Create the notification email for one recipient.
+        
+        Args:
+            jobs (List[Dict]): List of job listings
+            recipient (Dict): Recipient with 'name' and 'email'
+            table_html (Optional[str]): Table already rendered for these jobs
+        
+        Returns:
+            MIMEMultipart: Email message
+        """
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = self.config['email_settings']['subject_template'].format(
+            new_matches=len(jobs)
+        )
+        msg['From'] = self.sender_email
+        msg['To'] = recipient['email']
+
+        with self.metrics.timer('email_render_seconds', part='body'):
+            html_content = self._create_email_content(jobs, recipient['name'], table_html)
+        msg.attach(MIMEText(html_content, 'html'))
+        return msg
+
+    def _send_to_recipient(self, jobs: List[Dict], recipient: Dict, report: DeliveryReport,
+                           table_html: Optional[str] = None):
+        """Send the notification to one recipient, with retries, and record the outcome."""
+        settings = self.delivery_settings
+        try:
+            msg = self._create_message(jobs, recipient, table_html)
+        except Exception as e:
+            logger.error(f"Error creating email for {recipient['email']}: {str(e)}")
+            report.record(recipient['email'], False, 0, str(e))
+            return
+
+        start = time.perf_counter()
+        attempts, error = send_with_retry(
+            self._get_pool(), msg,
+            max_attempts=settings['max_attempts'],
+            backoff_base=settings['backoff_base'],
+            backoff_max=settings['backoff_max']
+        )
+        self.metrics.observe('email_send_seconds', time.perf_counter() - start)
+        if attempts > 1:
+            self.metrics.inc('email_retries_total', attempts - 1)
+
+        if error is None:
+            self.metrics.inc('email_messages_total', status='sent')
+            logger.info(f"Sent notification to {recipient['email']}")
+            report.record(recipient['email'], True, attempts)
+        else:
+            self.metrics.inc('email_messages_total', status='failed')
+            logger.error(f"Failed to send notification to {recipient['email']} "
+                         f"after {attempts} attempts: {str(error)}")
+            report.record(recipient['email'], False, attempts, str(error))
+
+    def deliver(self, jobs: List[Dict], recipients: Optional[List[Dict]] = None) -> DeliveryReport:
+        """
+        Send the notification to every recipient over pooled connections.
+        
+        Recipients are sent to in parallel, one sender per pooled connection.
+        Each recipient is retried on its own, so one bad address or dropped
+        connection does not fail the others.
+        
+        Args:
+            jobs (List[Dict]): List of matching job listings
+            recipients (Optional[List[Dict]]): Recipients to send to,
+                defaults to every configured recipient
+        
+        Returns:
+            DeliveryReport: Outcome per recipient
         """
-        return html_content
+        report = DeliveryReport()
+        if recipients is None:
+            recipients = self.config.get('recipients', [])
+        if not recipients:
+            return report
+        # Every recipient gets the same table, so it is rendered once
+        with self.metrics.timer('email_render_seconds', part='table'):
+            table_html = self._create_html_table(jobs)
+        workers = min(self.delivery_settings['connections'], len(recipients))
+        if workers <= 1:
+            for recipient in recipients:
+                self._send_to_recipient(jobs, recipient, report, table_html)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for recipient in recipients:
+                    executor.submit(self._send_to_recipient, jobs, recipient, report, table_html)
+        return report
 
     def send_job_notifications(self, jobs: List[Dict]) -> bool:
         """
@@ -135,39 +275,22 @@ class JobEmailer:
             jobs (List[Dict]): List of matching job listings
         
         Returns:
-            bool: True if emails sent successfully, False otherwise
+            bool: True if every recipient was sent the email, False otherwise
         """
         if not jobs and not self.config['email_settings']['send_empty_notifications']:
             logger.info("No jobs to send and empty notifications disabled")
             return True
 
-        try:
-            # Create SMTP connection
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.email_user, self.email_password)
-
-            # Send to each recipient
-            for recipient in self.config['recipients']:
-                msg = MIMEMultipart('alternative')
-                msg['Subject'] = self.config['email_settings']['subject_template'].format(
-                    new_matches=len(jobs)
-                )
-                msg['From'] = self.sender_email
-                msg['To'] = recipient['email']
-
-                html_content = self._create_email_content(jobs, recipient['name'])
-                msg.attach(MIMEText(html_content, 'html'))
-
-                server.send_message(msg)
-                logger.info(f"Sent notification to {recipient['email']}")
-
-            server.quit()
-            return True
+        report = self.deliver(jobs)
+        if report.failed:
+            logger.error(f"Error sending email notifications to {', '.join(report.failed)}")
+        return report.all_sent
 
-        except Exception as e:
-            logger.error(f"Error sending email notifications: {str(e)}")
-            return False
+    def close(self):
+        """Close pooled SMTP connections."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
 if __name__ == "__main__":
     # Test emailer
@@ -181,4 +304,5 @@ if __name__ == "__main__":
             "match_score": 0.95
         }
     ]
-    emailer.send_job_notifications(test_jobs) 
\ No newline at end of file
+    emailer.send_job_notifications(test_jobs)
+    emailer.close()
\ No newline at end of file
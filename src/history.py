@@ -0,0 +1,465 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+from bloom import BloomFilter
+from job_identity import JobIdentity, canonicalize_url, job_key_for
+from settings import load_settings
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_key TEXT PRIMARY KEY,
+    url TEXT,
+    company TEXT,
+    title TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+DEFAULT_STATISTICS = {
+    "total_jobs_found": 0,
+    "total_notifications_sent": 0,
+    "last_notification_date": None
+}
+
+class JobHistory:
+    def __init__(self, db_path: str = 'data/job_history.db',
+                 legacy_path: Optional[str] = 'data/job_history.json',
+                 flush_every: int = 500, bloom_settings: Optional[Dict] = None,
+                 company_configs: Optional[List[Dict]] = None):
+        """
+        Open (or create) the job history store.
+
+        Jobs are kept in SQLite keyed by their canonical job key (see
+        job_identity), so membership checks and inserts touch only the rows
+        involved instead of the whole history. A legacy job_history.json is
+        imported the first time the store is created.
+
+        With a Bloom filter enabled, membership checks first ask the filter
+        and only query the database when it reports a possible hit, so
+        brand-new jobs never touch the database.
+
+        Args:
+            db_path (str): Path to the SQLite database
+            legacy_path (Optional[str]): JSON history to import into an empty store
+            flush_every (int): Number of buffered last-seen updates per write
+            bloom_settings (Optional[Dict]): ``history.bloom_filter`` settings;
+                the filter is used when 'enabled' is true
+            company_configs (Optional[List[Dict]]): Company configurations,
+                whose identity rules re-key jobs from older stores
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self.flush_every = flush_every
+        self._seen_buffer: List[str] = []
+        # Full sweeps finished in this run, written with the run's jobs
+        self._pending_sweeps: Dict[str, str] = {}
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._identities = [(JobIdentity(config), config) for config in company_configs or []]
+        self._unkeyable: Dict[str, int] = {}
+        self._rekeyed = self._migrate_url_keys()
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+
+        if legacy_path and len(self) == 0 and os.path.exists(legacy_path):
+            self._import_legacy(legacy_path)
+
+        self.bloom_settings = bloom_settings or {}
+        self.bloom: Optional[BloomFilter] = None
+        if self.bloom_settings.get('enabled'):
+            self._open_bloom()
+
+    def _migrate_url_keys(self) -> bool:
+        """
+        Re-key a store created before job keys existed.
+
+        Older stores used the raw URL as the primary key; each URL is
+        replaced by the key its company's identity rules give it, merging
+        rows that collapse together.
+
+        Returns:
+            bool: True if the store was migrated
+        """
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")]
+        if not columns or 'job_key' in columns:
+            return False
+
+        with self.conn:
+            self.conn.execute("ALTER TABLE jobs RENAME TO jobs_by_url")
+            self.conn.executescript(SCHEMA)
+            rows = self.conn.execute(
+                "SELECT url, company, title, first_seen, last_seen FROM jobs_by_url"
+            ).fetchall()
+            self.conn.executemany(
+                "INSERT INTO jobs (job_key, url, company, title, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(job_key) DO UPDATE SET "
+                "first_seen = MIN(first_seen, excluded.first_seen), "
+                "last_seen = MAX(last_seen, excluded.last_seen)",
+                ((self._legacy_key(url, company, title)[0], url, company, title, first_seen, last_seen)
+                 for url, company, title, first_seen, last_seen in rows)
+            )
+            self.conn.execute("DROP TABLE jobs_by_url")
+        logger.info(f"Migrated {len(rows)} tracked jobs to canonical job keys")
+        self._warn_unkeyable()
+        return True
+
+    def _legacy_key(self, url: str, company: Optional[str] = None,
+                    title: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """
+        Compute the job key of a job tracked before job keys existed.
+
+        The job's company is looked up by name, or by the longest base or
+        career URL the job URL starts with, and its identity rules are
+        applied as at scrape time. Older stores kept no locations, so jobs
+        of companies using the 'hash' strategy, and jobs of unknown
+        companies, get a plain canonical URL key.
+
+        Args:
+            url (str): Job URL
+            company (Optional[str]): Company name, if stored
+            title (Optional[str]): Job title, if stored
+
+        Returns:
+            Tuple[str, Optional[str]]: Job key, and the company name if known
+        """
+        match = None
+        if company:
+            match = next((identity for identity, config in self._identities
+                          if config['name'] == company), None)
+        else:
+            longest = 0
+            for identity, config in self._identities:
+                for prefix in (config.get('base_url'), config.get('career_url')):
+                    if prefix and url.startswith(prefix) and len(prefix) > longest:
+                        match, longest = identity, len(prefix)
+        if match is None:
+            return canonicalize_url(url), company
+        if match.strategy == 'hash':
+            self._unkeyable[match.company] = self._unkeyable.get(match.company, 0) + 1
+            return canonicalize_url(url), match.company
+        return match.key_for(url, title, None), match.company
+
+    def _warn_unkeyable(self):
+        for company, count in self._unkeyable.items():
+            logger.warning(f"{count} tracked {company} jobs could not be re-keyed with the 'hash' "
+                           f"strategy, which needs locations; they may be reported as new once")
+        self._unkeyable.clear()
+
+    def _open_bloom(self):
+        """Open the Bloom filter, rebuilding it if it is missing, stale or full."""
+        path = self.bloom_settings.get('path', 'data/job_history.bloom')
+        rate = self.bloom_settings.get('false_positive_rate', 0.01)
+        try:
+            # A missing file is created with the configured sizing
+            self.bloom = BloomFilter(path, self.bloom_settings.get('capacity', 100000), rate)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Rebuilding unreadable Bloom filter: {str(e)}")
+            self.rebuild_bloom()
+            return
+
+        job_count = len(self)
+        # Keys are added to the filter before the database, so a filter that
+        # counts fewer keys than the database has missed some and is unsafe
+        if (self._rekeyed or self.bloom.count < job_count or self.bloom.count > self.bloom.capacity
+                or self.bloom.false_positive_rate != rate):
+            self.rebuild_bloom()
+
+    def rebuild_bloom(self) -> BloomFilter:
+        """
+        Rebuild the Bloom filter from every job key in the database.
+
+        The new filter is sized for twice the current history (at least the
+        configured capacity) so it has room to grow.
+
+        Returns:
+            BloomFilter: The rebuilt filter
+        """
+        path = self.bloom_settings.get('path', 'data/job_history.bloom')
+        rate = self.bloom_settings.get('false_positive_rate', 0.01)
+        with self._lock:
+            if self.bloom is not None:
+                self.bloom.close()
+            job_count = len(self)
+            capacity = max(self.bloom_settings.get('capacity', 100000), job_count * 2)
+            keys = (row[0] for row in self.conn.execute("SELECT job_key FROM jobs"))
+            self.bloom = BloomFilter.build(path, keys, capacity, rate)
+        logger.info(f"Rebuilt Bloom filter for {job_count} jobs (capacity {capacity}, false positive rate {rate})")
+        return self.bloom
+
+    def _import_legacy(self, legacy_path: str):
+        """
+        Import tracked jobs and statistics from the old JSON history file.
+
+        Args:
+            legacy_path (str): Path to job_history.json
+        """
+        try:
+            with open(legacy_path, 'r') as f:
+                legacy = json.load(f)
+        except Exception as e:
+            logger.error(f"Error reading legacy job history: {str(e)}")
+            return
+
+        imported_at = legacy.get('last_update') or datetime.now().isoformat()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (job_key, company, url, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((*self._legacy_key(url), url, imported_at, imported_at)
+                 for url in legacy.get('tracked_jobs', []))
+            )
+            self._set_meta('statistics', {**DEFAULT_STATISTICS, **legacy.get('statistics', {})})
+            self._set_meta('last_update', legacy.get('last_update'))
+        logger.info(f"Imported {len(legacy.get('tracked_jobs', []))} jobs from {legacy_path}")
+        self._warn_unkeyable()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def __contains__(self, job_key: str) -> bool:
+        if self.bloom is not None and job_key not in self.bloom:
+            return False
+        with self._lock:
+            return self.conn.execute(
+                "SELECT 1 FROM jobs WHERE job_key = ?", (job_key,)
+            ).fetchone() is not None
+
+    def _get_meta(self, key: str, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def _set_meta(self, key: str, value):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value))
+        )
+
+    def mark_seen(self, job_key: str):
+        """
+        Record that an already tracked job was seen again in this run.
+
+        Updates are buffered and written in batches.
+
+        Args:
+            job_key (str): Canonical key of the job
+        """
+        with self._lock:
+            self._seen_buffer.append(job_key)
+            if len(self._seen_buffer) >= self.flush_every:
+                self.flush()
+
+    def flush(self):
+        """Write buffered last-seen updates in one transaction."""
+        with self._lock:
+            if not self._seen_buffer:
+                return
+            now = datetime.now().isoformat()
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE jobs SET last_seen = ? WHERE job_key = ?",
+                    ((now, job_key) for job_key in self._seen_buffer)
+                )
+            self._seen_buffer = []
+
+    def add_jobs(self, jobs: Iterable[Dict]) -> int:
+        """
+        Track new jobs in one atomic transaction.
+
+        Jobs that are already tracked only get their last-seen time updated.
+
+        Args:
+            jobs (Iterable[Dict]): Job listings to track
+
+        Returns:
+            int: Number of jobs written
+        """
+        with self._lock, self.conn:
+            return self._insert_jobs(jobs, datetime.now().isoformat())
+
+    def _insert_jobs(self, jobs: Iterable[Dict], now: str) -> int:
+        """Upsert jobs; the caller owns the transaction."""
+        rows = [(job_key_for(job), job['url'], job.get('company'), job.get('title'), now, now)
+                for job in jobs]
+        if self.bloom is not None:
+            self.bloom.update(row[0] for row in rows)
+            self.bloom.flush()
+        self.conn.executemany(
+            "INSERT INTO jobs (job_key, url, company, title, first_seen, last_seen) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(job_key) DO UPDATE SET url = excluded.url, last_seen = excluded.last_seen",
+            rows
+        )
+        return len(rows)
+
+    def get_job(self, job_key: str) -> Optional[Dict]:
+        """
+        Look up a tracked job.
+
+        Args:
+            job_key (str): Canonical key of the job
+
+        Returns:
+            Optional[Dict]: Stored job with first/last-seen times, None if untracked
+        """
+        columns = ('job_key', 'url', 'company', 'title', 'first_seen', 'last_seen')
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT {', '.join(columns)} FROM jobs WHERE job_key = ?", (job_key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(columns, row))
+
+    @property
+    def statistics(self) -> Dict:
+        with self._lock:
+            return self._get_meta('statistics', dict(DEFAULT_STATISTICS))
+
+    @property
+    def last_update(self) -> Optional[str]:
+        with self._lock:
+            return self._get_meta('last_update')
+
+    def last_full_sweep(self, company: str) -> Optional[str]:
+        """
+        When every page of a company's board was last crawled.
+
+        Args:
+            company (str): Company name
+
+        Returns:
+            Optional[str]: ISO timestamp, None if the board was never swept
+        """
+        with self._lock:
+            return self._get_meta('full_sweeps', {}).get(company)
+
+    def note_full_sweep(self, company: str):
+        """
+        Note that every page of a company's board was just crawled.
+
+        The sweep is written by the next ``record_seen``, together with the
+        jobs it found, so a run that fails before its jobs are tracked does
+        not move the company's next full sweep back.
+
+        Args:
+            company (str): Company name
+        """
+        with self._lock:
+            self._pending_sweeps[company] = datetime.now().isoformat()
+
+    def discard_full_sweeps(self):
+        """Forget sweeps noted in a run whose jobs will not be tracked."""
+        with self._lock:
+            self._pending_sweeps = {}
+
+    def record_seen(self, jobs: Iterable[Dict]) -> int:
+        """
+        Track a run's new jobs and its full sweeps in one transaction.
+
+        Jobs are tracked whether or not they matched, so later incremental
+        crawls recognise pages of jobs nobody was notified about.
+
+        Args:
+            jobs (Iterable[Dict]): Jobs to track as seen
+
+        Returns:
+            int: Number of jobs written
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            self.flush()
+            with self.conn:
+                written = self._insert_jobs(jobs, now)
+                if self._pending_sweeps:
+                    sweeps = self._get_meta('full_sweeps', {})
+                    sweeps.update(self._pending_sweeps)
+                    self._set_meta('full_sweeps', sweeps)
+            self._pending_sweeps = {}
+            return written
+
+    def record_run(self, new_jobs: List[Dict]):
+        """
+        Update statistics for a run whose matches were emailed.
+
+        Args:
+            new_jobs (List[Dict]): Jobs found for the first time in this run
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            statistics = self.statistics
+            statistics['total_jobs_found'] += len(new_jobs)
+            if new_jobs:
+                statistics['total_notifications_sent'] += 1
+                statistics['last_notification_date'] = now
+            with self.conn:
+                self._set_meta('statistics', statistics)
+                self._set_meta('last_update', now)
+
+    def close(self):
+        """Flush pending updates and close the database and Bloom filter."""
+        with self._lock:
+            self.flush()
+            self.conn.close()
+            if self.bloom is not None:
+                self.bloom.close()
+
+def open_job_history(settings: Optional[Dict] = None,
+                     company_configs: Optional[List[Dict]] = None) -> JobHistory:
+    """
+    Open the job history store configured in settings.
+
+    Args:
+        settings (Optional[Dict]): ``history`` settings
+        company_configs (Optional[List[Dict]]): Company configurations, for
+            re-keying jobs from older stores
+
+    Returns:
+        JobHistory: Opened history store
+    """
+    settings = settings or {}
+    return JobHistory(
+        db_path=settings.get('db_path', 'data/job_history.db'),
+        legacy_path=settings.get('legacy_path', 'data/job_history.json'),
+        bloom_settings=settings.get('bloom_filter'),
+        company_configs=company_configs
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Job history maintenance")
+    parser.add_argument('--rebuild-bloom', action='store_true',
+                        help="Rebuild the Bloom filter from the history database")
+    args = parser.parse_args()
+
+    history_settings = load_settings().get('history', {})
+    from scraper import load_company_configs
+    history = open_job_history(history_settings, load_company_configs())
+    try:
+        if args.rebuild_bloom:
+            history.bloom_settings = {**history.bloom_settings, 'enabled': True}
+            history.rebuild_bloom()
+        print(f"Tracked jobs: {len(history)}")
+        print(f"Statistics: {history.statistics}")
+    finally:
+        history.close()
@@ -0,0 +1,248 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+import logging
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+class HTTPCache:
+    def __init__(self, cache_dir: str = 'data/http_cache', max_size_mb: float = 50,
+                 max_age_days: float = 7):
+        """
+        Initialize an on-disk cache of career page responses.
+
+        Each entry keeps the validators (ETag, Last-Modified) and a hash of
+        the body so unchanged pages can be detected, plus the jobs parsed from
+        the page so they can be reused without parsing again.
+
+        Args:
+            cache_dir (str): Directory holding the index and cached bodies
+            max_size_mb (float): Total body size kept before evicting
+            max_age_days (float): Age after which entries are dropped
+        """
+        self.cache_dir = cache_dir
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.max_age_seconds = max_age_days * 24 * 3600
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self._lock = threading.Lock()
+        self._dirty = False
+        os.makedirs(cache_dir, exist_ok=True)
+        self.entries = self._load_index()
+        self.evict()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """
+        Load the cache index from disk.
+
+        Returns:
+            Dict[str, Dict]: Cache entries keyed by URL hash
+        """
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Error loading HTTP cache index, starting empty: {str(e)}")
+            return {}
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.html")
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build the conditional request headers for a URL.
+
+        Args:
+            url (str): URL about to be requested
+
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since headers, if known
+        """
+        entry = self.entries.get(self._key(url))
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def revalidate(self, url: str) -> Optional[str]:
+        """
+        Mark a cached entry as still fresh after a 304 response.
+
+        Args:
+            url (str): URL that returned 304 Not Modified
+
+        Returns:
+            Optional[str]: Cached body, None if it is no longer on disk
+        """
+        key = self._key(url)
+        try:
+            with open(self._body_path(key), 'r', encoding='utf-8') as f:
+                body = f.read()
+        except OSError:
+            with self._lock:
+                self.entries.pop(key, None)
+                self._dirty = True
+            return None
+        with self._lock:
+            if key in self.entries:
+                self.entries[key]['stored_at'] = time.time()
+                self._dirty = True
+        return body
+
+    def store(self, url: str, body: str, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> bool:
+        """
+        Store a freshly downloaded response.
+
+        Args:
+            url (str): Requested URL
+            body (str): Response body
+            etag (Optional[str]): ETag header
+            last_modified (Optional[str]): Last-Modified header
+
+        Returns:
+            bool: True if the body is identical to the cached one
+        """
+        key = self._key(url)
+        body_hash = hashlib.sha256(body.encode('utf-8')).hexdigest()
+        with self._lock:
+            previous = self.entries.get(key)
+            unchanged = previous is not None and previous['body_hash'] == body_hash
+            entry = {
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'body_hash': body_hash,
+                'size': len(body),
+                'stored_at': time.time(),
+                'parsed': previous.get('parsed') if unchanged else None
+            }
+            self.entries[key] = entry
+            self._dirty = True
+
+        if not unchanged:
+            try:
+                with open(self._body_path(key), 'w', encoding='utf-8') as f:
+                    f.write(body)
+            except OSError as e:
+                logger.error(f"Error writing cached body for {url}: {str(e)}")
+        return unchanged
+
+    def get_parsed(self, url: str, parser_key: str) -> Optional[Dict]:
+        """
+        Get the parse result stored for a URL.
+
+        Args:
+            url (str): Page URL
+            parser_key (str): Hash of the selectors the result was parsed with
+
+        Returns:
+            Optional[Dict]: Stored page result, None if missing or parsed
+                with different selectors
+        """
+        entry = self.entries.get(self._key(url))
+        if not entry or not entry.get('parsed'):
+            return None
+        if entry['parsed'].get('parser_key') != parser_key:
+            return None
+        return entry['parsed']['result']
+
+    def store_parsed(self, url: str, parser_key: str, result: Dict):
+        """
+        Store the parse result for a cached URL.
+
+        Args:
+            url (str): Page URL
+            parser_key (str): Hash of the selectors used to parse
+            result (Dict): Page result to reuse while the page is unchanged
+        """
+        key = self._key(url)
+        with self._lock:
+            if key in self.entries:
+                self.entries[key]['parsed'] = {'parser_key': parser_key, 'result': result}
+                self._dirty = True
+
+    def evict(self):
+        """Drop entries older than the max age, then the oldest until under the size limit."""
+        with self._lock:
+            now = time.time()
+            expired = {key for key, entry in self.entries.items()
+                       if now - entry['stored_at'] > self.max_age_seconds}
+
+            remaining = sorted(
+                (item for item in self.entries.items() if item[0] not in expired),
+                key=lambda item: item[1]['stored_at']
+            )
+            total_size = sum(entry['size'] for _, entry in remaining)
+            for key, entry in remaining:
+                if total_size <= self.max_size_bytes:
+                    break
+                expired.add(key)
+                total_size -= entry['size']
+
+            for key in expired:
+                del self.entries[key]
+                try:
+                    os.remove(self._body_path(key))
+                except OSError:
+                    pass
+            if expired:
+                self._dirty = True
+                logger.info(f"Evicted {len(expired)} HTTP cache entries")
+
+    def save(self):
+        """Evict stale entries and atomically write the index to disk."""
+        self.evict()
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = f"{self.index_path}.tmp"
+            try:
+                with open(tmp_path, 'w') as f:
+                    json.dump(self.entries, f)
+                os.replace(tmp_path, self.index_path)
+                self._dirty = False
+            except OSError as e:
+                logger.error(f"Error saving HTTP cache index: {str(e)}")
+
+_shared_cache: Optional[HTTPCache] = None
+_shared_cache_lock = threading.Lock()
+
+def get_http_cache(settings: Optional[Dict] = None) -> Optional[HTTPCache]:
+    """
+    Get the process-wide HTTP cache shared by all scrapers.
+
+    Args:
+        settings (Optional[Dict]): ``http_cache`` settings, used on first call only
+
+    Returns:
+        Optional[HTTPCache]: Shared cache, None if disabled in settings
+    """
+    global _shared_cache
+    settings = settings or {}
+    if not settings.get('enabled', True):
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = HTTPCache(
+                cache_dir=settings.get('directory', 'data/http_cache'),
+                max_size_mb=settings.get('max_size_mb', 50),
+                max_age_days=settings.get('max_age_days', 7)
+            )
+        return _shared_cache
@@ -0,0 +1,138 @@
+import hashlib
+import re
+from typing import Dict, Iterable, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that never identify a posting: tracking, sessions, paging
+DEFAULT_STRIP_PARAMS = {
+    'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', 'src', 'source', 'ref', 'referrer',
+    'sessionid', 'session_id', 'jsessionid', 'sid', 'page'
+}
+STRIP_PARAM_PREFIXES = ('utm_',)
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+# Path parameters such as ;jsessionid=... appended to a path segment
+_PATH_PARAMS = re.compile(r';[^/]*')
+
+def canonicalize_url(url: str, strip_params: Optional[Iterable[str]] = None,
+                     keep_params: Optional[Iterable[str]] = None) -> str:
+    """
+    Normalize a job URL so the same posting always yields the same string.
+
+    The scheme and host are lowercased, default ports, fragments, path
+    parameters and trailing slashes are dropped, tracking/session/paging
+    query parameters are removed and the rest are sorted.
+
+    Args:
+        url (str): Job URL
+        strip_params (Optional[Iterable[str]]): Query parameters to drop,
+            defaults to DEFAULT_STRIP_PARAMS
+        keep_params (Optional[Iterable[str]]): If given, keep only these
+            query parameters
+
+    Returns:
+        str: Canonical URL
+    """
+    strip = {p.lower() for p in (DEFAULT_STRIP_PARAMS if strip_params is None else strip_params)}
+    keep = {p.lower() for p in keep_params} if keep_params else None
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = _PATH_PARAMS.sub('', parts.path)
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = []
+    for name, value in parse_qsl(parts.query, keep_blank_values=True):
+        lowered = name.lower()
+        if keep is not None:
+            if lowered in keep:
+                query.append((name, value))
+        elif lowered not in strip and not lowered.startswith(STRIP_PARAM_PREFIXES):
+            query.append((name, value))
+    query.sort()
+
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+def _normalize_text(value: Optional[str]) -> str:
+    return ' '.join((value or '').lower().split())
+
+class JobIdentity:
+    def __init__(self, company_config: Dict):
+        """
+        Initialize job key extraction for one company.
+
+        The company's optional ``identity`` block picks the strategy:
+        'url' (canonical URL, the default), 'requisition_id' (an ID pulled
+        from the URL with ``requisition_pattern``, falling back to the URL)
+        or 'hash' (company, title and location). ``strip_params`` and
+        ``keep_params`` tune URL canonicalization.
+
+        Args:
+            company_config (Dict): Configuration for the company
+        """
+        rules = company_config.get('identity', {})
+        self.company = company_config['name']
+        self.strategy = rules.get('strategy', 'url')
+
+        pattern = rules.get('requisition_pattern')
+        self.requisition_pattern = re.compile(pattern) if pattern else None
+
+        strip_params: Set[str] = set(DEFAULT_STRIP_PARAMS) | set(rules.get('strip_params', []))
+        page_param = company_config.get('pagination', {}).get('param_name')
+        if page_param:
+            strip_params.add(page_param)
+        self.strip_params = strip_params
+        self.keep_params = rules.get('keep_params')
+
+    def job_key(self, job: Dict) -> str:
+        """
+        Compute the canonical key identifying a job posting.
+
+        Args:
+            job (Dict): Job listing with 'url', 'title' and 'location'
+
+        Returns:
+            str: Canonical job key
+        """
+        return self.key_for(job['url'], job.get('title'), job.get('location'))
+
+    def key_for(self, url: str, title: Optional[str], location: Optional[str]) -> str:
+        """
+        Compute the canonical key from a job's fields, before it is built.
+
+        Args:
+            url (str): Absolute job URL
+            title (Optional[str]): Job title
+            location (Optional[str]): Job location
+
+        Returns:
+            str: Canonical job key
+        """
+        if self.strategy == 'hash':
+            fingerprint = '|'.join(_normalize_text(value) for value in (self.company, title, location))
+            digest = hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()
+            return f"hash:{digest}"
+
+        if self.strategy == 'requisition_id' and self.requisition_pattern is not None:
+            match = self.requisition_pattern.search(url)
+            if match:
+                requisition_id = match.group(1) if match.groups() else match.group(0)
+                return f"req:{_normalize_text(self.company)}:{requisition_id.lower()}"
+
+        return canonicalize_url(url, self.strip_params, self.keep_params)
+
+def job_key_for(job: Dict) -> str:
+    """
+    Get a job's canonical key, computing a URL-based one if the job has none.
+
+    Args:
+        job (Dict): Job listing
+
+    Returns:
+        str: Canonical job key
+    """
+    return job.get('job_key') or canonicalize_url(job['url'])
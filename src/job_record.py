@@ -0,0 +1,109 @@
+import sys
+from dataclasses import dataclass, fields, replace
+from typing import Dict, Iterator, Mapping, Optional, Union
+
+@dataclass(frozen=True, slots=True)
+class JobRecord:
+    """
+    A scraped job posting.
+
+    Records are slotted and immutable, so a crawl holding hundreds of
+    thousands of postings carries no per-job dict. Company and location
+    strings are interned, so every posting of a company, and every posting
+    in the same city, shares one string; jobs parsed from the same page
+    share one scrape timestamp. Records read like the job dicts they
+    replace (``job['title']``, ``job.get('match_score')``, ``{**job}``), and
+    ``to_dict`` converts them where JSON or email templates need a dict.
+    """
+    title: str
+    location: str
+    url: str
+    company: str
+    scraped_date: str
+    job_key: str
+    match_score: Optional[float] = None
+
+    @classmethod
+    def create(cls, title: str, location: str, url: str, company: str,
+               scraped_date: str, job_key: str) -> 'JobRecord':
+        """
+        Build a record, interning the strings repeated across postings.
+
+        Args:
+            title (str): Job title
+            location (str): Job location
+            url (str): Absolute job URL
+            company (str): Company name
+            scraped_date (str): ISO timestamp of the page the job was on
+            job_key (str): Canonical job key
+
+        Returns:
+            JobRecord: New record
+        """
+        return cls(title, sys.intern(location), url, sys.intern(company), scraped_date, job_key)
+
+    @classmethod
+    def from_dict(cls, job: Mapping, scraped_date: Optional[str] = None) -> 'JobRecord':
+        """
+        Build a record from a job dict, e.g. one stored in the HTTP cache.
+
+        Args:
+            job (Mapping): Job with 'title', 'location', 'url', 'company'
+                and 'job_key' keys
+            scraped_date (Optional[str]): Timestamp overriding the stored one
+
+        Returns:
+            JobRecord: New record
+        """
+        record = cls.create(job['title'], job['location'], job['url'], job['company'],
+                            scraped_date or job.get('scraped_date', ''), job['job_key'])
+        if job.get('match_score') is not None:
+            record = record.with_score(job['match_score'])
+        return record
+
+    def with_score(self, score: float) -> 'JobRecord':
+        """Copy of the record with a match score; the strings are shared, not copied."""
+        return replace(self, match_score=score)
+
+    def to_dict(self) -> Dict:
+        """
+        Convert to a plain dict for JSON and email templates.
+
+        Returns:
+            Dict: Job fields, without 'match_score' if the job is unscored
+        """
+        job = {name: getattr(self, name) for name in _FIELD_NAMES}
+        if self.match_score is None:
+            del job['match_score']
+        return job
+
+    def keys(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __getitem__(self, key: str):
+        if key not in _FIELD_NAMES or (key == 'match_score' and self.match_score is None):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _FIELD_NAMES and (key != 'match_score' or self.match_score is not None)
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
+
+_FIELD_NAMES = tuple(field.name for field in fields(JobRecord))
+
+def with_match_score(job: Union[JobRecord, Dict], score: float) -> Union[JobRecord, Dict]:
+    """
+    Attach a match score to a job without modifying it.
+
+    Args:
+        job (Union[JobRecord, Dict]): Scraped record or plain job dict
+        score (float): Rounded match score
+
+    Returns:
+        Union[JobRecord, Dict]: Scored copy of the same type
+    """
+    if isinstance(job, JobRecord):
+        return job.with_score(score)
+    return {**job, 'match_score': score}
@@ -0,0 +1,108 @@
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+class KeywordHit(NamedTuple):
+    start: int
+    end: int
+    term: str
+    category: str
+
+    def is_whole_words(self, text: str) -> bool:
+        """
+        Check whether the hit starts and ends on word boundaries.
+
+        Args:
+            text (str): Whitespace-normalized text the hit was found in
+
+        Returns:
+            bool: True if the hit is a contiguous span of whole words
+        """
+        return ((self.start == 0 or text[self.start - 1] == ' ')
+                and (self.end == len(text) or text[self.end] == ' '))
+
+class KeywordAutomaton:
+    def __init__(self):
+        """
+        Initialize an empty Aho-Corasick automaton.
+
+        Terms from any number of categories are compiled into one automaton,
+        so a single pass over a text reports every occurrence of every term,
+        with its position and category, in time linear in the text length.
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Terms ending at each state, and those plus the terms reachable
+        # through failure links (filled in by build)
+        self._terms: List[List[Tuple[str, str]]] = [[]]
+        self._outputs: List[List[Tuple[str, str]]] = [[]]
+        self._built = True
+
+    def add(self, term: str, category: str):
+        """
+        Add a term under a category.
+
+        Args:
+            term (str): Term to find, matched case-sensitively
+            category (str): Category reported with each hit
+        """
+        if not term:
+            return
+        state = 0
+        for char in term:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._terms.append([])
+            state = next_state
+        if (term, category) not in self._terms[state]:
+            self._terms[state].append((term, category))
+        self._built = False
+
+    def add_all(self, terms: Iterable[str], category: str):
+        """Add several terms under the same category."""
+        for term in terms:
+            self.add(term, category)
+
+    def build(self):
+        """Compute failure links; called automatically before searching."""
+        self._outputs = [list(terms) for terms in self._terms]
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+        self._built = True
+
+    def search(self, text: str) -> List[KeywordHit]:
+        """
+        Find every occurrence of every term in a text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            List[KeywordHit]: Hits in order of their end position
+        """
+        if not self._built:
+            self.build()
+        hits = []
+        state = 0
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for term, category in outputs[state]:
+                hits.append(KeywordHit(position + 1 - len(term), position + 1, term, category))
+        return hits
@@ -1,9 +1,19 @@
-import json
+import argparse
 import logging
-from datetime import datetime
-from scraper import scrape_all_companies
-from matcher import JobMatcher
+import time
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from scraper import iter_all_companies, load_company_configs
+from history import JobHistory, open_job_history
+from job_identity import job_key_for
+from job_record import with_match_score
+from settings import load_settings
+from matcher import JobMatcher, MultiProfileMatcher
+from profiles import load_profiles
 from emailer import JobEmailer
+from daemon import CrawlDaemon
+from diagnostics import set_verbosity, start_trace
+from metrics import export_metrics, get_metrics
 
 # Set up logging
 logging.basicConfig(
@@ -12,77 +22,190 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def load_job_history(history_path: str = 'data/job_history.json'):
-    """Load previously tracked jobs."""
-    try:
-        with open(history_path, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {
-            "tracked_jobs": [],
-            "last_update": None,
-            "statistics": {
-                "total_jobs_found": 0,
-                "total_notifications_sent": 0,
-                "last_notification_date": None
-            }
-        }
-
-def save_job_history(history: dict, history_path: str = 'data/job_history.json'):
-    """Save updated job history."""
-    with open(history_path, 'w') as f:
-        json.dump(history, f, indent=4)
-
-def update_job_history(history: dict, new_jobs: list):
-    """Update job history with new jobs."""
-    # Add new job URLs to tracked jobs
-    current_urls = set(history['tracked_jobs'])
-    new_urls = {job['url'] for job in new_jobs}
-    history['tracked_jobs'] = list(current_urls | new_urls)
+def iter_new_jobs(jobs: Iterable[Dict], history: JobHistory) -> Iterator[Dict]:
+    """Yield only jobs that have not been seen before, marking the rest as seen."""
+    # Keys yielded in this run, so a posting listed twice is only new once
+    run_keys = set()
+    for job in jobs:
+        job_key = job_key_for(job)
+        if job_key in history:
+            history.mark_seen(job_key)
+        elif job_key not in run_keys:
+            run_keys.add(job_key)
+            yield job
+
+def filter_new_jobs(jobs: list, history: JobHistory) -> list:
+    """Filter out previously seen jobs."""
+    return list(iter_new_jobs(jobs, history))
+
+def _count(jobs: Iterable[Dict], counts: Counter, key: str) -> Iterator[Dict]:
+    """Pass jobs through unchanged while counting them under key."""
+    for job in jobs:
+        counts[key] += 1
+        yield job
+
+def _collect(jobs: Iterable[Dict], sink: list) -> Iterator[Dict]:
+    """Pass jobs through unchanged while appending them to sink."""
+    for job in jobs:
+        sink.append(job)
+        yield job
+
+def create_matcher(profiles: Dict[str, Dict]) -> Union[JobMatcher, MultiProfileMatcher]:
+    """
+    Create the matcher for a set of criteria profiles.
+    
+    A single profile keeps JobMatcher's score cache and parallel matching;
+    several profiles are matched together in one pass.
     
-    # Update statistics
-    history['statistics']['total_jobs_found'] += len(new_jobs)
-    if new_jobs:
-        history['statistics']['total_notifications_sent'] += 1
-        history['statistics']['last_notification_date'] = datetime.now().isoformat()
+    Args:
+        profiles (Dict[str, Dict]): Search criteria by profile name
     
-    history['last_update'] = datetime.now().isoformat()
-    return history
+    Returns:
+        Union[JobMatcher, MultiProfileMatcher]: Matcher for the profiles
+    """
+    if len(profiles) == 1:
+        return JobMatcher(criteria=next(iter(profiles.values())))
+    return MultiProfileMatcher(profiles)
 
-def filter_new_jobs(jobs: list, history: dict) -> list:
-    """Filter out previously seen jobs."""
-    tracked_urls = set(history['tracked_jobs'])
-    return [job for job in jobs if job['url'] not in tracked_urls]
+def match_profiles(jobs: Iterable[Dict], profiles: Dict[str, Dict],
+                   matcher: Optional[Union[JobMatcher, MultiProfileMatcher]] = None
+                   ) -> Iterator[Tuple[Dict, Dict[str, float]]]:
+    """
+    Match jobs against every criteria profile in one pass.
+    
+    Args:
+        jobs (Iterable[Dict]): Job listings to match
+        profiles (Dict[str, Dict]): Search criteria by profile name
+        matcher (Optional[Union[JobMatcher, MultiProfileMatcher]]): Matcher
+            created by create_matcher for these profiles, created here if not given
+    
+    Yields:
+        Tuple[Dict, Dict[str, float]]: Matching job and its score for each
+            profile it matches
+    """
+    if matcher is None:
+        matcher = create_matcher(profiles)
+    if isinstance(matcher, MultiProfileMatcher):
+        yield from matcher.iter_matches(jobs)
+        return
+    name = next(iter(profiles))
+    for job in matcher.iter_matches(jobs):
+        yield job, {name: job['match_score']}
 
-def main():
-    """Main function to orchestrate the job search process."""
-    try:
-        logger.info("Starting job search process")
+def deliver_matches(matches: Iterable[Tuple[Dict, Dict[str, float]]], emailer: JobEmailer,
+                    recipients_by_profile: Dict[str, List[Dict]],
+                    batch_size: int) -> Tuple[int, Set[str], Set[str]]:
+    """
+    Email each profile's recipients the jobs that matched their profile.
+    
+    Jobs are batched per profile and every batch is rendered once for all
+    of the profile's recipients.
+    
+    Args:
+        matches (Iterable[Tuple[Dict, Dict[str, float]]]): Matches with
+            their scores by profile
+        emailer (JobEmailer): Emailer to send with
+        recipients_by_profile (Dict[str, List[Dict]]): Recipients of each profile
+        batch_size (int): Maximum jobs per email
+    
+    Returns:
+        Tuple[int, Set[str], Set[str]]: Number of matching jobs, keys of
+            the matches that reached none of their recipients, and the
+            recipients that could not be sent to
+    """
+    pending: Dict[str, List[Dict]] = {name: [] for name in recipients_by_profile}
+    matched_keys, delivered_keys, failed_recipients = set(), set(), set()
+
+    def send(name: str):
+        batch, pending[name] = pending[name], []
+        report = emailer.deliver(batch, recipients_by_profile[name])
+        failed_recipients.update(report.failed)
+        if report.any_sent or not report.results:
+            delivered_keys.update(job_key_for(job) for job in batch)
+
+    for job, scores in matches:
+        matched_keys.add(job_key_for(job))
+        for name, score in scores.items():
+            pending[name].append(with_match_score(job, score))
+            if len(pending[name]) >= batch_size:
+                send(name)
+    for name in pending:
+        if pending[name]:
+            send(name)
+
+    return len(matched_keys), matched_keys - delivered_keys, failed_recipients
+
+class JobPipeline:
+    def __init__(self, settings: Dict):
+        """
+        Open the history, emailer and matcher that new jobs flow through.
+        
+        They stay open across calls to process, so a long-running process
+        keeps the history index, SMTP connections and matcher warm.
+        
+        Args:
+            settings (Dict): Runtime settings
+        """
+        self.history = open_job_history(settings.get('history'), load_company_configs())
+        self.emailer = JobEmailer()
+        self.batch_size = self.emailer.config.get('email_settings', {}).get('max_jobs_per_email', 20)
+        self.profiles, self.recipients_by_profile = load_profiles(self.emailer.config.get('recipients', []))
+        if len(self.profiles) > 1:
+            logger.info(f"Matching {len(self.profiles)} recipient criteria profiles")
+        self.matcher = create_matcher(self.profiles)
+        self.metrics = get_metrics()
+
+    def process(self, jobs: Iterable[Dict]) -> bool:
+        """
+        Filter, match and email scraped jobs, then record them in history.
         
-        # Load job history
-        history = load_job_history()
+        Jobs stream from the scrapers through the new-job filter and the
+        matcher into email batches, so matches go out while slower
+        companies are still being scraped.
         
-        # Scrape jobs from all configured companies
-        all_jobs = scrape_all_companies()
-        logger.info(f"Scraped {len(all_jobs)} total jobs")
+        Args:
+            jobs (Iterable[Dict]): Scraped job listings
         
-        # Filter for new jobs only
-        new_jobs = filter_new_jobs(all_jobs, history)
+        Returns:
+            bool: True if every match was delivered to every recipient
+        """
+        counts = Counter()
+        new_jobs = []
+        scraped_jobs = _count(jobs, counts, 'scraped')
+        fresh_jobs = _collect(iter_new_jobs(scraped_jobs, self.history), new_jobs)
+
+        # A job counts as delivered once any of its recipients has it, so
+        # one bad address does not stop the new jobs from being recorded
+        try:
+            counts['matched'], undelivered, failed_recipients = deliver_matches(
+                match_profiles(fresh_jobs, self.profiles, self.matcher), self.emailer,
+                self.recipients_by_profile, self.batch_size
+            )
+        except Exception:
+            self.history.discard_full_sweeps()
+            raise
+        delivered = not undelivered
+
+        # Every new job is tracked, matched or not, so the next incremental
+        # crawl can stop at it; matches that were not emailed are left out
+        # so they are sent again next run
+        self.history.record_seen(job for job in new_jobs if job_key_for(job) not in undelivered)
+
+        self.metrics.set('run_jobs', counts['scraped'], stage='scraped')
+        self.metrics.set('run_jobs', len(new_jobs), stage='new')
+        self.metrics.set('run_jobs', counts['matched'], stage='matched')
+
+        logger.info(f"Scraped {counts['scraped']} total jobs")
         logger.info(f"Found {len(new_jobs)} new jobs")
         
         if new_jobs:
-            # Match jobs against criteria
-            matcher = JobMatcher()
-            matching_jobs = matcher.filter_jobs(new_jobs)
-            logger.info(f"Found {len(matching_jobs)} matching jobs")
+            logger.info(f"Found {counts['matched']} matching jobs")
             
-            if matching_jobs:
-                # Send email notifications
-                emailer = JobEmailer()
-                if emailer.send_job_notifications(matching_jobs):
-                    # Update and save job history
-                    history = update_job_history(history, new_jobs)
-                    save_job_history(history)
+            if counts['matched']:
+                if delivered:
+                    self.history.record_run(new_jobs)
+                    if failed_recipients:
+                        logger.warning(f"Could not notify {', '.join(sorted(failed_recipients))}")
                     logger.info("Job search process completed successfully")
                 else:
                     logger.error("Failed to send email notifications")
@@ -90,10 +213,64 @@ def main():
                 logger.info("No matching jobs found")
         else:
             logger.info("No new jobs found")
+        return delivered and not failed_recipients
+
+    def close(self):
+        """Flush the history and close SMTP connections and matcher workers."""
+        self.history.close()
+        self.emailer.close()
+        if isinstance(self.matcher, JobMatcher):
+            self.matcher.close()
+
+def main(verbose: bool = False, trace_path: Optional[str] = None, daemon: bool = False):
+    """
+    Main function to orchestrate the job search process.
+    
+    Args:
+        verbose (bool): Log per-page and per-job details
+        trace_path (Optional[str]): JSON lines file to write a per-job trace to
+        daemon (bool): Keep running and crawl each company on its own
+            interval instead of scraping every company once
+    """
+    set_verbosity(verbose)
+    trace_writer = start_trace(trace_path)
+    settings = load_settings()
+    metrics = get_metrics()
+    start = time.perf_counter()
+    success = False
+    pipeline = None
+    try:
+        logger.info("Starting job search process")
+        pipeline = JobPipeline(settings)
+        if daemon:
+            success = CrawlDaemon(pipeline, settings=settings).run()
+        else:
+            success = pipeline.process(iter_all_companies(history=pipeline.history))
             
     except Exception as e:
         logger.error(f"Error in job search process: {str(e)}")
         raise
+    finally:
+        if pipeline is not None:
+            pipeline.close()
+        if not daemon:
+            metrics.set('run_duration_seconds', time.perf_counter() - start)
+            metrics.set('run_success', int(success))
+        export_metrics(settings.get('metrics'))
+        if trace_writer is not None:
+            trace_writer.close()
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Scrape, match and email new job postings")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="log per-page and per-job details")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="write a structured per-job trace (JSON lines) to PATH")
+    parser.add_argument('--daemon', action='store_true',
+                        help="keep running, crawling each company on its own interval")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    args = parse_args()
+    main(verbose=args.verbose, trace_path=args.trace, daemon=args.daemon) 
\ No newline at end of file
@@ -1,8 +1,18 @@
 import json
-from typing import Dict, List, Set
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 import logging
-from difflib import SequenceMatcher
 import re
+from settings import load_settings
+from similarity import batch_similarity, resolve_engine, sequence_similarity
+from keyword_index import KeywordAutomaton
+from score_cache import ScoreCache, criteria_fingerprint
+from diagnostics import trace, trace_enabled
+from metrics import get_metrics
+from job_record import with_match_score
 
 # Set up logging
 logging.basicConfig(
@@ -11,17 +21,123 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Matcher used by each worker process of the parallel matching pool
+_worker_matcher: Optional['JobMatcher'] = None
+
+def _init_worker(criteria: Dict, engine: str, exact_rescoring: bool):
+    """Build the worker's matcher once from the parent's prepared criteria."""
+    global _worker_matcher
+    _worker_matcher = JobMatcher(criteria=criteria, engine=engine,
+                                 cache_scores=False, parallel=False)
+    _worker_matcher.exact_rescoring = exact_rescoring
+
+def _score_chunk(pairs: List[Tuple[str, str]]) -> Tuple[List[float], float]:
+    """Score a chunk of (title, location) pairs in a worker process, with the CPU time used."""
+    start = time.process_time()
+    jobs = [{'title': title, 'location': location} for title, location in pairs]
+    scores = _worker_matcher._score_batch(jobs)
+    return scores, time.process_time() - start
+
+def normalize_criteria(criteria: Dict) -> Dict:
+    """
+    Lowercase search criteria into term sets.
+    
+    Args:
+        criteria (Dict): Search criteria as in search_criteria.json
+    
+    Returns:
+        Dict: 'primary', 'related', 'locations', 'exclude' and 'boost' term
+            sets and the match 'threshold'
+    """
+    return {
+        'primary': {k.lower() for k in criteria['primary_keywords']},
+        'related': {t.lower() for t in criteria['related_terms']},
+        'locations': {l.lower() for l in criteria['locations']},
+        'exclude': {t.lower() for t in criteria['exclude_terms']},
+        'boost': {t.lower() for t in criteria.get('boost_terms', ['quant', 'quantitative'])},
+        'threshold': criteria.get('match_threshold', 0.7)
+    }
+
+def location_matches(job_location: str, locations: Set[str]) -> bool:
+    """
+    Check if a job location matches the configured locations.
+    
+    Args:
+        job_location (str): Job location to check
+        locations (Set[str]): Lowercased configured locations
+    
+    Returns:
+        bool: True if location matches, False otherwise
+    """
+    job_location = job_location.lower()
+    
+    # Check for remote positions
+    if "remote" in locations and "remote" in job_location:
+        return True
+        
+    # Check for US locations
+    us_indicators = {"united states", "us", "usa", "u.s.", "u.s.a"}
+    if any(loc in job_location for loc in us_indicators):
+        return True
+        
+    # Check state abbreviations (e.g., NY, CA, etc.)
+    state_pattern = r'\b[A-Z]{2}\b'
+    if re.search(state_pattern, job_location.upper()):
+        return True
+        
+    return False
+
 class JobMatcher:
-    def __init__(self, criteria_path: str = 'config/search_criteria.json'):
+    def __init__(self, criteria_path: str = 'config/search_criteria.json',
+                 engine: Optional[str] = None, criteria: Optional[Dict] = None,
+                 cache_scores: bool = True, parallel: bool = True):
         """
         Initialize the job matcher with search criteria.
         
         Args:
             criteria_path (str): Path to search criteria JSON file
+            engine (Optional[str]): Similarity engine ('rapidfuzz', 'difflib'
+                or 'auto'), defaults to ``matcher.engine`` in settings
+            criteria (Optional[Dict]): Already loaded criteria, used instead
+                of reading criteria_path
+            cache_scores (bool): Whether to use the persistent score cache
+            parallel (bool): Whether large batches may be scored in worker
+                processes
         """
-        self.criteria = self._load_criteria(criteria_path)
+        settings = load_settings().get('matcher', {})
+        self.engine = resolve_engine(engine or settings.get('engine', 'auto'))
+        self.batch_size = settings.get('batch_size', 512)
+        self.exact_rescoring = settings.get('exact_rescoring', True)
+        # Similarity scores and keyword scans precomputed for a batch of titles
+        self._similarity_cache: Dict[str, Tuple[List[float], List[float]]] = {}
+        self._scan_cache: Dict[str, Dict] = {}
+        self.criteria = criteria if criteria is not None else self._load_criteria(criteria_path)
         self._prepare_criteria()
 
+        # Batches with at least min_jobs unscored jobs are split into chunks
+        # and scored across worker processes
+        parallel_settings = settings.get('parallel', {})
+        self.workers = parallel_settings.get('workers', 0) or os.cpu_count() or 1
+        if not parallel:
+            self.workers = 1
+        self.parallel_min_jobs = parallel_settings.get('min_jobs', 2000)
+        self.parallel_chunk_size = parallel_settings.get('chunk_size', 250)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.metrics = get_metrics()
+
+        # Scores of titles seen before, kept across runs until the criteria change
+        self.score_cache: Optional[ScoreCache] = None
+        cache_settings = settings.get('score_cache', {})
+        if cache_scores and cache_settings.get('enabled', True):
+            fingerprint = criteria_fingerprint(
+                self.criteria, exact=self.engine == 'difflib' or self.exact_rescoring
+            )
+            self.score_cache = ScoreCache(
+                fingerprint,
+                path=cache_settings.get('path', 'data/score_cache.json'),
+                max_entries=cache_settings.get('max_entries', 50000)
+            )
+
     def _load_criteria(self, criteria_path: str) -> Dict:
         """
         Load search criteria from JSON file.
@@ -41,11 +157,62 @@ class JobMatcher:
 
     def _prepare_criteria(self):
         """Prepare criteria for matching by converting to sets and lowercase."""
-        self.primary_keywords = {k.lower() for k in self.criteria['primary_keywords']}
-        self.related_terms = {t.lower() for t in self.criteria['related_terms']}
-        self.locations = {l.lower() for l in self.criteria['locations']}
-        self.exclude_terms = {t.lower() for t in self.criteria['exclude_terms']}
-        self.threshold = self.criteria.get('match_threshold', 0.7)
+        terms = normalize_criteria(self.criteria)
+        self.primary_keywords = terms['primary']
+        self.related_terms = terms['related']
+        self.locations = terms['locations']
+        self.exclude_terms = terms['exclude']
+        self.threshold = terms['threshold']
+        self.boost_terms = terms['boost']
+        # Fixed orderings so batch score rows line up with the terms
+        self.primary_list = list(self.primary_keywords)
+        self.related_list = list(self.related_terms)
+
+        # One automaton finds every keyword, related, exclude and boost term
+        # in a single pass over a title
+        self.keyword_index = KeywordAutomaton()
+        self.keyword_index.add_all(self.primary_keywords, 'primary')
+        self.keyword_index.add_all(self.related_terms, 'related')
+        self.keyword_index.add_all(self.exclude_terms, 'exclude')
+        self.keyword_index.add_all(self.boost_terms, 'boost')
+        self.keyword_index.build()
+
+    def _scan(self, title: str) -> Dict:
+        """
+        Scan a title once for every configured term.
+        
+        Exclude and boost terms match anywhere in the title; primary and
+        related terms count as exact only when they cover whole words.
+        
+        Args:
+            title (str): Job title
+        
+        Returns:
+            Dict: 'excluded' and 'boosted' flags, the first exact 'primary'
+                keyword (or None) and the set of exact 'related' terms
+        """
+        title = title.lower()
+        scan = self._scan_cache.get(title)
+        if scan is not None:
+            return scan
+
+        text = " ".join(title.split())
+        scan = {'excluded': False, 'boosted': False, 'primary': None, 'related': set()}
+        for hit in self.keyword_index.search(text):
+            if hit.category == 'exclude':
+                scan['excluded'] = True
+            elif hit.category == 'boost':
+                scan['boosted'] = True
+            elif hit.is_whole_words(text):
+                if hit.category == 'primary' and scan['primary'] is None:
+                    scan['primary'] = hit.term
+                elif hit.category == 'related':
+                    scan['related'].add(hit.term)
+
+        if len(self._scan_cache) >= 4 * self.batch_size:
+            self._scan_cache.clear()
+        self._scan_cache[title] = scan
+        return scan
 
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """
@@ -58,23 +225,95 @@ class JobMatcher:
         Returns:
             float: Similarity score between 0 and 1
         """
-        # Split the longer title into parts and find best matching part
-        words1 = str1.lower().split()
-        words2 = str2.lower().split()
+        return sequence_similarity(str1, str2)
+
+    def _precompute_similarities(self, titles: List[str]):
+        """
+        Score a batch of titles against all keywords and related terms at once.
+        
+        Args:
+            titles (List[str]): Job titles to score
+        """
+        titles = [title.lower() for title in titles if title.lower() not in self._similarity_cache]
+        if not titles:
+            return
+        primary = batch_similarity(self.primary_list, titles, self.engine)
+        related = batch_similarity(self.related_list, titles, self.engine)
+        for title in primary:
+            self._similarity_cache[title] = (primary[title], related[title])
+
+    def _get_similarities(self, title: str) -> Tuple[List[float], List[float]]:
+        """
+        Get a title's scores against the primary keywords and related terms.
+        
+        The rapidfuzz score of a span is never below difflib's (it uses the
+        longest common subsequence, difflib a greedy approximation of it),
+        so batch scores give an upper bound on the reference score. With
+        exact rescoring on, titles whose bound reaches the threshold are
+        rescored with difflib, which keeps match decisions and scores
+        identical to the serial path while most titles skip difflib. Only
+        terms whose bound could beat the best exact score so far are rescored.
+        
+        Args:
+            title (str): Lowercased job title
+        
+        Returns:
+            Tuple[List[float], List[float]]: Scores in the order of
+                primary_list and related_list
+        """
+        if title not in self._similarity_cache:
+            self._precompute_similarities([title])
+        primary, related = self._similarity_cache[title]
+
+        boosted = self._scan(title)['boosted']
+        if (self.engine == 'rapidfuzz' and self.exact_rescoring
+                and self._total_score(max(primary), max(related), boosted) >= self.threshold):
+            primary = self._rescore(self.primary_list, primary, title)
+            related = self._rescore(self.related_list, related, title)
+            self._similarity_cache[title] = (primary, related)
+        return primary, related
+
+    @staticmethod
+    def _rescore(terms: List[str], bounds: List[float], title: str) -> List[float]:
+        """
+        Replace upper-bound scores with difflib scores until the best is exact.
+        
+        Args:
+            terms (List[str]): Keywords or related terms
+            bounds (List[float]): Upper-bound score per term
+            title (str): Lowercased job title
+        
+        Returns:
+            List[float]: Scores whose maximum equals the difflib maximum;
+                terms that cannot reach it keep their bound
+        """
+        scores = list(bounds)
+        best = 0.0
+        for index in sorted(range(len(terms)), key=lambda i: bounds[i], reverse=True):
+            if bounds[index] <= best:
+                break
+            scores[index] = sequence_similarity(terms[index], title)
+            best = max(best, scores[index])
+        return scores
+
+    @staticmethod
+    def _total_score(best_primary: float, best_related: float, boosted: bool) -> float:
+        """
+        Combine the best keyword and related term similarities into a score.
         
-        # Try different combinations of consecutive words
-        max_score = 0
-        for i in range(len(words2)):
-            for j in range(i + 1, len(words2) + 1):
-                part = " ".join(words2[i:j])
-                score = SequenceMatcher(None, str1.lower(), part).ratio()
-                max_score = max(max_score, score)
-                
-                # Early exit if we find a very good match
-                if max_score > 0.9:
-                    return max_score
+        Args:
+            best_primary (float): Best primary keyword similarity
+            best_related (float): Best related term similarity
+            boosted (bool): Whether the title contains a boost term
         
-        return max_score
+        Returns:
+            float: Match score between 0 and 1
+        """
+        total_score = best_primary * 0.7 + best_related * 0.3
+        # Special case: If title contains "quant" or "quantitative", boost the score
+        if boosted:
+            total_score = min(1.0, total_score + 0.3)
+        return total_score
 
     def _is_location_match(self, job_location: str) -> bool:
         """
@@ -86,23 +325,7 @@ class JobMatcher:
         Returns:
             bool: True if location matches, False otherwise
         """
-        job_location = job_location.lower()
-        
-        # Check for remote positions
-        if "remote" in self.locations and "remote" in job_location:
-            return True
-            
-        # Check for US locations
-        us_indicators = {"united states", "us", "usa", "u.s.", "u.s.a"}
-        if any(loc in job_location for loc in us_indicators):
-            return True
-            
-        # Check state abbreviations (e.g., NY, CA, etc.)
-        state_pattern = r'\b[A-Z]{2}\b'
-        if re.search(state_pattern, job_location.upper()):
-            return True
-            
-        return False
+        return location_matches(job_location, self.locations)
 
     def _has_excluded_terms(self, title: str) -> bool:
         """
@@ -114,8 +337,7 @@ class JobMatcher:
         Returns:
             bool: True if contains excluded terms, False otherwise
         """
-        title = title.lower()
-        return any(term in title for term in self.exclude_terms)
+        return self._scan(title)['excluded']
 
     def calculate_match_score(self, job: Dict) -> float:
         """
@@ -128,68 +350,196 @@ class JobMatcher:
             float: Match score between 0 and 1
         """
         title = job['title'].lower()
-        print(f"\nAnalyzing Job: {job['title']}")
-        print(f"Location: {job['location']}")
+        scan = self._scan(title)
         
         # Check for excluded terms first
-        if self._has_excluded_terms(title):
-            print("❌ Excluded: Contains excluded terms (senior/lead/etc.)")
+        if scan['excluded']:
+            logger.debug("Excluded (contains excluded terms): %s", job['title'])
             return 0.0
             
         # Check location
         if not self._is_location_match(job['location']):
-            print("❌ Excluded: Location not in US/Remote")
+            logger.debug("Excluded (location not in US/Remote): %s, %s", job['title'], job['location'])
             return 0.0
 
         # Check for exact matches in title (highest priority)
-        title_parts = title.split()
-        for i in range(len(title_parts)):
-            for j in range(i + 1, len(title_parts) + 1):
-                part = " ".join(title_parts[i:j])
-                if part in self.primary_keywords:
-                    print(f"✨ Exact Match Found: {part}")
-                    return 1.0
+        if scan['primary'] is not None:
+            logger.debug("Exact match %r: %s", scan['primary'], job['title'])
+            return 1.0
+
+        primary_similarities, related_similarities = self._get_similarities(title)
 
         # Calculate primary keyword matches (higher weight)
-        primary_scores = [(keyword, self._calculate_similarity(keyword, title)) 
-                         for keyword in self.primary_keywords]
+        primary_scores = list(zip(self.primary_list, primary_similarities))
         best_primary = max(primary_scores, key=lambda x: x[1])
-        primary_score = best_primary[1] * 0.7
-
-        print(f"Primary Keyword Match: {best_primary[0]} (Score: {best_primary[1]:.2f})")
-        
-        # Print all good primary matches for debugging
-        good_primary_matches = [
-            (kw, score) for kw, score in primary_scores 
-            if score > 0.5  # Show any decent matches
-        ]
-        if good_primary_matches:
-            print("Other good primary matches:")
-            for kw, score in good_primary_matches:
-                if kw != best_primary[0]:  # Don't repeat the best match
-                    print(f"  - {kw}: {score:.2f}")
 
         # Calculate related term matches (lower weight)
-        related_scores = [(term, self._calculate_similarity(term, title)) 
-                         for term in self.related_terms]
+        related_scores = list(zip(self.related_list, related_similarities))
         best_related = max(related_scores, key=lambda x: x[1])
-        related_score = best_related[1] * 0.3
 
-        print(f"Related Term Match: {best_related[0]} (Score: {best_related[1]:.2f})")
+        total_score = self._total_score(best_primary[1], best_related[1], scan['boosted'])
 
-        # Special case: If title contains "quant" or "quantitative", boost the score
-        if "quant" in title or "quantitative" in title:
-            boost = 0.3  # 30% boost
-            print(f"📈 Quantitative Role Boost: +{boost}")
-            total_score = min(1.0, primary_score + related_score + boost)
-        else:
-            total_score = primary_score + related_score
-
-        print(f"Total Match Score: {total_score:.2f}")
-        print("-" * 50)
+        if logger.isEnabledFor(logging.DEBUG):
+            # Other decent primary matches, for tuning the keywords
+            other_matches = ", ".join(
+                f"{kw}: {score:.2f}" for kw, score in primary_scores
+                if score > 0.5 and kw != best_primary[0]
+            )
+            logger.debug(
+                "Scored %s: primary %s (%.2f), related %s (%.2f)%s -> %.2f%s",
+                job['title'], best_primary[0], best_primary[1], best_related[0], best_related[1],
+                ", boosted +0.3" if scan['boosted'] else "", total_score,
+                f" [other primary matches: {other_matches}]" if other_matches else ""
+            )
 
         return total_score
 
+    def iter_matches(self, jobs: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Score jobs as they arrive and yield the ones that match.
+        
+        The worker pool stays up between calls, so a long-running pipeline
+        reuses warm workers; call close() when done matching.
+        
+        Args:
+            jobs (Iterable[Dict]): Job listings to filter, e.g. a scraper stream
+        
+        Yields:
+            Dict: Matching job with its 'match_score', in input order
+        """
+        try:
+            yield from self._iter_matches(jobs)
+        finally:
+            if self.score_cache is not None:
+                self.score_cache.save()
+
+    def _iter_matches(self, jobs: Iterable[Dict]) -> Iterator[Dict]:
+        # A stream is read batch_size jobs at a time, so the first matches
+        # are yielded while slower scrapers are still running. Jobs that
+        # are already all in memory are read in batches big enough to keep
+        # every worker busy; a batch still runs serially below min_jobs
+        batch_size = self.batch_size
+        if self.workers > 1 and isinstance(jobs, Sequence):
+            batch_size = max(batch_size, self.parallel_min_jobs,
+                             self.workers * self.parallel_chunk_size)
+        for batch in self._batches(jobs, batch_size):
+            scores = [self._cached_score(job) for job in batch]
+            unscored = [i for i, score in enumerate(scores) if score is None]
+            unscored_set = set(unscored)
+            start, cpu_start = time.perf_counter(), time.thread_time()
+            for i, score in zip(unscored, self._score_jobs([batch[i] for i in unscored])):
+                scores[i] = score
+                if self.score_cache is not None:
+                    self.score_cache.put(batch[i]['title'], batch[i]['location'], score)
+            self.metrics.inc('matcher_cpu_seconds_total', time.thread_time() - cpu_start, process='main')
+            self.metrics.observe('matcher_batch_seconds', time.perf_counter() - start)
+            self.metrics.inc('matcher_jobs_total', len(unscored), cached='false')
+            self.metrics.inc('matcher_jobs_total', len(batch) - len(unscored), cached='true')
+
+            tracing = trace_enabled()
+            for i, (job, score) in enumerate(zip(batch, scores)):
+                matched = score >= self.threshold
+                logger.debug("%s: %s (score %.2f)", "MATCH" if matched else "NO MATCH",
+                             job['title'], score)
+                if tracing:
+                    trace('job_scored', company=job.get('company'), title=job['title'],
+                          location=job['location'], url=job.get('url'), score=round(score, 4),
+                          matched=matched, cached=i not in unscored_set)
+                if matched:
+                    self.metrics.inc('matcher_matches_total')
+                    yield with_match_score(job, round(score, 2))
+
+    def _score_jobs(self, jobs: List[Dict]) -> List[float]:
+        """
+        Score jobs, across worker processes when there are enough of them.
+        
+        Args:
+            jobs (List[Dict]): Job listings to score
+        
+        Returns:
+            List[float]: Match score per job, in input order
+        """
+        if self.workers > 1 and len(jobs) >= self.parallel_min_jobs:
+            try:
+                return self._score_parallel(jobs)
+            except Exception as e:
+                logger.error(f"Parallel matching failed, scoring serially: {str(e)}")
+                self.close()
+                self.workers = 1
+        return self._score_batch(jobs)
+
+    def _score_parallel(self, jobs: List[Dict]) -> List[float]:
+        """Score jobs in chunks on the process pool, keeping input order."""
+        if self._pool is None:
+            # The pool may start while scraper, trace and SMTP threads are
+            # running; forked workers could inherit their held locks
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self.criteria, self.engine, self.exact_rescoring)
+            )
+        # Only title and location affect the score, so only they are sent
+        pairs = [(job['title'], job['location']) for job in jobs]
+        chunk_size = self.parallel_chunk_size
+        chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+        scores = []
+        for chunk_scores, cpu_seconds in self._pool.map(_score_chunk, chunks):
+            scores.extend(chunk_scores)
+            self.metrics.inc('matcher_cpu_seconds_total', cpu_seconds, process='worker')
+        return scores
+
+    def _score_batch(self, jobs: List[Dict]) -> List[float]:
+        """
+        Score a batch of jobs in this process.
+        
+        Args:
+            jobs (List[Dict]): Job listings to score
+        
+        Returns:
+            List[float]: Match score per job, in input order
+        """
+        # Score every title in the batch that can reach fuzzy matching in
+        # one go; difflib gains nothing from batching and scores lazily
+        if self.engine == 'rapidfuzz':
+            self._precompute_similarities([
+                job['title'] for job in jobs if self._needs_fuzzy_match(job)
+            ])
+        scores = [self.calculate_match_score(job) for job in jobs]
+        self._similarity_cache.clear()
+        self._scan_cache.clear()
+        return scores
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _cached_score(self, job: Dict) -> Optional[float]:
+        """Look up a job's score in the score cache, if enabled."""
+        if self.score_cache is None:
+            return None
+        return self.score_cache.get(job['title'], job['location'])
+
+    def _needs_fuzzy_match(self, job: Dict) -> bool:
+        """Check whether scoring a job gets past the exclusion, location and exact checks."""
+        scan = self._scan(job['title'])
+        return not scan['excluded'] and scan['primary'] is None and self._is_location_match(job['location'])
+
+    def _batches(self, jobs: Iterable[Dict], batch_size: int) -> Iterator[List[Dict]]:
+        """Group jobs into lists of at most batch_size jobs."""
+        batch = []
+        for job in jobs:
+            batch.append(job)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     def filter_jobs(self, jobs: List[Dict]) -> List[Dict]:
         """
         Filter jobs based on search criteria.
@@ -200,32 +550,216 @@ class JobMatcher:
         Returns:
             List[Dict]: Filtered list of matching jobs with scores
         """
-        print("\n=== Starting Job Matching Process ===")
-        print(f"Threshold Score: {self.threshold}")
-        print(f"Processing {len(jobs)} jobs...")
-        print("=" * 50)
+        logger.info(f"Matching {len(jobs)} jobs (threshold {self.threshold})")
         
-        matching_jobs = []
-        
-        for job in jobs:
-            score = self.calculate_match_score(job)
-            if score >= self.threshold:
-                print(f"✅ MATCH: {job['title']} (Score: {score:.2f})")
-                job_with_score = job.copy()
-                job_with_score['match_score'] = round(score, 2)
-                matching_jobs.append(job_with_score)
-            else:
-                print(f"❌ NO MATCH: {job['title']} (Score: {score:.2f})")
+        matching_jobs = list(self.iter_matches(jobs))
 
         # Sort by match score in descending order
         matching_jobs.sort(key=lambda x: x['match_score'], reverse=True)
         
-        print("\n=== Matching Process Complete ===")
-        print(f"Found {len(matching_jobs)} matching jobs out of {len(jobs)} total jobs")
-        print("=" * 50)
+        logger.info(f"Found {len(matching_jobs)} matching jobs out of {len(jobs)} total jobs")
         
         return matching_jobs
 
+class MultiProfileMatcher:
+    def __init__(self, profiles: Dict[str, Dict], engine: Optional[str] = None):
+        """
+        Initialize a matcher that scores jobs against several criteria profiles.
+        
+        Every title is normalized and scanned once, with one keyword index
+        built from the terms of all profiles, and scored once against each
+        distinct keyword and related term. Each profile then combines the
+        shared scores of its own terms, so the cost grows with the number of
+        distinct terms rather than the number of profiles. Scores are the
+        same as a JobMatcher per profile would give.
+        
+        Args:
+            profiles (Dict[str, Dict]): Search criteria by profile name
+            engine (Optional[str]): Similarity engine ('rapidfuzz', 'difflib'
+                or 'auto'), defaults to ``matcher.engine`` in settings
+        """
+        settings = load_settings().get('matcher', {})
+        self.engine = resolve_engine(engine or settings.get('engine', 'auto'))
+        self.batch_size = settings.get('batch_size', 512)
+        self.exact_rescoring = settings.get('exact_rescoring', True)
+        self.metrics = get_metrics()
+        self.profiles = {name: normalize_criteria(criteria) for name, criteria in profiles.items()}
+
+        # Distinct fuzzy terms across profiles; each profile refers to its
+        # terms by column in the shared score rows
+        self.terms = sorted(set().union(*(p['primary'] | p['related'] for p in self.profiles.values())))
+        columns = {term: column for column, term in enumerate(self.terms)}
+        for profile in self.profiles.values():
+            profile['primary_columns'] = [columns[term] for term in sorted(profile['primary'])]
+            profile['related_columns'] = [columns[term] for term in sorted(profile['related'])]
+
+        self.keyword_index = KeywordAutomaton()
+        self.keyword_index.add_all(self.terms, 'term')
+        for profile in self.profiles.values():
+            self.keyword_index.add_all(profile['exclude'], 'exclude')
+            self.keyword_index.add_all(profile['boost'], 'boost')
+        self.keyword_index.build()
+
+        # Per-batch caches: keyword scans, score rows and difflib rescores
+        self._scan_cache: Dict[str, Dict] = {}
+        self._similarity_cache: Dict[str, List[float]] = {}
+        self._exact_cache: Dict[Tuple[str, int], float] = {}
+
+    def _scan(self, title: str) -> Dict:
+        """
+        Scan a lowercased title once for the terms of every profile.
+        
+        Returns:
+            Dict: Sets of the 'exclude' and 'boost' terms found anywhere and
+                of the fuzzy terms found as whole words ('exact')
+        """
+        scan = self._scan_cache.get(title)
+        if scan is not None:
+            return scan
+        text = " ".join(title.split())
+        scan = {'exclude': set(), 'boost': set(), 'exact': set()}
+        for hit in self.keyword_index.search(text):
+            if hit.category != 'term':
+                scan[hit.category].add(hit.term)
+            elif hit.is_whole_words(text):
+                scan['exact'].add(hit.term)
+        self._scan_cache[title] = scan
+        return scan
+
+    def _needs_fuzzy_match(self, profile: Dict, scan: Dict, location: str) -> bool:
+        """Check whether a profile's score for a job depends on fuzzy matching."""
+        return (not scan['exclude'] & profile['exclude']
+                and location_matches(location, profile['locations'])
+                and not scan['exact'] & profile['primary'])
+
+    def _term_scores(self, title: str) -> List[float]:
+        """Rapidfuzz upper-bound scores of a title against every term."""
+        if title not in self._similarity_cache:
+            self._similarity_cache.update(batch_similarity(self.terms, [title], self.engine))
+        return self._similarity_cache[title]
+
+    def _exact_score(self, title: str, column: int) -> float:
+        """Difflib score of a title against one term, shared between profiles."""
+        key = (title, column)
+        score = self._exact_cache.get(key)
+        if score is None:
+            score = self._exact_cache[key] = sequence_similarity(self.terms[column], title)
+        return score
+
+    def _best_exact(self, columns: List[int], bounds: List[float], title: str) -> float:
+        """
+        Find the best difflib score among terms, rescoring as few as possible.
+        
+        Terms are rescored in order of their upper bound until no remaining
+        bound can beat the best exact score. Rescores are shared between
+        profiles through the per-batch cache.
+        """
+        best = 0.0
+        for column in sorted(columns, key=lambda c: bounds[c], reverse=True):
+            if bounds[column] <= best:
+                break
+            best = max(best, self._exact_score(title, column))
+        return best
+
+    def _profile_score(self, profile: Dict, scan: Dict, title: str, location: str) -> float:
+        """Score a job for one profile, as JobMatcher.calculate_match_score does."""
+        if scan['exclude'] & profile['exclude']:
+            return 0.0
+        if not location_matches(location, profile['locations']):
+            return 0.0
+        if scan['exact'] & profile['primary']:
+            return 1.0
+
+        boosted = bool(scan['boost'] & profile['boost'])
+        if self.engine == 'difflib':
+            # Only the terms this profile uses are scored, each once per title
+            best_primary = max(self._exact_score(title, c) for c in profile['primary_columns'])
+            best_related = max(self._exact_score(title, c) for c in profile['related_columns'])
+            return JobMatcher._total_score(best_primary, best_related, boosted)
+
+        bounds = self._term_scores(title)
+        best_primary = max(bounds[c] for c in profile['primary_columns'])
+        best_related = max(bounds[c] for c in profile['related_columns'])
+        if (self.engine == 'rapidfuzz' and self.exact_rescoring
+                and JobMatcher._total_score(best_primary, best_related, boosted) >= profile['threshold']):
+            best_primary = self._best_exact(profile['primary_columns'], bounds, title)
+            best_related = self._best_exact(profile['related_columns'], bounds, title)
+        return JobMatcher._total_score(best_primary, best_related, boosted)
+
+    def score_profiles(self, job: Dict) -> Dict[str, float]:
+        """
+        Score a job against every profile.
+        
+        Args:
+            job (Dict): Job listing to evaluate
+        
+        Returns:
+            Dict[str, float]: Match score between 0 and 1 per profile
+        """
+        title = job['title'].lower()
+        scan = self._scan(title)
+        return {name: self._profile_score(profile, scan, title, job['location'])
+                for name, profile in self.profiles.items()}
+
+    def iter_matches(self, jobs: Iterable[Dict]) -> Iterator[Tuple[Dict, Dict[str, float]]]:
+        """
+        Score jobs as they arrive and yield the ones that match any profile.
+        
+        Args:
+            jobs (Iterable[Dict]): Job listings to filter, e.g. a scraper stream
+        
+        Yields:
+            Tuple[Dict, Dict[str, float]]: Matching job and its rounded
+                score for each profile it matches, in input order
+        """
+        batch = []
+        for job in jobs:
+            batch.append(job)
+            if len(batch) >= self.batch_size:
+                yield from self._match_batch(batch)
+                batch = []
+        if batch:
+            yield from self._match_batch(batch)
+
+    def _match_batch(self, batch: List[Dict]) -> Iterator[Tuple[Dict, Dict[str, float]]]:
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        if self.engine == 'rapidfuzz':
+            # One batch scoring call for every title any profile scores fuzzily
+            titles = []
+            for job in batch:
+                title = job['title'].lower()
+                scan = self._scan(title)
+                if any(self._needs_fuzzy_match(profile, scan, job['location'])
+                       for profile in self.profiles.values()):
+                    titles.append(title)
+            if titles:
+                self._similarity_cache.update(batch_similarity(self.terms, titles, self.engine))
+
+        results = []
+        tracing = trace_enabled()
+        for job in batch:
+            scores = self.score_profiles(job)
+            matched = {name: round(score, 2) for name, score in scores.items()
+                       if score >= self.profiles[name]['threshold']}
+            logger.debug("%s: %s (profiles %s)", "MATCH" if matched else "NO MATCH",
+                         job['title'], ", ".join(matched) or "-")
+            if tracing:
+                trace('job_scored', company=job.get('company'), title=job['title'],
+                      location=job['location'], url=job.get('url'),
+                      scores={name: round(score, 4) for name, score in scores.items()},
+                      matched=sorted(matched))
+            if matched:
+                results.append((job, matched))
+
+        self._scan_cache.clear()
+        self._similarity_cache.clear()
+        self._exact_cache.clear()
+        self.metrics.inc('matcher_cpu_seconds_total', time.thread_time() - cpu_start, process='main')
+        self.metrics.observe('matcher_batch_seconds', time.perf_counter() - start)
+        self.metrics.inc('matcher_jobs_total', len(batch), cached='false')
+        self.metrics.inc('matcher_matches_total', len(results))
+        yield from results
+
 if __name__ == "__main__":
     # Test matching
     matcher = JobMatcher()
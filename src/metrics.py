@@ -0,0 +1,258 @@
+import bisect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+import logging
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds, suitable for request, parse and send latencies
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+COUNT_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500)
+
+METRIC_HELP = {
+    'scraper_requests_total': 'HTTP requests made, by company and status',
+    'scraper_response_bytes_total': 'Response body bytes received',
+    'scraper_request_seconds': 'HTTP request latency',
+    'scraper_sleep_seconds_total': 'Time spent waiting on rate limits and retry backoff',
+    'scraper_parse_seconds': 'Time spent parsing a listing page',
+    'scraper_jobs_per_page': 'Jobs parsed from a listing page',
+    'scraper_pages_total': 'Listing pages scraped, by source (network, cache or browser)',
+    'scraper_crawls_total': 'Company crawls, by mode (incremental or full) and whether pagination stopped early',
+    'scraper_render_seconds': 'Time to render a listing page in the browser',
+    'browser_launch_seconds': 'Time to launch a pooled headless browser',
+    'transport_dns_lookups_total': 'Host name lookups, by whether the DNS cache had them',
+    'transport_responses_total': 'Responses received over httpx, by HTTP version',
+    'matcher_cpu_seconds_total': 'CPU time spent scoring jobs, in this process or in workers',
+    'matcher_batch_seconds': 'Wall-clock time to score a batch of jobs',
+    'matcher_jobs_total': 'Jobs scored, by whether the score was cached',
+    'matcher_matches_total': 'Jobs above the match threshold',
+    'email_render_seconds': 'Time to render one notification email',
+    'email_connect_seconds': 'Time to connect and log in to the SMTP server',
+    'email_send_seconds': 'Time to send one notification email',
+    'email_messages_total': 'Notification emails, by status',
+    'email_retries_total': 'Notification email send retries',
+    'run_jobs': 'Jobs at each stage of the last run',
+    'run_duration_seconds': 'Duration of the last run',
+    'run_success': 'Whether the last run completed without errors'
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        """
+        Initialize a histogram with fixed bucket upper bounds.
+
+        Args:
+            buckets (Sequence[float]): Sorted upper bounds; values above the
+                last one are only counted in the total
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> Dict[str, int]:
+        """Cumulative counts per upper bound, as Prometheus reports them."""
+        result, running = {}, 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            result[f"{bound:g}"] = running
+        result['+Inf'] = self.count
+        return result
+
+class MetricsRegistry:
+    def __init__(self):
+        """
+        Initialize an in-process registry of counters, gauges and histograms.
+
+        Every metric is identified by a name and a set of labels such as
+        ``company``. Updates take one lock and a dict lookup, cheap enough
+        to leave on in every run.
+        """
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self.started = time.time()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """
+        Add to a counter.
+
+        Args:
+            name (str): Metric name, e.g. 'scraper_requests_total'
+            value (float): Amount to add
+            **labels: Metric labels
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        """Set a gauge to a value."""
+        key = _label_key(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = LATENCY_BUCKETS, **labels):
+        """
+        Record a value in a histogram.
+
+        Args:
+            name (str): Metric name, e.g. 'scraper_request_seconds'
+            value (float): Observed value
+            buckets (Sequence[float]): Bucket upper bounds, used when the
+                series is first created
+            **labels: Metric labels
+        """
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """Observe the wall-clock duration of a block in a histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self):
+        """Drop every recorded value."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+            self.started = time.time()
+
+    def summary(self) -> Dict:
+        """
+        Snapshot every metric as JSON-serializable data.
+
+        Returns:
+            Dict: 'counters' and 'gauges' map names to lists of
+                {'labels', 'value'}; 'histograms' map names to lists of
+                {'labels', 'count', 'sum', 'buckets'}
+        """
+        with self._lock:
+            return {
+                'started': self.started,
+                'duration_seconds': round(time.time() - self.started, 3),
+                'counters': {name: [{'labels': dict(key), 'value': value} for key, value in series.items()]
+                             for name, series in self._counters.items()},
+                'gauges': {name: [{'labels': dict(key), 'value': value} for key, value in series.items()]
+                           for name, series in self._gauges.items()},
+                'histograms': {
+                    name: [{'labels': dict(key), 'count': h.count, 'sum': round(h.sum, 6),
+                            'buckets': h.cumulative()} for key, h in series.items()]
+                    for name, series in self._histograms.items()
+                }
+            }
+
+    def prometheus_text(self, prefix: str = 'career_searcher_') -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Prefix added to every metric name
+
+        Returns:
+            str: Exposition text
+        """
+        def labels_text(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+            pairs = list(key) + ([extra] if extra else [])
+            if not pairs:
+                return ''
+            return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + '}'
+
+        lines = []
+        with self._lock:
+            for kind, metrics in (('counter', self._counters), ('gauge', self._gauges)):
+                for name, series in sorted(metrics.items()):
+                    full_name = prefix + name
+                    if name in METRIC_HELP:
+                        lines.append(f"# HELP {full_name} {METRIC_HELP[name]}")
+                    lines.append(f"# TYPE {full_name} {kind}")
+                    for key, value in series.items():
+                        lines.append(f"{full_name}{labels_text(key)} {value:g}")
+            for name, series in sorted(self._histograms.items()):
+                full_name = prefix + name
+                if name in METRIC_HELP:
+                    lines.append(f"# HELP {full_name} {METRIC_HELP[name]}")
+                lines.append(f"# TYPE {full_name} histogram")
+                for key, histogram in series.items():
+                    for bound, count in histogram.cumulative().items():
+                        lines.append(f"{full_name}_bucket{labels_text(key, ('le', bound))} {count}")
+                    lines.append(f"{full_name}_sum{labels_text(key)} {histogram.sum:g}")
+                    lines.append(f"{full_name}_count{labels_text(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_summary(self, path: str):
+        """Atomically write the run summary JSON."""
+        _atomic_write(path, json.dumps(self.summary(), indent=4) + "\n")
+
+    def write_prometheus(self, path: str):
+        """Atomically write a textfile for the node_exporter textfile collector."""
+        _atomic_write(path, self.prometheus_text())
+
+def _atomic_write(path: str, content: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+_metrics = MetricsRegistry()
+
+def get_metrics() -> MetricsRegistry:
+    """Get the registry shared by the scraper, matcher, emailer and main."""
+    return _metrics
+
+def export_metrics(settings: Optional[Dict] = None):
+    """
+    Write the run summary and Prometheus textfile configured in settings.
+
+    Args:
+        settings (Optional[Dict]): The ``metrics`` settings block
+    """
+    settings = settings or {}
+    summary_path = settings.get('summary_path', 'data/run_summary.json')
+    textfile_path = settings.get('prometheus_textfile')
+    try:
+        if summary_path:
+            _metrics.write_summary(summary_path)
+        if textfile_path:
+            _metrics.write_prometheus(textfile_path)
+    except OSError as e:
+        logger.error(f"Error writing metrics: {str(e)}")
@@ -0,0 +1,257 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, Optional, Tuple
+import logging
+from settings import load_settings
+from rate_limiter import CircuitOpenError
+from browser import DEFAULT_BROWSER_SETTINGS, BrowserUnavailableError, get_browser_pool
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+try:
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions
+    from selenium.webdriver.support.ui import WebDriverWait
+except ImportError:
+    pass
+
+class Pagination(ABC):
+    def __init__(self, scraper):
+        """
+        Initialize a pagination strategy for one company's scraper.
+
+        Args:
+            scraper (JobScraper): Scraper whose company is paginated
+        """
+        self.scraper = scraper
+        self.config = scraper.config
+        self.pagination = scraper.config.get('pagination', {})
+
+    def page_url(self, page: int) -> str:
+        """URL of a page, for logging and traces."""
+        return self.config['career_url']
+
+    @abstractmethod
+    def iter_pages(self, max_pages: int) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """
+        Fetch and parse pages in order.
+
+        Args:
+            max_pages (int): Number of pages to scrape
+
+        Yields:
+            Tuple[int, Optional[Dict]]: Page number and page result, None if
+                the page could not be fetched
+        """
+
+class UrlParamPagination(Pagination):
+    """Pages addressed by a query parameter, fetched with plain requests."""
+
+    def page_url(self, page: int) -> str:
+        return self.scraper._page_url(page)
+
+    def iter_pages(self, max_pages: int) -> Iterator[Tuple[int, Optional[Dict]]]:
+        if self.scraper._use_concurrent_pagination(max_pages):
+            logger.debug("%s: fetching pages concurrently", self.config['name'])
+            return self.scraper._iter_pages_concurrently(max_pages)
+        return self.scraper._iter_pages(max_pages)
+
+class BrowserPagination(Pagination):
+    """
+    Pages rendered in a pooled headless browser.
+
+    The first page is loaded from career_url and later pages are reached by
+    clicking through the board; every step waits for the listing selector
+    instead of sleeping for a fixed time.
+    """
+    # Whether earlier listings stay on the page as more are loaded
+    accumulates = False
+    # Control that reveals the next page, overridable in the pagination config
+    next_selector = ''
+
+    def __init__(self, scraper):
+        super().__init__(scraper)
+        settings = {**DEFAULT_BROWSER_SETTINGS, **load_settings().get('browser', {})}
+        self.browser_settings = settings
+        self.wait_timeout = settings['wait_timeout']
+        self.listing_selector = self.config['job_listing_selector']
+        self.next_selector = self.pagination.get('next_selector', self.next_selector)
+
+    def page_url(self, page: int) -> str:
+        return self.config['career_url'] if page == 1 else f"{self.config['career_url']}#page={page}"
+
+    def _acquire(self) -> bool:
+        """Take a rate limit token for the board's host, False if its circuit is open."""
+        url = self.config['career_url']
+        try:
+            waited = self.scraper.rate_limiter.acquire(url)
+        except CircuitOpenError as e:
+            logger.warning(f"Skipping {url}: {str(e)}")
+            return False
+        if waited:
+            self.scraper.metrics.inc('scraper_sleep_seconds_total', waited,
+                                     company=self.config['name'], reason='rate_limit')
+        return True
+
+    def _listing_count(self, driver) -> int:
+        return len(driver.find_elements(By.CSS_SELECTOR, self.listing_selector))
+
+    def _wait_for_listings(self, driver, previous_count: int = 0) -> bool:
+        """Wait until more than previous_count listings are on the page."""
+        try:
+            WebDriverWait(driver, self.wait_timeout).until(
+                lambda d: self._listing_count(d) > previous_count
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _next_control(self, driver):
+        """The enabled control that reveals the next page, None if there is none."""
+        if not self.next_selector:
+            return None
+        for element in driver.find_elements(By.CSS_SELECTOR, self.next_selector):
+            if element.is_displayed() and element.is_enabled() \
+                    and element.get_attribute('aria-disabled') != 'true':
+                return element
+        return None
+
+    def _advance(self, driver, listing_count: int) -> bool:
+        """
+        Reveal the next page of listings.
+
+        Args:
+            driver (WebDriver): Browser showing the current page
+            listing_count (int): Listings on the page before advancing
+
+        Returns:
+            bool: True once new listings have rendered
+        """
+        control = self._next_control(driver)
+        if control is None:
+            return False
+        first_listing = None
+        if not self.accumulates:
+            listings = driver.find_elements(By.CSS_SELECTOR, self.listing_selector)
+            first_listing = listings[0] if listings else None
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", control)
+        driver.execute_script("arguments[0].click();", control)
+
+        if first_listing is not None:
+            # The old listings are replaced, so wait for them to go away first
+            try:
+                WebDriverWait(driver, self.wait_timeout).until(expected_conditions.staleness_of(first_listing))
+            except TimeoutException:
+                return False
+            return self._wait_for_listings(driver)
+        return self._wait_for_listings(driver, listing_count if self.accumulates else 0)
+
+    def _has_next(self, driver) -> bool:
+        return self._next_control(driver) is not None
+
+    def iter_pages(self, max_pages: int) -> Iterator[Tuple[int, Optional[Dict]]]:
+        company = self.config['name']
+        pool = get_browser_pool(self.browser_settings)
+        if pool is None:
+            logger.error(f"{company} needs a browser to render its listings, but selenium is not installed")
+            yield 1, None
+            return
+
+        user_agent = self.config.get('headers', {}).get('User-Agent')
+        try:
+            with pool.browser(user_agent) as driver:
+                yield from self._render_pages(driver, max_pages)
+        except BrowserUnavailableError as e:
+            logger.error(f"Could not render {company}: {str(e)}")
+            yield 1, None
+
+    def _render_pages(self, driver, max_pages: int) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """Load the board in a borrowed browser and click through its pages."""
+        company = self.config['name']
+        metrics = self.scraper.metrics
+        seen = 0
+        for page in range(1, max_pages + 1):
+            if not self._acquire():
+                yield page, None
+                return
+            start = time.perf_counter()
+            try:
+                if page == 1:
+                    driver.get(self.config['career_url'])
+                    rendered = self._wait_for_listings(driver)
+                else:
+                    rendered = self._advance(driver, seen)
+            except WebDriverException as e:
+                logger.error(f"Error rendering {company} page {page}: {str(e).splitlines()[0]}")
+                self.scraper.rate_limiter.record_failure(self.config['career_url'])
+                metrics.inc('scraper_requests_total', company=company, status='error')
+                yield page, None
+                return
+            metrics.observe('scraper_render_seconds', time.perf_counter() - start, company=company)
+            metrics.inc('scraper_requests_total', company=company, status='rendered')
+            self.scraper.rate_limiter.record_success(self.config['career_url'])
+
+            if not rendered and page > 1:
+                logger.debug("%s: no new listings rendered for page %d", company, page)
+                return
+            result = self.scraper._parse_page(driver.page_source, seen if self.accumulates else 0,
+                                              source='browser')
+            result['has_next'] = self._has_next(driver)
+            seen += result['listing_count']
+            yield page, result
+
+class WorkdayPagination(BrowserPagination):
+    """Workday boards: numbered pages replaced in place by the next button."""
+    next_selector = "button[data-uxi-element-id='next'], button[aria-label='next']"
+
+class OraclePagination(BrowserPagination):
+    """Oracle Candidate Experience boards: results appended by 'Show more results'."""
+    accumulates = True
+    next_selector = "button.search-pagination__button, button[data-bind*='loadMore']"
+
+    def _has_next(self, driver) -> bool:
+        # More results may load on scroll without a button to show for it
+        return True
+
+    def _advance(self, driver, listing_count: int) -> bool:
+        # Results also load on scroll, which makes the button appear
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        if self._next_control(driver) is None and self._wait_for_listings(driver, listing_count):
+            return True
+        return super()._advance(driver, listing_count)
+
+class LoadMorePagination(BrowserPagination):
+    """Boards that append results with a 'load more' button."""
+    accumulates = True
+    next_selector = "button.load-more, a.load-more, button[class*='load-more'], button[class*='LoadMore']"
+
+PAGINATION_STRATEGIES = {
+    'url_param': UrlParamPagination,
+    'workday': WorkdayPagination,
+    'oracle': OraclePagination,
+    'load_more': LoadMorePagination
+}
+
+def create_pagination(scraper) -> Pagination:
+    """
+    Create the pagination strategy named by the company's ``pagination.type``.
+
+    Args:
+        scraper (JobScraper): Scraper of the company
+
+    Returns:
+        Pagination: Strategy for the company, url_param if the type is unknown
+    """
+    pagination_type = scraper.config.get('pagination', {}).get('type', 'url_param')
+    strategy = PAGINATION_STRATEGIES.get(pagination_type)
+    if strategy is None:
+        logger.warning(f"Unknown pagination type '{pagination_type}' for {scraper.config['name']}, "
+                       f"using url_param")
+        strategy = UrlParamPagination
+    return strategy(scraper)
@@ -0,0 +1,108 @@
+import re
+from typing import Dict, List, Optional, Tuple
+import logging
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+    DEFAULT_BACKEND = 'lxml'
+except ImportError:
+    DEFAULT_BACKEND = 'html.parser'
+
+# A selector made of a single compound (tag plus classes/attributes) can be
+# matched on a strained tree; combinators and pseudo-classes need context
+_SIMPLE_SELECTOR = re.compile(r'^([a-zA-Z][a-zA-Z0-9-]*)[^\s>+~,:]*$')
+_ATTRIBUTE_BLOCK = re.compile(r'\[[^\]]*\]')
+
+class ListingParser:
+    def __init__(self, company_config: Dict, backend: str = 'auto'):
+        """
+        Initialize a parser for one company's listing pages.
+
+        Selectors are compiled once here instead of on every listing, and
+        when the page needs nothing outside the listings, parsing is limited
+        to the listing elements with a SoupStrainer.
+
+        Args:
+            company_config (Dict): Configuration for the company to scrape
+            backend (str): BeautifulSoup tree builder ('lxml', 'html.parser'),
+                or 'auto' to use lxml when it is installed
+        """
+        self.backend = DEFAULT_BACKEND if backend == 'auto' else backend
+        self.listing_selector = soupsieve.compile(company_config['job_listing_selector'])
+        self.title_selector = soupsieve.compile(company_config['title_selector'])
+        self.location_selector = soupsieve.compile(company_config['location_selector'])
+        self.link_selector = soupsieve.compile(company_config['link_selector'])
+
+        next_page_selector = company_config.get('pagination', {}).get('has_next_page_selector')
+        self.next_page_selector = soupsieve.compile(next_page_selector) if next_page_selector else None
+
+        self.strainer = None
+        if self.next_page_selector is None:
+            self.strainer = self._build_strainer(company_config['job_listing_selector'])
+
+    @staticmethod
+    def _build_strainer(listing_selector: str) -> Optional[SoupStrainer]:
+        """
+        Build a SoupStrainer keeping only elements the listing selector can match.
+
+        Args:
+            listing_selector (str): CSS selector for job listings
+
+        Returns:
+            Optional[SoupStrainer]: Strainer on the listing tag name, None if
+                the selector needs the rest of the document to match
+        """
+        match = _SIMPLE_SELECTOR.match(_ATTRIBUTE_BLOCK.sub('', listing_selector.strip()))
+        if not match:
+            return None
+        return SoupStrainer(match.group(1))
+
+    def parse_page(self, html_content: str) -> Tuple[List, bool]:
+        """
+        Parse a page into listing elements.
+
+        Args:
+            html_content (str): HTML of the page
+
+        Returns:
+            Tuple[List, bool]: Listing elements and whether a next page exists
+                (always True without a has_next_page_selector)
+        """
+        soup = BeautifulSoup(html_content, self.backend, parse_only=self.strainer)
+        job_elements = self.listing_selector.select(soup)
+
+        has_next = True
+        if self.next_page_selector is not None:
+            has_next = self.next_page_selector.select_one(soup) is not None
+        return job_elements, has_next
+
+    def extract_fields(self, listing_element) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Extract the raw title, location and link from a listing element.
+
+        Args:
+            listing_element: BeautifulSoup element containing job information
+
+        Returns:
+            Tuple[Optional[str], Optional[str], Optional[str]]: Title,
+                location and href, None for any that are missing
+        """
+        title_element = self.title_selector.select_one(listing_element)
+        title = title_element.text.strip() if title_element else None
+
+        location_element = self.location_selector.select_one(listing_element)
+        location = location_element.text.strip() if location_element else None
+
+        link_element = self.link_selector.select_one(listing_element)
+        job_url = link_element.get('href') if link_element else None
+
+        return title, location, job_url
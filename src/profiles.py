@@ -0,0 +1,73 @@
+import json
+from typing import Dict, List, Tuple
+import logging
+from score_cache import criteria_fingerprint
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = 'default'
+
+def _load_json(path: str) -> Dict:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.error(f"Error loading search criteria from {path}: {str(e)}")
+        return {}
+
+def load_profiles(recipients: List[Dict],
+                  criteria_path: str = 'config/search_criteria.json') -> Tuple[Dict[str, Dict], Dict[str, List[Dict]]]:
+    """
+    Group recipients by the search criteria they should be matched with.
+
+    A recipient's optional ``criteria`` is either a dict of overrides or the
+    path of a criteria JSON file; either way it is merged over the shared
+    search_criteria.json. Recipients with the same effective criteria share
+    a profile, and those without overrides share the 'default' profile.
+    A ``profile`` name already used for different criteria gets a
+    fingerprint suffix, so recipients are never matched with someone
+    else's criteria.
+
+    Args:
+        recipients (List[Dict]): Recipients from email_list.json
+        criteria_path (str): Path to the shared search criteria
+
+    Returns:
+        Tuple[Dict[str, Dict], Dict[str, List[Dict]]]: Criteria by profile
+            name, and the recipients of each profile
+    """
+    base = _load_json(criteria_path)
+    base_fingerprint = criteria_fingerprint(base)
+    profiles: Dict[str, Dict] = {}
+    recipients_by_profile: Dict[str, List[Dict]] = {}
+    names: Dict[str, str] = {base_fingerprint: DEFAULT_PROFILE}
+    fingerprints: Dict[str, str] = {DEFAULT_PROFILE: base_fingerprint}
+
+    for recipient in recipients:
+        overrides = recipient.get('criteria') or {}
+        if isinstance(overrides, str):
+            overrides = _load_json(overrides)
+        criteria = {**base, **overrides}
+        fingerprint = criteria_fingerprint(criteria)
+        name = names.get(fingerprint)
+        if name is None:
+            name = recipient.get('profile') or f"profile-{fingerprint[:8]}"
+            if name in fingerprints:
+                unique_name = f"{name}-{fingerprint[:8]}"
+                logger.warning(f"Profile '{name}' of {recipient.get('email')} is already used for "
+                               f"different criteria, naming it '{unique_name}'")
+                name = unique_name
+            names[fingerprint] = name
+            fingerprints[name] = fingerprint
+        profiles[name] = criteria
+        recipients_by_profile.setdefault(name, []).append(recipient)
+
+    if not profiles:
+        profiles[DEFAULT_PROFILE] = base
+        recipients_by_profile[DEFAULT_PROFILE] = []
+    return profiles, recipients_by_profile
@@ -0,0 +1,294 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import logging
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_LIMIT = {
+    'requests_per_second': 0.5,
+    'burst': 1,
+    'backoff_base': 1.0,
+    'backoff_max': 60.0,
+    'max_retry_after': 120.0,
+    'failure_threshold': 5,
+    'reset_timeout': 300.0
+}
+
+class CircuitOpenError(Exception):
+    """Raised when a host's circuit breaker is refusing requests."""
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize a token bucket.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.not_before = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add the tokens accumulated since the last update."""
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Reserve one token.
+
+        The token count may go negative, which queues callers fairly: each
+        one gets back the time it has to wait before its token is available.
+
+        Returns:
+            float: Seconds to wait before using the token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.not_before - now)
+
+    def acquire(self) -> float:
+        """
+        Block until a token is available.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def defer(self, seconds: float):
+        """
+        Hold off every caller for at least the given time.
+
+        Args:
+            seconds (float): Seconds from now before the next request
+        """
+        with self._lock:
+            self.not_before = max(self.not_before, time.monotonic() + seconds)
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 300.0):
+        """
+        Initialize a circuit breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures before opening
+            reset_timeout (float): Seconds to stay open before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent.
+
+        Returns:
+            bool: True if closed, or if open long enough to allow one trial
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        """Count a failure and open the circuit once the threshold is hit."""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+class RateLimiter:
+    def __init__(self, defaults: Optional[Dict] = None):
+        """
+        Initialize a registry of per-host token buckets and circuit breakers.
+
+        Args:
+            defaults (Optional[Dict]): Default rate limit settings, merged over
+                DEFAULT_RATE_LIMIT
+        """
+        self.defaults = {**DEFAULT_RATE_LIMIT, **(defaults or {})}
+        self._host_config: Dict[str, Dict] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url: str) -> str:
+        """Extract the host a URL is served from."""
+        return urlparse(url).netloc
+
+    def configure_host(self, url: str, rate_limit: Optional[Dict] = None):
+        """
+        Set the rate limit for the host serving a URL.
+
+        The first configuration registered for a host wins, so companies that
+        share a host cannot loosen each other's limits.
+
+        Args:
+            url (str): Any URL on the host
+            rate_limit (Optional[Dict]): Per-host overrides of the defaults
+        """
+        host = self._host(url)
+        with self._lock:
+            if host not in self._host_config:
+                self._host_config[host] = {**self.defaults, **(rate_limit or {})}
+
+    def settings_for(self, url: str) -> Dict:
+        """
+        Get the effective rate limit settings for a URL's host.
+
+        Args:
+            url (str): URL on the host
+
+        Returns:
+            Dict: Rate limit settings
+        """
+        return self._host_config.get(self._host(url), self.defaults)
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                config = self._host_config.get(host, self.defaults)
+                self._buckets[host] = TokenBucket(config['requests_per_second'], config['burst'])
+            return self._buckets[host]
+
+    def _breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            if host not in self._breakers:
+                config = self._host_config.get(host, self.defaults)
+                self._breakers[host] = CircuitBreaker(config['failure_threshold'], config['reset_timeout'])
+            return self._breakers[host]
+
+    def acquire(self, url: str) -> float:
+        """
+        Wait for permission to request a URL.
+
+        Args:
+            url (str): URL about to be requested
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            CircuitOpenError: If the host's circuit breaker is open
+        """
+        host = self._host(url)
+        if not self._breaker(host).allow_request():
+            raise CircuitOpenError(f"Circuit open for {host}")
+        return self._bucket(host).acquire()
+
+    def defer(self, url: str, seconds: float):
+        """
+        Hold off all requests to a URL's host, e.g. for Retry-After.
+
+        Args:
+            url (str): URL on the host
+            seconds (float): Seconds to wait before the next request
+        """
+        self._bucket(self._host(url)).defer(seconds)
+
+    def record_success(self, url: str):
+        """Record a successful response from a URL's host."""
+        self._breaker(self._host(url)).record_success()
+
+    def record_failure(self, url: str):
+        """Record a failed request to a URL's host."""
+        breaker = self._breaker(self._host(url))
+        breaker.record_failure()
+        if breaker.state == CircuitBreaker.OPEN:
+            logger.warning(f"Circuit opened for {self._host(url)} after {breaker.failures} failures")
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """
+    Compute a full-jitter exponential backoff delay.
+
+    Args:
+        attempt (int): Zero-based retry attempt
+        base (float): Delay scale in seconds
+        cap (float): Maximum delay in seconds
+
+    Returns:
+        float: Seconds to sleep, uniform in [0, min(cap, base * 2**attempt)]
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value (Optional[str]): Header value, delta-seconds or an HTTP date
+
+    Returns:
+        Optional[float]: Seconds to wait, None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_limiter_lock = threading.Lock()
+
+def get_rate_limiter(defaults: Optional[Dict] = None) -> RateLimiter:
+    """
+    Get the process-wide rate limiter shared by all scrapers.
+
+    Args:
+        defaults (Optional[Dict]): Default settings, used on first call only
+
+    Returns:
+        RateLimiter: Shared rate limiter
+    """
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter(defaults)
+        return _shared_limiter
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+import logging
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Bump when the scoring logic changes so cached scores are discarded
+SCORING_VERSION = 1
+
+def criteria_fingerprint(criteria: Dict, **options) -> str:
+    """
+    Hash search criteria and scoring options into a cache fingerprint.
+
+    Args:
+        criteria (Dict): Loaded search criteria
+        **options: Other settings that change scores (e.g. the engine)
+
+    Returns:
+        str: Hex digest identifying this scoring configuration
+    """
+    payload = json.dumps(
+        {'version': SCORING_VERSION, 'criteria': criteria, 'options': options},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class ScoreCache:
+    def __init__(self, fingerprint: str, path: Optional[str] = 'data/score_cache.json',
+                 max_entries: int = 50000):
+        """
+        Initialize an LRU cache of match scores, persisted between runs.
+
+        Scores are keyed by normalized title and location. The cache file
+        records the criteria fingerprint it was built with and is ignored
+        when the fingerprint changes, e.g. after search_criteria.json is edited.
+
+        Args:
+            fingerprint (str): Fingerprint of the criteria scores depend on
+            path (Optional[str]): JSON file to persist to, None to keep in memory
+            max_entries (int): Entries kept before evicting the least recent
+        """
+        self.fingerprint = fingerprint
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, float]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path:
+            self._load()
+
+    def _load(self):
+        """Load persisted scores if they were computed with the same criteria."""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"Error loading score cache, starting empty: {str(e)}")
+            return
+
+        if data.get('fingerprint') != self.fingerprint:
+            logger.info("Search criteria changed, discarding cached match scores")
+            self._dirty = True
+            return
+        self._entries = OrderedDict(data.get('scores', []))
+
+    @staticmethod
+    def _key(title: str, location: str) -> str:
+        return f"{' '.join(title.lower().split())}\x1f{' '.join(location.lower().split())}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, title: str, location: str) -> Optional[float]:
+        """
+        Look up a cached score.
+
+        Args:
+            title (str): Job title
+            location (str): Job location
+
+        Returns:
+            Optional[float]: Cached score, None on a miss
+        """
+        key = self._key(title, location)
+        with self._lock:
+            score = self._entries.get(key)
+            if score is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return score
+
+    def put(self, title: str, location: str, score: float):
+        """
+        Cache a score, evicting the least recently used entry if full.
+
+        Args:
+            title (str): Job title
+            location (str): Job location
+            score (float): Match score
+        """
+        key = self._key(title, location)
+        with self._lock:
+            self._entries[key] = score
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def save(self):
+        """Atomically write the cache to disk if it changed."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, 'w') as f:
+                    json.dump({'fingerprint': self.fingerprint,
+                               'scores': list(self._entries.items())}, f)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                logger.error(f"Error saving score cache: {str(e)}")
@@ -1,10 +1,30 @@
+import math
+import re
 import requests
-from bs4 import BeautifulSoup
+import hashlib
 import json
 import time
-from typing import Dict, List, Optional
+import threading
+import queue
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+from urllib.parse import quote, urlsplit
+from settings import load_settings
+from rate_limiter import (
+    RateLimiter, CircuitOpenError, get_rate_limiter, backoff_delay, parse_retry_after
+)
+from http_cache import HTTPCache, get_http_cache
+from transport import HTTPTransport, get_transport
+from history import JobHistory
+from parsing import ListingParser
+from pagination import create_pagination
+from job_identity import JobIdentity
+from job_record import JobRecord
+from diagnostics import trace
+from metrics import COUNT_BUCKETS, get_metrics
 
 # Set up logging
 logging.basicConfig(
@@ -13,155 +33,711 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Status codes worth retrying; other client errors will not fix themselves
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+def _is_host_failure(status: Optional[int]) -> bool:
+    """
+    Check whether a failed request counts against the host's circuit breaker.
+
+    Args:
+        status (Optional[int]): Response status, None if no response arrived
+
+    Returns:
+        bool: True for connection errors, timeouts, 429 and 5xx responses
+    """
+    return status is None or status in (408, 429) or status >= 500
+
+DEFAULT_INCREMENTAL_SETTINGS = {
+    'enabled': True,
+    # Consecutive pages of already seen jobs after which pagination stops
+    'known_pages': 1,
+    # Every page is crawled at least this often, so nothing stays missed
+    'full_sweep_hours': 24
+}
+
 class JobScraper:
-    def __init__(self, company_config: Dict):
+    def __init__(self, company_config: Dict, rate_limiter: Optional[RateLimiter] = None,
+                 http_cache: Optional[HTTPCache] = None, transport: Optional[HTTPTransport] = None,
+                 history: Optional[JobHistory] = None):
         """
         Initialize the scraper with company-specific configuration.
         
         Args:
             company_config (Dict): Configuration for the company to scrape
+            rate_limiter (Optional[RateLimiter]): Per-host rate limiter, defaults
+                to the limiter shared by all scrapers
+            http_cache (Optional[HTTPCache]): Response cache, defaults to the
+                cache shared by all scrapers unless disabled in settings
+            transport (Optional[HTTPTransport]): HTTP transport, defaults to
+                the pooled transport shared by all scrapers
+            history (Optional[JobHistory]): Seen jobs, enabling incremental
+                crawls that stop once pages hold only known jobs
         """
         self.config = company_config
-        self.session = requests.Session()
-        if 'headers' in company_config:
-            self.session.headers.update(company_config['headers'])
+        self.headers = company_config.get('headers', {})
+        self.history = history
+        # Set per crawl by iter_jobs
+        self.incremental = False
+
+        settings = load_settings()
+        if transport is None:
+            transport = get_transport(settings.get('transport'))
+        self.transport = transport
+        self.scraper_settings = settings.get('scraper', {})
+        self.incremental_settings = {**DEFAULT_INCREMENTAL_SETTINGS,
+                                     **self.scraper_settings.get('incremental', {})}
+        if rate_limiter is None:
+            rate_limiter = get_rate_limiter(settings.get('rate_limit'))
+        self.rate_limiter = rate_limiter
+        if http_cache is None:
+            http_cache = get_http_cache(settings.get('http_cache'))
+        self.http_cache = http_cache
+        self.parser = ListingParser(company_config, self.scraper_settings.get('parser', 'auto'))
+        self.pagination = create_pagination(self)
+        self.identity = JobIdentity(company_config)
+        self.metrics = get_metrics()
+        # Cached parse results are only reused while the selectors are unchanged
+        selector_config = {key: value for key, value in company_config.items()
+                           if key.endswith('selector') or key in ('name', 'base_url', 'pagination', 'identity')}
+        self._parser_key = hashlib.sha256(
+            json.dumps(selector_config, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        for url in (company_config.get('career_url'),
+                    company_config.get('pagination', {}).get('base_url')):
+            if url:
+                self.rate_limiter.configure_host(url, company_config.get('rate_limit'))
     
-    def _make_request(self, url: str, retries: int = 3, delay: int = 2) -> Optional[str]:
+    def _make_request(self, url: str, retries: int = 3,
+                      headers: Optional[Dict[str, str]] = None, method: str = 'GET',
+                      json_body: Optional[Dict] = None) -> Optional[requests.Response]:
         """
-        Make an HTTP request with retry logic and delay.
+        Make an HTTP request with per-host rate limiting and retry logic.
+        
+        Failures are retried with jittered exponential backoff. A 429 or 503
+        with a Retry-After header holds off every request to the host for the
+        requested time, and a host whose circuit breaker is open is skipped.
         
         Args:
             url (str): URL to request
-            retries (int): Number of retries on failure
-            delay (int): Delay between retries in seconds
+            retries (int): Number of attempts before giving up
+            headers (Optional[Dict[str, str]]): Extra headers for this request
+            method (str): HTTP method
+            json_body (Optional[Dict]): JSON request body
         
         Returns:
-            Optional[str]: HTML content if successful, None otherwise
+            Optional[requests.Response]: Response if successful (including
+                304 Not Modified), None otherwise
         """
+        limits = self.rate_limiter.settings_for(url)
+        company = self.config['name']
         for attempt in range(retries):
             try:
-                response = self.session.get(url)
+                waited = self.rate_limiter.acquire(url)
+            except CircuitOpenError as e:
+                logger.warning(f"Skipping {url}: {str(e)}")
+                return None
+            if waited:
+                self.metrics.inc('scraper_sleep_seconds_total', waited, company=company, reason='rate_limit')
+
+            retry_after = None
+            start = time.perf_counter()
+            try:
+                try:
+                    response = self.transport.request(method, url, headers={**self.headers, **(headers or {})},
+                                                      json_body=json_body)
+                finally:
+                    self.metrics.observe('scraper_request_seconds', time.perf_counter() - start,
+                                         company=company)
+                self.metrics.inc('scraper_requests_total', company=company, status=response.status_code)
+                self.metrics.inc('scraper_response_bytes_total', len(response.content), company=company)
+                if response.status_code in (429, 503):
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
                 response.raise_for_status()
-                time.sleep(delay)  # Be respectful to the server
-                return response.text
+                self.rate_limiter.record_success(url)
+                return response
             except requests.RequestException as e:
                 logger.error(f"Attempt {attempt + 1} failed for {url}: {str(e)}")
-                if attempt < retries - 1:
-                    time.sleep(delay * (attempt + 1))  # Exponential backoff
-                continue
+                status = getattr(e.response, 'status_code', None)
+                if e.response is None:
+                    self.metrics.inc('scraper_requests_total', company=company, status='error')
+                if _is_host_failure(status):
+                    self.rate_limiter.record_failure(url)
+                else:
+                    # The host answered; a missing or forbidden page says
+                    # nothing about whether it is up
+                    self.rate_limiter.record_success(url)
+                if status is not None and status not in RETRYABLE_STATUS_CODES:
+                    return None
+
+            if attempt < retries - 1:
+                if retry_after is not None:
+                    if retry_after > limits['max_retry_after']:
+                        logger.warning(f"Giving up on {url}: Retry-After of {retry_after:.0f}s is too long")
+                        return None
+                    # The bucket wait in acquire() covers the Retry-After delay
+                    self.rate_limiter.defer(url, retry_after)
+                else:
+                    delay = backoff_delay(attempt, limits['backoff_base'], limits['backoff_max'])
+                    self.metrics.inc('scraper_sleep_seconds_total', delay, company=company, reason='backoff')
+                    time.sleep(delay)
         return None
 
-    def _parse_job_listing(self, listing_element) -> Optional[Dict]:
+    def _fetch_page(self, url: str) -> Optional[Tuple[str, bool]]:
+        """
+        Fetch a page, using conditional requests when a cached copy exists.
+        
+        Args:
+            url (str): URL to request
+        
+        Returns:
+            Optional[Tuple[str, bool]]: HTML content and whether it is
+                unchanged since the cached copy, None on failure
+        """
+        if self.http_cache is None:
+            response = self._make_request(url)
+            return (response.text, False) if response is not None else None
+
+        response = self._make_request(url, headers=self.http_cache.conditional_headers(url))
+        if response is not None and response.status_code == 304:
+            cached_body = self.http_cache.revalidate(url)
+            if cached_body is not None:
+                return cached_body, True
+            # The cached body is gone, so fetch the page unconditionally
+            response = self._make_request(url)
+        if response is None:
+            return None
+
+        unchanged = self.http_cache.store(
+            url, response.text,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        return response.text, unchanged
+
+    def _parse_job_listing(self, listing_element, scraped_date: Optional[str] = None) -> Optional[JobRecord]:
         """
         Parse a job listing element into structured data.
         
         Args:
             listing_element: BeautifulSoup element containing job information
+            scraped_date (Optional[str]): Timestamp of the page, now if None
         
         Returns:
-            Optional[Dict]: Structured job data if successful, None otherwise
+            Optional[JobRecord]: Structured job data if successful, None otherwise
         """
         try:
-            # Extract job title
-            title_element = listing_element.select_one(self.config['title_selector'])
-            title = title_element.text.strip() if title_element else None
-
-            # Extract location
-            location_element = listing_element.select_one(self.config['location_selector'])
-            location = location_element.text.strip() if location_element else None
-
-            # Extract job URL
-            link_element = listing_element.select_one(self.config['link_selector'])
-            job_url = link_element.get('href') if link_element else None
-            
-            # Handle relative URLs
-            if job_url and job_url.startswith('/'):
-                job_url = f"{self.config['base_url']}{job_url}"
-
-            if not all([title, location, job_url]):
-                logger.warning(f"Missing data - Title: {title}, Location: {location}, URL: {job_url}")
-                return None
-
-            # Print job details for debugging
-            print(f"\nFound Job:")
-            print(f"Title: {title}")
-            print(f"Location: {location}")
-            print(f"URL: {job_url}")
-            print("-" * 50)
-
-            return {
-                'title': title,
-                'location': location,
-                'url': job_url,
-                'company': self.config['name'],
-                'scraped_date': datetime.now().isoformat()
-            }
+            # Extract job title, location and URL with the precompiled selectors
+            title, location, job_url = self.parser.extract_fields(listing_element)
+            return self._make_job(title, location, job_url, scraped_date)
 
         except Exception as e:
             logger.error(f"Error parsing job listing: {str(e)}")
             return None
 
-    def scrape_jobs(self) -> List[Dict]:
+    def _make_job(self, title: Optional[str], location: Optional[str],
+                  job_url: Optional[str], scraped_date: Optional[str] = None) -> Optional[JobRecord]:
         """
-        Scrape all job listings from the company's career page.
+        Build a job record from its extracted fields.
+        
+        Args:
+            title (Optional[str]): Job title
+            location (Optional[str]): Job location
+            job_url (Optional[str]): Absolute or site-relative job URL
+            scraped_date (Optional[str]): Timestamp shared by the jobs of
+                a page, now if None
+        
+        Returns:
+            Optional[JobRecord]: Structured job data, None if a field is missing
+        """
+        # Handle relative URLs
+        if job_url and job_url.startswith('/'):
+            job_url = f"{self.config['base_url']}{job_url}"
+
+        if not all([title, location, job_url]):
+            logger.warning(f"Missing data - Title: {title}, Location: {location}, URL: {job_url}")
+            return None
+
+        logger.debug("Found job: %s | %s | %s", title, location, job_url)
+
+        return JobRecord.create(
+            title=title,
+            location=location,
+            url=job_url,
+            company=self.config['name'],
+            scraped_date=scraped_date or datetime.now().isoformat(),
+            job_key=self.identity.key_for(job_url, title, location)
+        )
+
+    def _scrape_page(self, url: str, page: int) -> Optional[Dict]:
+        """
+        Fetch and parse a single page of job listings.
+        
+        When the page is unchanged since the last run (304 Not Modified or an
+        identical body), the jobs parsed last time are reused without parsing.
+        
+        Args:
+            url (str): URL of the page
+            page (int): Page number, for logging
+        
+        Returns:
+            Optional[Dict]: Page result with 'jobs', 'listing_count' and
+                'has_next' keys, None if the page could not be fetched
+        """
+        fetched = self._fetch_page(url)
+        if fetched is None:
+            return None
+        html_content, unchanged = fetched
+
+        if unchanged:
+            cached = self.http_cache.get_parsed(url, self._parser_key)
+            if cached is not None:
+                self.metrics.inc('scraper_pages_total', company=self.config['name'], source='cache')
+                logger.debug("%s page %d unchanged since last run, reusing parsed jobs",
+                             self.config['name'], page)
+                scraped_date = datetime.now().isoformat()
+                return {
+                    'jobs': [JobRecord.from_dict(job, scraped_date) for job in cached['jobs']],
+                    'listing_count': cached['listing_count'],
+                    'has_next': cached['has_next']
+                }
+
+        result = self._parse_page(html_content)
+        if self.http_cache is not None:
+            self.http_cache.store_parsed(url, self._parser_key,
+                                         {**result, 'jobs': [job.to_dict() for job in result['jobs']]})
+        return result
+
+    def _parse_page(self, html_content: str, skip_listings: int = 0, source: str = 'network') -> Dict:
+        """
+        Parse a page of listings into jobs.
+        
+        Args:
+            html_content (str): HTML of the page
+            skip_listings (int): Leading listings to skip, for pages that keep
+                earlier results when more are loaded
+            source (str): Where the page came from, for metrics
+        
+        Returns:
+            Dict: Page result with 'jobs', 'listing_count' and 'has_next' keys
+        """
+        start = time.perf_counter()
+        job_elements, has_next = self.parser.parse_page(html_content)
+        job_elements = job_elements[skip_listings:]
+
+        # Parse each job listing; jobs on a page share one timestamp
+        scraped_date = datetime.now().isoformat()
+        jobs = []
+        for job_element in job_elements:
+            job_data = self._parse_job_listing(job_element, scraped_date)
+            if job_data:
+                jobs.append(job_data)
+
+        company = self.config['name']
+        self.metrics.observe('scraper_parse_seconds', time.perf_counter() - start, company=company)
+        self.metrics.observe('scraper_jobs_per_page', len(jobs), COUNT_BUCKETS, company=company)
+        self.metrics.inc('scraper_pages_total', company=company, source=source)
+        return {'jobs': jobs, 'listing_count': len(job_elements), 'has_next': has_next}
+
+    def _page_url(self, page: int) -> str:
+        """
+        Construct the URL for a page of listings.
+        
+        Args:
+            page (int): Page number, starting at 1
+        
+        Returns:
+            str: URL of the page
+        """
+        if page == 1:
+            return self.config['career_url']
+        return f"{self.config['pagination']['base_url']}?{self.config['pagination']['param_name']}={page}"
+
+    def _use_concurrent_pagination(self, max_pages: int) -> bool:
+        """
+        Check whether pages should be fetched speculatively in parallel.
+        
+        Only url_param pagination qualifies, since every page URL is known
+        up front, and only on full sweeps: incremental crawls fetch pages
+        one at a time so they can stop at the first page of known jobs.
+        Requests still wait for the host's rate limit, whose burst bounds
+        how many pages are actually in flight.
+        
+        Args:
+            max_pages (int): Number of pages to scrape
+        
+        Returns:
+            bool: True if concurrent pagination is enabled for this company
+        """
+        pagination = self.config.get('pagination', {})
+        enabled = pagination.get('concurrent', self.scraper_settings.get('concurrent_pagination', False))
+        # Speculative fetches would defeat stopping at the first known page
+        return enabled and not self.incremental and pagination.get('type') == 'url_param' and max_pages > 1
+
+    def _use_incremental_crawl(self) -> bool:
+        """
+        Check whether this crawl may stop once pages hold only known jobs.
+        
+        Crawls are incremental when a history is available and enabled in
+        settings (and not disabled for the company), except when the
+        company's last full sweep is older than ``full_sweep_hours``.
         
         Returns:
-            List[Dict]: List of job listings
+            bool: True for an incremental crawl, False for a full sweep
+        """
+        pagination = self.config.get('pagination', {})
+        if self.history is None or not pagination.get('incremental', self.incremental_settings['enabled']):
+            return False
+        last_sweep = self.history.last_full_sweep(self.config['name'])
+        if last_sweep is None:
+            return False
+        try:
+            age = datetime.now() - datetime.fromisoformat(last_sweep)
+        except ValueError:
+            return False
+        return age < timedelta(hours=self.incremental_settings['full_sweep_hours'])
+
+    def _iter_pages(self, max_pages: int) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """
+        Fetch and parse pages one after another.
+        
+        Args:
+            max_pages (int): Number of pages to scrape
+        
+        Yields:
+            Tuple[int, Optional[Dict]]: Page number and page result
+        """
+        for page in range(1, max_pages + 1):
+            yield page, self._scrape_page(self._page_url(page), page)
+
+    def _iter_pages_concurrently(self, max_pages: int, first_page: int = 1,
+                                 scrape_page: Optional[Callable[[int], Optional[Dict]]] = None
+                                 ) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """
+        Fetch all pages speculatively in parallel, yielding them in order.
+        
+        Requests still go through the per-host rate limiter. Once the caller
+        stops iterating (e.g. on an empty page), pages not yet requested are
+        cancelled; at most ``page_workers`` requests already in flight finish.
+        
+        Args:
+            max_pages (int): Number of pages to scrape
+            first_page (int): First page to fetch
+            scrape_page (Optional[Callable[[int], Optional[Dict]]]): Fetches
+                and parses a page by number, defaults to the listing page
+        
+        Yields:
+            Tuple[int, Optional[Dict]]: Page number and page result
+        """
+        stop = threading.Event()
+        if scrape_page is None:
+            scrape_page = lambda page: self._scrape_page(self._page_url(page), page)
+
+        def fetch(page: int) -> Optional[Dict]:
+            if stop.is_set():
+                return None
+            return scrape_page(page)
+
+        executor = ThreadPoolExecutor(max_workers=self.scraper_settings.get('page_workers', 4))
+        futures = [executor.submit(fetch, page) for page in range(first_page, max_pages + 1)]
+        try:
+            for page, future in enumerate(futures, start=first_page):
+                yield page, future.result()
+        finally:
+            stop.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _iter_listing_pages(self, max_pages: int) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """Fetch and parse pages with the company's pagination strategy."""
+        return self.pagination.iter_pages(max_pages)
+
+    def _listing_url(self, page: int) -> str:
+        """URL of a page of results, for logging and traces."""
+        return self.pagination.page_url(page)
+
+    def iter_jobs(self) -> Iterator[JobRecord]:
         """
-        all_jobs = []
-        page = 1
+        Scrape job listings from the company's career page as a stream.
+        
+        Jobs are yielded page by page as soon as each page is parsed, so
+        consumers can start on them before pagination finishes.
+        
+        Yields:
+            JobRecord: Job listing
+        """
+        job_count = 0
         max_pages = self.config['pagination'].get('max_pages', 20)
 
-        print(f"\n=== Starting scraping for {self.config['name']} ===")
-        print(f"Max pages to scrape: {max_pages}")
-        
-        while page <= max_pages:
-            # Construct URL for current page
-            if page == 1:
-                url = self.config['career_url']
-            else:
-                url = f"{self.config['pagination']['base_url']}?{self.config['pagination']['param_name']}={page}"
-            
-            print(f"\nScraping page {page}")
-            print(f"URL: {url}")
-            
-            html_content = self._make_request(url)
-            
-            if not html_content:
-                print(f"❌ Failed to get content for page {page}")
-                break
-
-            soup = BeautifulSoup(html_content, 'html.parser')
-            job_elements = soup.select(self.config['job_listing_selector'])
-            
-            print(f"Found {len(job_elements)} job listings on page {page}")
-
-            if not job_elements:
-                print(f"No job listings found on page {page}, stopping pagination")
-                break
-
-            # Parse each job listing
-            for job_element in job_elements:
-                job_data = self._parse_job_listing(job_element)
-                if job_data:
-                    all_jobs.append(job_data)
-
-            # Check if we should continue to next page
-            # Some sites might have a specific "next page" indicator or total pages count
-            if self.config.get('pagination', {}).get('has_next_page_selector'):
-                next_page = soup.select_one(self.config['pagination']['has_next_page_selector'])
-                if not next_page:
-                    print(f"No next page indicator found after page {page}")
+        company = self.config['name']
+        self.incremental = self._use_incremental_crawl()
+        known_pages_limit = self.config['pagination'].get('known_pages', self.incremental_settings['known_pages'])
+        logger.info(f"Starting {'incremental' if self.incremental else 'full'} scraping for {company} "
+                    f"(max {max_pages} pages)")
+
+        pages = self._iter_listing_pages(max_pages)
+        known_pages = 0
+        complete = True
+
+        try:
+            for page, page_result in pages:
+                if page_result is None:
+                    logger.warning(f"Failed to get content for {company} page {page}")
+                    trace('page_failed', company=company, page=page, url=self._listing_url(page))
+                    complete = False
+                    break
+
+                logger.debug("%s page %d: %d job listings (%s)", company, page,
+                             page_result['listing_count'], self._listing_url(page))
+                trace('page_scraped', company=company, page=page, url=self._listing_url(page),
+                      listings=page_result['listing_count'], jobs=len(page_result['jobs']),
+                      has_next=page_result['has_next'])
+
+                if not page_result['listing_count']:
+                    logger.debug("%s: no job listings on page %d, stopping pagination", company, page)
                     break
-            
-            page += 1
-            print(f"Moving to page {page}")
-            print("-" * 50)
 
-        print(f"\n=== Scraping Complete for {self.config['name']} ===")
-        print(f"Total jobs found: {len(all_jobs)}")
-        print("=" * 50)
-        return all_jobs
+                # Jobs only enter the history after the run, so this sees
+                # the history as it was when the run started
+                all_known = self.incremental and bool(page_result['jobs']) and \
+                    all(job['job_key'] in self.history for job in page_result['jobs'])
+                known_pages = known_pages + 1 if all_known else 0
+
+                job_count += len(page_result['jobs'])
+                yield from page_result['jobs']
+
+                if self.incremental and known_pages >= known_pages_limit:
+                    logger.debug("%s: %d pages of known jobs, stopping at page %d", company, known_pages, page)
+                    complete = False
+                    break
+
+                # Check if we should continue to next page
+                if not page_result['has_next']:
+                    logger.debug("%s: no next page indicator after page %d", company, page)
+                    break
+        finally:
+            pages.close()
+            if self.http_cache is not None:
+                self.http_cache.save()
+
+        self.metrics.inc('scraper_crawls_total', company=company,
+                         mode='incremental' if self.incremental else 'full',
+                         stopped='end' if complete else 'early')
+        if complete and self.history is not None:
+            self.history.note_full_sweep(company)
+        logger.info(f"Scraping complete for {company}: {job_count} jobs found")
+
+    def scrape_jobs(self) -> List[JobRecord]:
+        """
+        Scrape all job listings from the company's career page.
+        
+        Returns:
+            List[JobRecord]: List of job listings
+        """
+        return list(self.iter_jobs())
+
+class ApiScraper(JobScraper, ABC):
+    """
+    Base for boards whose search page is backed by a JSON API.
+
+    Results are requested by offset, page_size at a time, so there is no
+    HTML to download or parse. The first request reports the total, after
+    which the remaining offsets are fetched concurrently. If the API cannot
+    be reached, the board's browser pagination is used instead.
+    """
+    default_page_size = 20
+
+    def __init__(self, company_config: Dict, rate_limiter: Optional[RateLimiter] = None,
+                 http_cache: Optional[HTTPCache] = None, transport: Optional[HTTPTransport] = None,
+                 history: Optional[JobHistory] = None):
+        super().__init__(company_config, rate_limiter, http_cache, transport, history)
+        pagination = company_config.get('pagination', {})
+        self.page_size = pagination.get('page_size', self.default_page_size)
+        self.api_url = pagination.get('api_url') or self._default_api_url()
+        self.rate_limiter.configure_host(self.api_url, company_config.get('rate_limit'))
+
+    @abstractmethod
+    def _default_api_url(self) -> str:
+        """Search endpoint derived from the career page URL."""
+
+    @abstractmethod
+    def _api_request(self, offset: int) -> Tuple[str, str, Optional[Dict]]:
+        """
+        Build the search request for a page of results.
+
+        Args:
+            offset (int): Index of the first result
+
+        Returns:
+            Tuple[str, str, Optional[Dict]]: Method, URL and JSON body
+        """
+
+    @abstractmethod
+    def _parse_api_page(self, payload: Dict) -> Tuple[List[Tuple[Optional[str], Optional[str], Optional[str]]], Optional[int]]:
+        """
+        Extract postings from a search response.
+
+        Args:
+            payload (Dict): Decoded JSON response
+
+        Returns:
+            Tuple[List[Tuple], Optional[int]]: Title, location and URL of
+                each posting, and the total number of results if reported
+        """
+
+    def _scrape_api_page(self, page: int) -> Optional[Dict]:
+        """
+        Fetch and parse one page of search results.
+
+        Args:
+            page (int): Page number, starting at 1
+
+        Returns:
+            Optional[Dict]: Page result with 'jobs', 'listing_count',
+                'has_next' and 'total' keys, None if the request failed
+        """
+        offset = (page - 1) * self.page_size
+        method, url, body = self._api_request(offset)
+        response = self._make_request(url, headers={'Accept': 'application/json'},
+                                      method=method, json_body=body)
+        if response is None:
+            return None
+        try:
+            payload = response.json()
+        except ValueError as e:
+            logger.error(f"Invalid JSON from {url}: {str(e)}")
+            return None
+
+        start = time.perf_counter()
+        postings, total = self._parse_api_page(payload)
+        scraped_date = datetime.now().isoformat()
+        jobs = []
+        for title, location, job_url in postings:
+            job = self._make_job(title, location, job_url, scraped_date)
+            if job:
+                jobs.append(job)
+
+        company = self.config['name']
+        self.metrics.observe('scraper_parse_seconds', time.perf_counter() - start, company=company)
+        self.metrics.observe('scraper_jobs_per_page', len(jobs), COUNT_BUCKETS, company=company)
+        self.metrics.inc('scraper_pages_total', company=company, source='api')
+        has_next = len(postings) == self.page_size and (total is None or offset + len(postings) < total)
+        return {'jobs': jobs, 'listing_count': len(postings), 'has_next': has_next, 'total': total}
+
+    def _iter_listing_pages(self, max_pages: int) -> Iterator[Tuple[int, Optional[Dict]]]:
+        first = self._scrape_api_page(1)
+        if first is None:
+            logger.warning(f"Search API unavailable for {self.config['name']}, rendering the board instead")
+            yield from self.pagination.iter_pages(max_pages)
+            return
+        yield 1, first
+        if not first['has_next']:
+            return
+
+        last_page = max_pages
+        if first['total']:
+            last_page = min(max_pages, math.ceil(first['total'] / self.page_size))
+        yield from self._iter_pages_concurrently(last_page, first_page=2, scrape_page=self._scrape_api_page)
+
+    def _listing_url(self, page: int) -> str:
+        return f"{self.api_url}#offset={(page - 1) * self.page_size}"
+
+class WorkdayScraper(ApiScraper):
+    """Workday boards, through the CXS jobs endpoint behind the search page."""
+    # Workday rejects larger pages
+    default_page_size = 20
+
+    def _default_api_url(self) -> str:
+        parts = urlsplit(self.config['career_url'])
+        tenant = parts.hostname.split('.')[0]
+        site = parts.path.strip('/').split('/')[0]
+        return f"{parts.scheme}://{parts.netloc}/wday/cxs/{tenant}/{site}/jobs"
+
+    def _api_request(self, offset: int) -> Tuple[str, str, Optional[Dict]]:
+        body = {
+            'appliedFacets': self.config['pagination'].get('applied_facets', {}),
+            'limit': self.page_size,
+            'offset': offset,
+            'searchText': self.config['pagination'].get('search_text', '')
+        }
+        return 'POST', self.api_url, body
+
+    def _parse_api_page(self, payload: Dict):
+        career_url = self.config['career_url'].rstrip('/')
+        postings = [
+            (posting.get('title'), posting.get('locationsText'),
+             f"{career_url}{posting['externalPath']}" if posting.get('externalPath') else None)
+            for posting in payload.get('jobPostings') or []
+        ]
+        # Workday only reports the total on the first page
+        return postings, payload.get('total') or None
+
+class OracleScraper(ApiScraper):
+    """Oracle Recruiting Cloud boards, through the candidate experience REST API."""
+    default_page_size = 100
+
+    def __init__(self, company_config: Dict, rate_limiter: Optional[RateLimiter] = None,
+                 http_cache: Optional[HTTPCache] = None, transport: Optional[HTTPTransport] = None,
+                 history: Optional[JobHistory] = None):
+        match = re.search(r'/sites/([^/?#]+)', company_config['career_url'])
+        self.site_number = company_config.get('pagination', {}).get(
+            'site_number', match.group(1) if match else 'CX_1')
+        super().__init__(company_config, rate_limiter, http_cache, transport, history)
+
+    def _default_api_url(self) -> str:
+        return f"{self.config['base_url']}/hcmRestApi/resources/latest/recruitingCEJobRequisitions"
+
+    def _api_request(self, offset: int) -> Tuple[str, str, Optional[Dict]]:
+        finder = (f"findReqs;siteNumber={self.site_number},limit={self.page_size},"
+                  f"offset={offset},sortBy=POSTING_DATES_DESC")
+        keyword = self.config['pagination'].get('search_text')
+        if keyword:
+            finder += f',keyword="{keyword}"'
+        url = f"{self.api_url}?onlyData=true&expand=requisitionList&finder={quote(finder, safe='=,;')}"
+        return 'GET', url, None
+
+    def _parse_api_page(self, payload: Dict):
+        search = (payload.get('items') or [{}])[0]
+        job_url = f"{self.config['base_url']}/hcmUI/CandidateExperience/en/sites/{self.site_number}/job"
+        postings = [
+            (requisition.get('Title'), requisition.get('PrimaryLocation'),
+             f"{job_url}/{requisition['Id']}" if requisition.get('Id') else None)
+            for requisition in search.get('requisitionList') or []
+        ]
+        return postings, search.get('TotalJobsCount')
+
+# Boards with a search API, by pagination type
+SCRAPER_ADAPTERS = {
+    'workday': WorkdayScraper,
+    'oracle': OracleScraper
+}
+
+def create_scraper(company_config: Dict, rate_limiter: Optional[RateLimiter] = None,
+                   http_cache: Optional[HTTPCache] = None,
+                   transport: Optional[HTTPTransport] = None,
+                   history: Optional[JobHistory] = None) -> JobScraper:
+    """
+    Create the scraper for a company.
+
+    Workday and Oracle boards use their JSON search API unless
+    ``pagination.api`` is false; every other board is scraped from HTML.
+
+    Args:
+        company_config (Dict): Configuration for the company to scrape
+        rate_limiter (Optional[RateLimiter]): Per-host rate limiter
+        http_cache (Optional[HTTPCache]): Response cache
+        transport (Optional[HTTPTransport]): HTTP transport
+        history (Optional[JobHistory]): Seen jobs, for incremental crawls
+
+    Returns:
+        JobScraper: Scraper for the company
+    """
+    pagination = company_config.get('pagination', {})
+    scraper_class = JobScraper
+    if pagination.get('api', True):
+        scraper_class = SCRAPER_ADAPTERS.get(pagination.get('type'), JobScraper)
+    return scraper_class(company_config, rate_limiter, http_cache, transport, history)
 
 def load_company_configs(config_path: str = 'config/companies.json') -> List[Dict]:
     """
@@ -181,24 +757,144 @@ def load_company_configs(config_path: str = 'config/companies.json') -> List[Dic
         logger.error(f"Error loading company configs: {str(e)}")
         return []
 
-def scrape_all_companies() -> List[Dict]:
+# Marks the end of one company's stream in iter_all_companies
+_COMPANY_DONE = object()
+
+def _iter_company(company_config: Dict, history: Optional[JobHistory] = None) -> Iterator[JobRecord]:
     """
-    Scrape jobs from all configured companies.
+    Stream a single company's jobs, logging and swallowing any error.
+    
+    Args:
+        company_config (Dict): Configuration for the company to scrape
+        history (Optional[JobHistory]): Seen jobs, for incremental crawls
+    
+    Yields:
+        JobRecord: Job listing
+    """
+    try:
+        scraper = create_scraper(company_config, history=history)
+        yield from scraper.iter_jobs()
+    except Exception as e:
+        logger.error(f"Error scraping {company_config['name']}: {str(e)}")
+
+def _scrape_company(company_config: Dict) -> List[JobRecord]:
+    """
+    Scrape a single company, logging and swallowing any error.
+    
+    Args:
+        company_config (Dict): Configuration for the company to scrape
     
     Returns:
-        List[Dict]: Combined list of all job listings
+        List[JobRecord]: Job listings for the company, empty on failure
     """
-    all_jobs = []
-    companies = load_company_configs()
+    return list(_iter_company(company_config))
+
+def _resolve_max_workers(max_workers: Optional[int]) -> int:
+    """Fall back to ``scraper.max_workers`` in settings."""
+    if max_workers is None:
+        return load_settings().get('scraper', {}).get('max_workers', 4)
+    return max_workers
+
+def iter_all_companies(max_workers: Optional[int] = None,
+                       buffer_size: Optional[int] = None,
+                       history: Optional[JobHistory] = None) -> Iterator[JobRecord]:
+    """
+    Stream jobs from all configured companies as they are scraped.
     
-    for company_config in companies:
+    Companies are scraped concurrently and their jobs are handed over
+    through a bounded queue, so memory stays flat and the first jobs arrive
+    before the slowest company finishes. Jobs from different companies may
+    be interleaved.
+    
+    Args:
+        max_workers (Optional[int]): Number of companies scraped in parallel,
+            defaults to ``scraper.max_workers`` in settings. Use 1 to scrape
+            sequentially.
+        buffer_size (Optional[int]): Jobs buffered ahead of the consumer,
+            defaults to ``scraper.stream_buffer`` in settings
+        history (Optional[JobHistory]): Seen jobs; with it, companies are
+            crawled incrementally between full sweeps
+    
+    Yields:
+        JobRecord: Job listing
+    """
+    companies = load_company_configs()
+    max_workers = _resolve_max_workers(max_workers)
+
+    if max_workers <= 1 or len(companies) <= 1:
+        for company_config in companies:
+            yield from _iter_company(company_config, history)
+        return
+
+    if buffer_size is None:
+        buffer_size = load_settings().get('scraper', {}).get('stream_buffer', 1000)
+    jobs_queue = queue.Queue(maxsize=buffer_size)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Give up once the consumer has gone away instead of blocking forever
+        while not stop.is_set():
+            try:
+                jobs_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(company_config: Dict):
+        jobs = _iter_company(company_config, history)
         try:
-            scraper = JobScraper(company_config)
-            jobs = scraper.scrape_jobs()
-            all_jobs.extend(jobs)
-        except Exception as e:
-            logger.error(f"Error scraping {company_config['name']}: {str(e)}")
-            continue
+            for job in jobs:
+                if not put(job):
+                    break
+        finally:
+            jobs.close()
+            put(_COMPANY_DONE)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    for company_config in companies:
+        executor.submit(produce, company_config)
+
+    remaining = len(companies)
+    try:
+        while remaining:
+            item = jobs_queue.get()
+            if item is _COMPANY_DONE:
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
+
+def scrape_all_companies(max_workers: Optional[int] = None) -> List[JobRecord]:
+    """
+    Scrape jobs from all configured companies.
+    
+    Companies are scraped concurrently on a thread pool. Requests to the same
+    host still share that host's rate limit, so politeness is kept per host
+    while the total run time approaches that of the slowest company.
+    
+    Args:
+        max_workers (Optional[int]): Number of companies scraped in parallel,
+            defaults to ``scraper.max_workers`` in settings. Use 1 to scrape
+            sequentially.
+    
+    Returns:
+        List[JobRecord]: Combined list of all job listings, in company order
+    """
+    companies = load_company_configs()
+    max_workers = _resolve_max_workers(max_workers)
+
+    if max_workers <= 1 or len(companies) <= 1:
+        results = [_scrape_company(company_config) for company_config in companies]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_scrape_company, companies))
+
+    all_jobs = []
+    for jobs in results:
+        all_jobs.extend(jobs)
 
     return all_jobs
 
@@ -0,0 +1,29 @@
+import json
+from typing import Dict
+import logging
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def load_settings(settings_path: str = 'config/settings.json') -> Dict:
+    """
+    Load runtime settings from JSON file.
+    
+    Args:
+        settings_path (str): Path to settings file
+    
+    Returns:
+        Dict: Runtime settings, empty if the file is missing or invalid
+    """
+    try:
+        with open(settings_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.error(f"Error loading settings: {str(e)}")
+        return {}
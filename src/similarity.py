@@ -0,0 +1,122 @@
+from difflib import SequenceMatcher
+from typing import Dict, List, Sequence
+import logging
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+def title_spans(title: str) -> List[str]:
+    """
+    List every contiguous span of words in a title.
+
+    Args:
+        title (str): Job title
+
+    Returns:
+        List[str]: Lowercased word spans, e.g. 'a b' -> ['a', 'a b', 'b']
+    """
+    words = title.lower().split()
+    return [" ".join(words[i:j]) for i in range(len(words)) for j in range(i + 1, len(words) + 1)]
+
+def sequence_similarity(term: str, title: str) -> float:
+    """
+    Score a term against the best matching word span of a title with difflib.
+
+    This is the reference algorithm: SequenceMatcher ratio against every
+    span, stopping early once a span scores above 0.9.
+
+    Args:
+        term (str): Keyword or related term
+        title (str): Job title
+
+    Returns:
+        float: Similarity score between 0 and 1
+    """
+    term = term.lower()
+    max_score = 0
+    for part in title_spans(title):
+        score = SequenceMatcher(None, term, part).ratio()
+        max_score = max(max_score, score)
+
+        # Early exit if we find a very good match
+        if max_score > 0.9:
+            return max_score
+
+    return max_score
+
+def resolve_engine(engine: str = 'auto') -> str:
+    """
+    Pick the similarity engine to use.
+
+    Args:
+        engine (str): 'rapidfuzz', 'difflib' or 'auto'
+
+    Returns:
+        str: 'rapidfuzz' if requested (or 'auto') and installed, else 'difflib'
+    """
+    if engine in ('auto', 'rapidfuzz') and HAS_RAPIDFUZZ:
+        return 'rapidfuzz'
+    if engine == 'rapidfuzz':
+        logger.warning("rapidfuzz is not installed, falling back to difflib matching")
+    return 'difflib'
+
+def batch_similarity(terms: Sequence[str], titles: Sequence[str],
+                     engine: str = 'auto') -> Dict[str, List[float]]:
+    """
+    Score every title against every term at once.
+
+    With rapidfuzz, the word spans of all titles are deduplicated and scored
+    against all terms in a single ``process.cdist`` call (normalized Indel
+    similarity, which equals difflib's ratio whenever difflib finds the
+    longest common subsequence), then reduced to the best span per title.
+
+    Args:
+        terms (Sequence[str]): Keywords or related terms
+        titles (Sequence[str]): Job titles
+        engine (str): 'rapidfuzz', 'difflib' or 'auto'
+
+    Returns:
+        Dict[str, List[float]]: For each distinct title, one score per term
+            in the order of ``terms``
+    """
+    unique_titles = list(dict.fromkeys(titles))
+    if resolve_engine(engine) == 'difflib' or not terms or not unique_titles:
+        return {title: [sequence_similarity(term, title) for term in terms]
+                for title in unique_titles}
+
+    span_index: Dict[str, int] = {}
+    flat_indices: List[int] = []
+    offsets: List[int] = []
+    titles_with_spans: List[str] = []
+    scores: Dict[str, List[float]] = {}
+    for title in unique_titles:
+        spans = title_spans(title)
+        if not spans:
+            scores[title] = [0.0] * len(terms)
+            continue
+        titles_with_spans.append(title)
+        offsets.append(len(flat_indices))
+        for span in spans:
+            flat_indices.append(span_index.setdefault(span, len(span_index)))
+
+    if titles_with_spans:
+        lowered_terms = [term.lower() for term in terms]
+        matrix = process.cdist(lowered_terms, list(span_index), scorer=fuzz.ratio,
+                               dtype=np.float64, workers=-1)
+        # Best span per title: max over each title's run of span columns
+        best = np.maximum.reduceat(matrix[:, flat_indices], offsets, axis=1) / 100.0
+        for column, title in enumerate(titles_with_spans):
+            scores[title] = best[:, column].tolist()
+
+    return scores
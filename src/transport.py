@@ -0,0 +1,265 @@
+import atexit
+import socket
+import threading
+import time
+from typing import Dict, Optional, Tuple
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from metrics import get_metrics
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
+
+try:
+    import httpx
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+DEFAULT_TRANSPORT_SETTINGS = {
+    'connect_timeout': 5.0,
+    'read_timeout': 30.0,
+    # Hosts with a kept-alive pool, and connections kept per host
+    'pool_connections': 16,
+    'pool_maxsize': 8,
+    'dns_cache_ttl': 300.0,
+    'http2': False
+}
+
+class DNSCache:
+    def __init__(self, ttl: float = 300.0):
+        """
+        Initialize a cache of successful getaddrinfo results.
+
+        Every scraper, page worker and reconnect to a host after a dropped
+        keep-alive connection resolves the same few hostnames; cached results
+        are reused for ttl seconds. Failed lookups are not cached. Only
+        connections opened by the transport use the cache; other lookups in
+        the process, e.g. for SMTP or the browser driver, are unaffected.
+
+        Args:
+            ttl (float): Seconds a result is reused
+        """
+        self.ttl = ttl
+        self.metrics = get_metrics()
+        self._entries: Dict[Tuple, Tuple[float, list]] = {}
+        self._lock = threading.Lock()
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self.metrics.inc('transport_dns_lookups_total', result='hit')
+            return list(entry[1])
+
+        self.metrics.inc('transport_dns_lookups_total', result='miss')
+        result = socket.getaddrinfo(host, port, family, type, proto, flags)
+        with self._lock:
+            self._entries[key] = (now + self.ttl, list(result))
+        return result
+
+class _CachedDNSConnection:
+    """Connection mixin that resolves its host through a DNSCache."""
+    dns_cache: Optional[DNSCache] = None
+
+    def _new_conn(self):
+        if self.dns_cache is None:
+            return super()._new_conn()
+        try:
+            addresses = self.dns_cache.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+        except socket.gaierror:
+            # Let urllib3 resolve again and raise its own error
+            return super()._new_conn()
+
+        host, last_error = self._dns_host, None
+        try:
+            # TLS still verifies against self.host; only the address changes
+            for *_, sockaddr in addresses:
+                self._dns_host = sockaddr[0]
+                try:
+                    return super()._new_conn()
+                except ConnectTimeoutError as e:
+                    last_error = e
+        finally:
+            self._dns_host = host
+        raise last_error
+
+class _CachedDNSHTTPConnection(_CachedDNSConnection, HTTPConnection):
+    pass
+
+class _CachedDNSHTTPSConnection(_CachedDNSConnection, HTTPSConnection):
+    pass
+
+class CachedDNSAdapter(HTTPAdapter):
+    def __init__(self, dns_cache: DNSCache, **kwargs):
+        """
+        Initialize an adapter whose connections resolve hosts through a DNS cache.
+
+        Args:
+            dns_cache (DNSCache): Cache shared by the adapter's connections
+            **kwargs: HTTPAdapter arguments
+        """
+        self.dns_cache = dns_cache
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        attributes = {'dns_cache': self.dns_cache}
+        http_connection = type('HTTPConnection', (_CachedDNSHTTPConnection,), attributes)
+        https_connection = type('HTTPSConnection', (_CachedDNSHTTPSConnection,), attributes)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': type('HTTPConnectionPool', (HTTPConnectionPool,), {'ConnectionCls': http_connection}),
+            'https': type('HTTPSConnectionPool', (HTTPSConnectionPool,), {'ConnectionCls': https_connection})
+        }
+
+def _to_requests_response(response: 'httpx.Response') -> requests.Response:
+    """Wrap an httpx response so scrapers handle both transports the same way."""
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted._content = response.content
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.url = str(response.url)
+    converted.reason = response.reason_phrase
+    converted.encoding = response.encoding
+    return converted
+
+class HTTPTransport:
+    def __init__(self, connect_timeout: float = 5.0, read_timeout: float = 30.0,
+                 pool_connections: int = 16, pool_maxsize: int = 8,
+                 dns_cache_ttl: Optional[float] = 300.0, http2: bool = False):
+        """
+        Initialize the HTTP transport shared by every scraper.
+
+        One session keeps a pool of kept-alive connections per host, so TCP
+        and TLS setup is paid once per connection rather than once per
+        company or page. Responses are requested compressed (brotli too when
+        a brotli decoder is installed), every request has connect and read
+        timeouts, and the session's connections cache DNS results. With
+        http2 enabled and httpx
+        installed with HTTP/2 support, requests are multiplexed over one
+        HTTP/2 connection per host instead.
+
+        Args:
+            connect_timeout (float): Seconds to wait for a connection
+            read_timeout (float): Seconds to wait between bytes of a response
+            pool_connections (int): Hosts to keep connection pools for
+            pool_maxsize (int): Connections kept per host, at least the
+                number of page workers to avoid reconnecting
+            dns_cache_ttl (Optional[float]): Seconds DNS results are reused,
+                None or 0 to disable the cache
+            http2 (bool): Use HTTP/2 through httpx when available
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.metrics = get_metrics()
+        encodings = 'gzip, deflate, br' if HAS_BROTLI else 'gzip, deflate'
+
+        self.dns_cache = DNSCache(dns_cache_ttl) if dns_cache_ttl else None
+
+        self.client = None
+        if http2 and not HAS_HTTP2:
+            logger.warning("HTTP/2 needs httpx[http2]; using HTTP/1.1")
+        elif http2:
+            self.client = httpx.Client(
+                http2=True,
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                limits=httpx.Limits(max_connections=pool_connections * pool_maxsize,
+                                    max_keepalive_connections=pool_connections * pool_maxsize),
+                headers={'Accept-Encoding': encodings}
+            )
+
+        self.session = requests.Session()
+        self.session.headers['Accept-Encoding'] = encodings
+        # Retries are handled by the scrapers, which know about rate limits
+        adapter_options = {'pool_connections': pool_connections, 'pool_maxsize': pool_maxsize,
+                           'max_retries': 0, 'pool_block': False}
+        if self.dns_cache is not None:
+            adapter = CachedDNSAdapter(self.dns_cache, **adapter_options)
+        else:
+            adapter = HTTPAdapter(**adapter_options)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                json_body: Optional[Dict] = None) -> requests.Response:
+        """
+        Send a request over the shared connections.
+
+        Args:
+            method (str): HTTP method
+            url (str): URL to request
+            headers (Optional[Dict[str, str]]): Request headers
+            json_body (Optional[Dict]): JSON request body
+
+        Returns:
+            requests.Response: Response, whichever transport carried it
+
+        Raises:
+            requests.RequestException: On connection errors and timeouts
+        """
+        if self.client is None:
+            return self.session.request(method, url, headers=headers, json=json_body,
+                                        timeout=self.timeout)
+        try:
+            response = self.client.request(method, url, headers=headers, json=json_body)
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.ConnectionError(str(e)) from e
+        self.metrics.inc('transport_responses_total', http_version=response.http_version)
+        return _to_requests_response(response)
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+        if self.client is not None:
+            self.client.close()
+
+_shared_transport: Optional[HTTPTransport] = None
+_shared_transport_lock = threading.Lock()
+
+def get_transport(settings: Optional[Dict] = None) -> HTTPTransport:
+    """
+    Get the process-wide transport shared by all scrapers.
+
+    Args:
+        settings (Optional[Dict]): ``transport`` settings, used on first call only
+
+    Returns:
+        HTTPTransport: Shared transport
+    """
+    global _shared_transport
+    settings = {**DEFAULT_TRANSPORT_SETTINGS, **(settings or {})}
+    with _shared_transport_lock:
+        if _shared_transport is None:
+            _shared_transport = HTTPTransport(
+                connect_timeout=settings['connect_timeout'],
+                read_timeout=settings['read_timeout'],
+                pool_connections=settings['pool_connections'],
+                pool_maxsize=settings['pool_maxsize'],
+                dns_cache_ttl=settings['dns_cache_ttl'],
+                http2=settings['http2']
+            )
+            atexit.register(_shared_transport.close)
+        return _shared_transport
@@ -0,0 +1,115 @@
+"""
+Replay recorded Workday and Oracle search responses through the API adapters.
+
+The responses under benchmarks/fixtures are served by the benchmark stand-in
+server, so each adapter's request building, paging and parsing run over
+HTTP exactly as against the live board.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from fixtures import api_fixture_path
+from server import FixtureServer
+from scraper import JobScraper, OracleScraper, WorkdayScraper, create_scraper, load_company_configs
+from rate_limiter import RateLimiter
+
+# Recordings are trimmed to a few postings per page, so the adapters are
+# configured with matching page sizes
+PAGE_SIZES = {'Wellington Management': 5, 'JPMorgan': 4}
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    monkeypatch.chdir(ROOT)
+
+@pytest.fixture
+def companies():
+    return {company['name']: company for company in load_company_configs()}
+
+def _load_fixture(company, offset):
+    with open(api_fixture_path(company, offset), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _scraper(server, company, make_scraper=create_scraper, **pagination):
+    config = server.stand_in_api_config(company)
+    config['pagination'].update(page_size=PAGE_SIZES[company['name']], **pagination)
+    scraper = make_scraper(config, rate_limiter=RateLimiter({'requests_per_second': 1000, 'burst': 1000}))
+    scraper.http_cache = None
+    return scraper
+
+def _html_job_keys(company):
+    """Keys of a job parsed by _parse_job_listing from an HTML page."""
+    with FixtureServer([company], jobs_per_page=1) as server:
+        scraper = JobScraper(server.stand_in_config(company),
+                             rate_limiter=RateLimiter({'requests_per_second': 1000, 'burst': 1000}))
+        scraper.http_cache = None
+        jobs = scraper.scrape_jobs()
+    assert jobs
+    return set(jobs[0].keys())
+
+def test_workday_pages_by_offset(companies):
+    company = companies['Wellington Management']
+    with FixtureServer([company]) as server:
+        scraper = _scraper(server, company)
+        assert isinstance(scraper, WorkdayScraper)
+        jobs = scraper.scrape_jobs()
+        requests = server.requests
+
+    expected = [posting for offset in (0, 5, 10)
+                for posting in _load_fixture(company, offset)['jobPostings']]
+    assert [job['title'] for job in jobs] == [posting['title'] for posting in expected]
+    assert [job['location'] for job in jobs] == [posting['locationsText'] for posting in expected]
+    assert all(job['url'] == f"{scraper.config['career_url']}{posting['externalPath']}"
+               for job, posting in zip(jobs, expected))
+    assert len({job['job_key'] for job in jobs}) == len(jobs)
+    assert requests == 3
+
+def test_workday_total_only_on_first_page(companies):
+    company = companies['Wellington Management']
+    with FixtureServer([company]) as server:
+        scraper = _scraper(server, company)
+        first_total = scraper._parse_api_page(_load_fixture(company, 0))[1]
+        later_total = scraper._parse_api_page(_load_fixture(company, 5))[1]
+        first = scraper._scrape_api_page(1)
+        second = scraper._scrape_api_page(2)
+
+    assert first_total == 13
+    assert later_total is None
+    assert first['total'] == 13 and first['has_next']
+    # Without a total, a full page means there may be more
+    assert second['total'] is None and second['has_next']
+
+def test_oracle_stops_on_empty_page(companies):
+    company = companies['JPMorgan']
+    # The recorded count is stale: it promises 40 results, but the board
+    # runs out on the third page
+    with FixtureServer([company], latency=0.05) as server:
+        scraper = _scraper(server, company)
+        scraper.scraper_settings['page_workers'] = 2
+        assert isinstance(scraper, OracleScraper)
+        jobs = scraper.scrape_jobs()
+        requests = server.requests
+
+    expected = [requisition for offset in (0, 4)
+                for requisition in _load_fixture(company, offset)['items'][0]['requisitionList']]
+    assert [job['title'] for job in jobs] == [requisition['Title'] for requisition in expected]
+    assert [job['url'].rsplit('/', 1)[1] for job in jobs] == [requisition['Id'] for requisition in expected]
+    assert all('/sites/CX_1/job/' in job['url'] for job in jobs)
+    assert requests < 10
+
+@pytest.mark.parametrize('name', ['Wellington Management', 'JPMorgan'])
+def test_api_jobs_match_html_job_keys(companies, name):
+    company = companies[name]
+    with FixtureServer([company]) as server:
+        jobs = _scraper(server, company).scrape_jobs()
+
+    html_keys = _html_job_keys(companies['BlackRock'])
+    assert jobs
+    assert all(set(job.keys()) == html_keys for job in jobs)
+    assert all(job['company'] == name for job in jobs)